@@ -1,7 +1,15 @@
+from .container import Container
 from .dependencies import (
+    get_change_feed,
+    get_container,
     get_edge_service,
     get_graph_service,
     get_project_service,
     get_vertex_service,
-    get_build_service
+    get_build_service,
+    get_batch_service,
+    get_expected_version,
+    get_fields,
+    get_list_query,
+    get_response_cache
 )
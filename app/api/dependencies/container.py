@@ -0,0 +1,117 @@
+from app import settings
+from app.infrastructure.adapters import (
+    GroupCommitter,
+    ProjectFolderAdapter,
+    OutputFolderAdapter,
+    SQLiteAdapter,
+    TemplateFolderAdapter
+)
+from app.infrastructure.caches import GraphCache, PositionBuffer, ResponseCache, WriteBehindBuffer
+from app.infrastructure.events import ChangeFeed
+from app.infrastructure.storages import (
+    IProjectStorage,
+    CachedProjectStorage,
+    JournalProjectStorage,
+    PickleProjectStorage,
+    ProjectManifest,
+    PublishingProjectStorage,
+    SQLiteProjectStorage,
+    WriteBehindProjectStorage,
+    IOutputStorage,
+    OutputStorage,
+    ITemplateStorage,
+    TemplateStorage
+)
+from app.infrastructure.watchers import CacheInvalidationWatcher
+
+
+class Container:
+    # Hint: Repositories and services still get created per request, so overriding a storage also applies to them
+
+    def __init__(self):
+        # Adapters
+        self.group_committer = GroupCommitter(window=settings.GROUP_COMMIT_WINDOW_MS / 1000)
+        self.project_folder_adapter = ProjectFolderAdapter(
+            file_sync=settings.PROJECT_FILE_SYNC,
+            group_committer=self.group_committer
+        )
+        self.output_folder_adapter = OutputFolderAdapter()
+        self.template_folder_adapter = TemplateFolderAdapter()
+        self.sqlite_adapter = SQLiteAdapter(database=settings.SQLITE_DATABASE)
+
+        # Caches, Indexes and Buffers
+        self.project_manifest = ProjectManifest(self.project_folder_adapter)
+        self.graph_cache = GraphCache(
+            max_entries=settings.GRAPH_CACHE_MAX_ENTRIES,
+            max_bytes=settings.GRAPH_CACHE_MAX_BYTES
+        )
+        self.response_cache = ResponseCache(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+            compress=settings.RESPONSE_CACHE_GZIP
+        )
+        self.write_behind_buffer = WriteBehindBuffer(
+            flush_interval=settings.WRITE_BEHIND_FLUSH_INTERVAL_MS / 1000,
+            max_dirty=settings.WRITE_BEHIND_MAX_DIRTY,
+            max_unflushed=settings.WRITE_BEHIND_MAX_UNFLUSHED_MS / 1000
+        )
+        self.position_buffer = PositionBuffer(flush_interval=settings.POSITION_FLUSH_INTERVAL_MS / 1000)
+        self.change_feed = ChangeFeed(max_pending=settings.EVENTS_MAX_PENDING)
+        self.cache_invalidation_watcher = CacheInvalidationWatcher(
+            self.project_folder_adapter,
+            self.graph_cache,
+            self.project_manifest,
+            debounce_ms=settings.CACHE_INVALIDATION_DEBOUNCE_MS
+        )
+        # Hint: Responses are bound to a version already, this only drops those of changed or deleted Project files
+        self.cache_invalidation_watcher.add_project_listener(self.response_cache.invalidate)
+
+        # Storages
+        self.project_storage: IProjectStorage = self._create_project_storage()
+        self.output_storage: IOutputStorage = OutputStorage(self.output_folder_adapter)
+        self.template_storage: ITemplateStorage = TemplateStorage(self.template_folder_adapter)
+
+    def start(self):
+        if settings.CACHE_INVALIDATION_WATCHER:
+            self.cache_invalidation_watcher.start()
+        if settings.PROJECT_WRITE_MODE == 'behind':
+            self.write_behind_buffer.start()
+        if settings.POSITION_FLUSH_INTERVAL_MS > 0:
+            self.position_buffer.start()
+
+    def stop(self):
+        # Hint: Stopping flushes all buffered saves, before the watcher stops evicting the caches. The positions are
+        # flushed first, as their saves may still end up in the write-behind buffer
+        self.position_buffer.stop()
+        self.write_behind_buffer.stop()
+        self.cache_invalidation_watcher.stop()
+
+    def stats(self) -> dict:
+        return {
+            'graph_cache': self.graph_cache.stats(),
+            'response_cache': self.response_cache.stats(),
+            'write_behind_buffer': self.write_behind_buffer.stats(),
+            'position_buffer': self.position_buffer.stats(),
+            'change_feed': self.change_feed.stats(),
+            'group_committer': self.group_committer.stats()
+        }
+
+    def _create_project_storage(self) -> IProjectStorage:
+        if settings.PROJECT_STORAGE == 'journal':
+            storage = JournalProjectStorage(
+                self.project_folder_adapter,
+                self.project_manifest,
+                max_journal_entries=settings.JOURNAL_MAX_ENTRIES,
+                max_journal_bytes=settings.JOURNAL_MAX_BYTES
+            )
+        elif settings.PROJECT_STORAGE == 'sqlite':
+            storage = SQLiteProjectStorage(self.sqlite_adapter)
+        else:
+            storage = PickleProjectStorage(self.project_folder_adapter, self.project_manifest)
+
+        storage = CachedProjectStorage(storage, self.graph_cache)
+        if settings.PROJECT_WRITE_MODE == 'behind':
+            storage = WriteBehindProjectStorage(storage, self.write_behind_buffer)
+        storage = PublishingProjectStorage(storage, self.change_feed)
+
+        return storage
@@ -1,5 +1,10 @@
-from fastapi import Depends
+import threading
+from typing import Callable, Dict, Set, Type
 
+from fastapi import Depends, Header, HTTPException, Query, Request, status
+from pydantic import BaseModel
+
+from app.api.etags import parse_etag
 from app.core.repositories import (
     IVertexRepository,
     VertexRepository,
@@ -12,7 +17,9 @@ from app.core.repositories import (
     IOutputRepository,
     OutputRepository,
     ITemplateRepository,
-    TemplateRepository
+    TemplateRepository,
+    IBatchRepository,
+    BatchRepository
 )
 from app.core.services import (
     IVertexService,
@@ -24,55 +31,124 @@ from app.core.services import (
     IGraphService,
     GraphService,
     IBuildService,
-    BuildService
-)
-from app.infrastructure.adapters import (
-    ProjectFolderAdapter,
-    OutputFolderAdapter,
-    TemplateFolderAdapter
-)
-from app.infrastructure.storages import (
-    IProjectStorage,
-    PickleProjectStorage,
-    IOutputStorage,
-    OutputStorage,
-    ITemplateStorage,
-    TemplateStorage
+    BuildService,
+    IBatchService,
+    BatchService
 )
+from app.core.valueobjects import ListQuery
+from app.infrastructure.adapters import ProjectFolderAdapter, OutputFolderAdapter, TemplateFolderAdapter
+from app.infrastructure.caches import ResponseCache
+from app.infrastructure.events import ChangeFeed
+from app.infrastructure.storages import IProjectStorage, IOutputStorage, ITemplateStorage
+from .container import Container
+
+_container_lock = threading.Lock()
+
+
+# Container
+def get_container(request: Request) -> Container:
+    container = getattr(request.app.state, 'container', None)
+    if container is None:
+        # Hint: Without a lifespan (e.g. a TestClient outside of a with-block) the Container gets created on first
+        # use, but isn't started, so all buffers write synchronously
+        with _container_lock:
+            container = getattr(request.app.state, 'container', None)
+            if container is None:
+                container = Container()
+                request.app.state.container = container
+
+    return container
+
+
+# Request Headers
+def get_expected_version(if_match: str | None = Header(default=None)) -> int | None:
+    if if_match is None or if_match.strip() == '*':
+        return None
+
+    version = parse_etag(if_match)
+    if version is None:
+        # Hint: A malformed ETag can't match any version of the Graph
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=[{'msg': 'Invalid If-Match header'}])
+
+    return version
+
+
+# Query Parameters
+def get_list_query(
+        offset: int = Query(default=0, ge=0),
+        limit: int | None = Query(default=None, ge=1),
+        name_prefix: str | None = Query(default=None, min_length=1)
+) -> ListQuery:
+    return ListQuery(offset, limit, name_prefix)
+
+
+def get_fields(
+        dto_type: Type[BaseModel],
+        aliases: Dict[str, Set[str]] | None = None
+) -> Callable[[str | None], Set[str] | None]:
+    aliases = aliases or {}
+
+    def dependency(fields: str | None = Query(default=None)) -> Set[str] | None:
+        # Hint: Without fields the complete DTOs are returned
+        if fields is None:
+            return None
+
+        selected_fields = set()
+        for field in (field.strip() for field in fields.split(',')):
+            if field in aliases:
+                selected_fields.update(aliases[field])
+            elif field in dto_type.model_fields:
+                selected_fields.add(field)
+            else:
+                raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                    detail=[{'msg': f"Unknown field '{field}'", 'loc': ['query', 'fields']}])
+
+        return selected_fields
+
+    return dependency
 
 
 # Adapters
-def get_project_folder_adapter() -> ProjectFolderAdapter:
-    return ProjectFolderAdapter()
+def get_project_folder_adapter(container: Container = Depends(get_container)) -> ProjectFolderAdapter:
+    return container.project_folder_adapter
 
 
-def get_output_folder_adapter() -> OutputFolderAdapter:
-    return OutputFolderAdapter()
+def get_output_folder_adapter(container: Container = Depends(get_container)) -> OutputFolderAdapter:
+    return container.output_folder_adapter
 
 
-def get_template_folder_adapter() -> TemplateFolderAdapter:
-    return TemplateFolderAdapter()
+def get_template_folder_adapter(container: Container = Depends(get_container)) -> TemplateFolderAdapter:
+    return container.template_folder_adapter
 
 
 # Storage
-def get_project_storage(
-        project_folder_adapter: ProjectFolderAdapter = Depends(get_project_folder_adapter)) -> IProjectStorage:
-    return PickleProjectStorage(project_folder_adapter)
+def get_project_storage(container: Container = Depends(get_container)) -> IProjectStorage:
+    return container.project_storage
+
+
+def get_output_storage(container: Container = Depends(get_container)) -> IOutputStorage:
+    return container.output_storage
 
 
-def get_output_storage(
-        output_folder_adapter: OutputFolderAdapter = Depends(get_output_folder_adapter)) -> IOutputStorage:
-    return OutputStorage(output_folder_adapter)
+def get_template_storage(container: Container = Depends(get_container)) -> ITemplateStorage:
+    return container.template_storage
 
 
-def get_template_storage(
-        template_folder_adapter: TemplateFolderAdapter = Depends(get_template_folder_adapter)) -> ITemplateStorage:
-    return TemplateStorage(template_folder_adapter)
+# Caches
+def get_response_cache(container: Container = Depends(get_container)) -> ResponseCache:
+    return container.response_cache
+
+
+def get_change_feed(container: Container = Depends(get_container)) -> ChangeFeed:
+    return container.change_feed
 
 
 # Repositories
-def get_vertex_repository(project_storage: IProjectStorage = Depends(get_project_storage)) -> IVertexRepository:
-    return VertexRepository(project_storage)
+def get_vertex_repository(
+        project_storage: IProjectStorage = Depends(get_project_storage),
+        container: Container = Depends(get_container)
+) -> IVertexRepository:
+    return VertexRepository(project_storage, container.position_buffer)
 
 
 def get_edge_repository(project_storage: IProjectStorage = Depends(get_project_storage)) -> IEdgeRepository:
@@ -87,6 +163,10 @@ def get_graph_repository(project_storage: IProjectStorage = Depends(get_project_
     return GraphRepository(project_storage)
 
 
+def get_batch_repository(project_storage: IProjectStorage = Depends(get_project_storage)) -> IBatchRepository:
+    return BatchRepository(project_storage)
+
+
 def get_output_repository(output_storage: IOutputStorage = Depends(get_output_storage)) -> IOutputRepository:
     return OutputRepository(output_storage)
 
@@ -122,3 +202,7 @@ def get_build_service(
         output_repository: IOutputRepository = Depends(get_output_repository)
 ) -> IBuildService:
     return BuildService(graph_repository, project_repository, template_repository, output_repository)
+
+
+def get_batch_service(batch_repository: IBatchRepository = Depends(get_batch_repository)) -> IBatchService:
+    return BatchService(batch_repository)
@@ -1,9 +1,20 @@
 from .common.propertydto import PropertyDto
+from .request.batchoperationrequestdto import BatchAction, BatchElementType, BatchOperationRequestDto
+from .request.batchrequestdto import BatchRequestDto
 from .request.buildrequestdto import BuildRequestDto
 from .request.edgerequestdto import EdgeRequestDto
+from .request.graphedgerequestdto import GraphEdgeRequestDto
+from .request.graphrequestdto import GraphRequestDto
+from .request.graphvertexrequestdto import GraphVertexRequestDto
 from .request.projectrequestdto import ProjectRequestDto
+from .request.vertexpositionrequestdto import VertexPositionRequestDto
 from .request.vertexrequestdto import VertexRequestDto
+from .response.differenceresponsedto import DifferenceResponseDto
 from .response.edgeresponsedto import EdgeResponseDto
+from .response.graphdiffresponsedto import GraphDiffResponseDto
 from .response.graphresponsedto import GraphResponseDto
 from .response.projectresponsedto import ProjectResponseDto
 from .response.vertexresponsedto import VertexResponseDto
+# Hint: Imported last, as the results embed the Vertex- and Edge-DTOs
+from .response.batchresponsedto import BatchResponseDto
+from .response.batchresultresponsedto import BatchResultResponseDto
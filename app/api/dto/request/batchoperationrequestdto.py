@@ -0,0 +1,42 @@
+from enum import Enum
+
+from pydantic import BaseModel, UUID4, model_validator
+
+from app.api.dto.request.edgerequestdto import EdgeRequestDto
+from app.api.dto.request.vertexrequestdto import VertexRequestDto
+
+
+class BatchAction(str, Enum):
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+
+class BatchElementType(str, Enum):
+    VERTEX = 'vertex'
+    EDGE = 'edge'
+
+
+class BatchOperationRequestDto(BaseModel):
+    action: BatchAction
+    element_type: BatchElementType
+    # Hint: Optional for create, so elements created in the same batch can already be referenced by their Id
+    id: UUID4 | None = None
+    vertex: VertexRequestDto | None = None
+    edge: EdgeRequestDto | None = None
+
+    @model_validator(mode='after')
+    def validate_operation(self) -> 'BatchOperationRequestDto':
+        if self.action != BatchAction.CREATE and self.id is None:
+            raise ValueError(f"Operation '{self.action.value}' requires the Id of the element")
+
+        if self.action == BatchAction.DELETE:
+            if self.vertex is not None or self.edge is not None:
+                raise ValueError("Operation 'delete' doesn't take a vertex or edge")
+        elif self.element_type == BatchElementType.VERTEX:
+            if self.vertex is None or self.edge is not None:
+                raise ValueError(f"Operation '{self.action.value}' of a vertex requires exactly the vertex")
+        elif self.edge is None or self.vertex is not None:
+            raise ValueError(f"Operation '{self.action.value}' of an edge requires exactly the edge")
+
+        return self
@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.api.dto.request.batchoperationrequestdto import BatchOperationRequestDto
+
+
+class BatchRequestDto(BaseModel):
+    operations: List[BatchOperationRequestDto] = Field(..., min_length=1)
@@ -0,0 +1,7 @@
+from pydantic import UUID4
+
+from app.api.dto.request.edgerequestdto import EdgeRequestDto
+
+
+class GraphEdgeRequestDto(EdgeRequestDto):
+    id: UUID4
@@ -0,0 +1,12 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from app.api.dto.request.graphedgerequestdto import GraphEdgeRequestDto
+from app.api.dto.request.graphvertexrequestdto import GraphVertexRequestDto
+
+
+class GraphRequestDto(BaseModel):
+    # Hint: Same layout as GraphResponseDto, so an exported Graph can be imported again
+    vertices: List[GraphVertexRequestDto]
+    edges: List[GraphEdgeRequestDto]
@@ -0,0 +1,7 @@
+from pydantic import UUID4
+
+from app.api.dto.request.vertexrequestdto import VertexRequestDto
+
+
+class GraphVertexRequestDto(VertexRequestDto):
+    id: UUID4
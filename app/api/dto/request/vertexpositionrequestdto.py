@@ -0,0 +1,7 @@
+from pydantic import BaseModel, UUID4
+
+
+class VertexPositionRequestDto(BaseModel):
+    id: UUID4
+    position_x: int
+    position_y: int
@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from app.api.dto.response.batchresultresponsedto import BatchResultResponseDto
+
+
+class BatchResponseDto(BaseModel):
+    results: List[BatchResultResponseDto]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, UUID4
+
+from app.api.dto.request.batchoperationrequestdto import BatchAction, BatchElementType
+from app.api.dto.response.edgeresponsedto import EdgeResponseDto
+from app.api.dto.response.vertexresponsedto import VertexResponseDto
+
+
+class BatchResultResponseDto(BaseModel):
+    action: BatchAction
+    element_type: BatchElementType
+    id: UUID4
+    # Hint: Both are None for deletes
+    vertex: VertexResponseDto | None = None
+    edge: EdgeResponseDto | None = None
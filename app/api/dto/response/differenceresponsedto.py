@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class DifferenceResponseDto(BaseModel):
+    element_type: str
+    kind: str
+    element_id: str
+    name: str
+    old_value: bool | str | None = None
+    new_value: bool | str | None = None
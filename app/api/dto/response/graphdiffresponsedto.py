@@ -0,0 +1,11 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from app.api.dto.response.differenceresponsedto import DifferenceResponseDto
+
+
+class GraphDiffResponseDto(BaseModel):
+    base_version: int
+    version: int
+    differences: List[DifferenceResponseDto]
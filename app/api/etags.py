@@ -0,0 +1,38 @@
+from fastapi import Response, status
+
+
+def to_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def parse_etag(etag: str) -> int | None:
+    etag = etag.strip()
+    if etag.startswith('W/'):
+        etag = etag[2:]
+    etag = etag.strip('"')
+    if not etag.isdigit():
+        return None
+
+    return int(etag)
+
+
+def version_conflict_status_code(expected_version: int | None) -> int:
+    # Hint: Without If-Match the conflict stems from concurrent writers which kept winning the retries
+    if expected_version is None:
+        return status.HTTP_409_CONFLICT
+
+    return status.HTTP_412_PRECONDITION_FAILED
+
+
+def is_not_modified(if_none_match: str | None, version: int) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+
+    # Hint: If-None-Match may list several ETags, they are compared weakly
+    return any(parse_etag(etag) == version for etag in if_none_match.split(','))
+
+
+def not_modified_response(version: int) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': to_etag(version)})
@@ -1,5 +1,8 @@
+from .batchroute import router as batch_router
 from .buildroute import router as build_router
+from .diagnosticsroute import router as diagnostics_router
 from .edgeroute import router as edge_router
+from .eventroute import router as event_router
 from .graphroute import router as graph_router
 from .projectroute import router as project_router
 from .vertexroute import router as vertex_router
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+
+from app.api.dependencies import get_batch_service, get_expected_version
+from app.api.dto import BatchRequestDto, BatchResponseDto
+from app.api.etags import to_etag, version_conflict_status_code
+from app.core.exceptions import (
+    BatchException,
+    EdgeException,
+    EdgeNotFoundException,
+    ProjectNotFoundException,
+    VersionConflictException,
+    VertexException,
+    VertexNotFoundException
+)
+from app.core.services import IBatchService
+from app.mappers import BatchMapper
+
+router = APIRouter(
+    prefix="/projects/{project_id}/batch",
+    tags=["Batch"]
+)
+
+
+@router.post('/')
+def apply_batch(
+        batch_request_dto: BatchRequestDto,
+        project_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
+        service: IBatchService = Depends(get_batch_service)
+) -> BatchResponseDto:
+    try:
+        results = service.apply_batch(
+            project_id,
+            [BatchMapper.to_entity(operation) for operation in batch_request_dto.operations],
+            expected_version
+        )
+
+        response.headers['ETag'] = to_etag(results.version)
+        return BatchResponseDto(results=[BatchMapper.to_dto(result) for result in results.value])
+    except ProjectNotFoundException as ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
+    except BatchException as ex:
+        # Hint: The loc points to the failed operation, the error itself is the one of the single endpoints
+        loc = ['body', 'operations', ex.index]
+        if isinstance(ex.cause, (VertexNotFoundException, EdgeNotFoundException)):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message, 'loc': loc}])
+        if isinstance(ex.cause, VertexException):
+            raise HTTPException(status_code=ex.cause.status_code,
+                                detail=[{'msg': ex.message, 'loc': loc + ['vertex', ex.cause.loc]}])
+        if isinstance(ex.cause, EdgeException):
+            raise HTTPException(status_code=ex.cause.status_code,
+                                detail=[{'msg': ex.message, 'loc': loc + ['edge', *ex.cause.loc[1:]]}])
+        raise
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import Container, get_container
+
+router = APIRouter(
+    prefix="/diagnostics",
+    tags=["Diagnostics"]
+)
+
+
+@router.get('/')
+def get_diagnostics(container: Container = Depends(get_container)) -> dict:
+    # Hint: Counters of the caches and buffers of this worker process only
+    return container.stats()
@@ -1,11 +1,26 @@
-from typing import List
+from typing import List, Set
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import JSONResponse
 
-from app.api.dependencies import get_edge_service
+from app.api.dependencies import (
+    get_edge_service,
+    get_expected_version,
+    get_fields,
+    get_graph_service,
+    get_list_query
+)
 from app.api.dto import EdgeRequestDto, EdgeResponseDto
-from app.core.exceptions import ProjectNotFoundException, VertexNotFoundException, EdgeNotFoundException, EdgeException
-from app.core.services import IEdgeService
+from app.api.etags import is_not_modified, not_modified_response, to_etag, version_conflict_status_code
+from app.core.exceptions import (
+    ProjectNotFoundException,
+    VertexNotFoundException,
+    EdgeNotFoundException,
+    EdgeException,
+    VersionConflictException
+)
+from app.core.services import IEdgeService, IGraphService
+from app.core.valueobjects import ListQuery
 from app.mappers import EdgeMapper
 
 router = APIRouter(
@@ -17,12 +32,29 @@ router = APIRouter(
 @router.get('/')
 def get_edges(
         project_id: str,
-        edge_service: IEdgeService = Depends(get_edge_service)
+        response: Response,
+        query: ListQuery = Depends(get_list_query),
+        fields: Set[str] | None = Depends(get_fields(EdgeResponseDto)),
+        if_none_match: str | None = Header(default=None),
+        edge_service: IEdgeService = Depends(get_edge_service),
+        graph_service: IGraphService = Depends(get_graph_service)
 ) -> List[EdgeResponseDto]:
     try:
-        edges = edge_service.get_edges(project_id)
+        # Hint: The ETag is the version of the whole Graph, which can be read without loading it
+        if if_none_match is not None:
+            version = graph_service.get_graph_version(project_id)
+            if is_not_modified(if_none_match, version):
+                return not_modified_response(version)
+
+        edges = edge_service.get_edges(project_id, query)
+
+        headers = {'ETag': to_etag(edges.version), 'X-Total-Count': str(edges.value.total)}
+        if fields is not None:
+            return JSONResponse([EdgeMapper.to_partial_dto(edge, fields) for edge in edges.value.items],
+                                headers=headers)
 
-        return [EdgeMapper.to_dto(edge) for edge in edges]
+        response.headers.update(headers)
+        return [EdgeMapper.to_dto(edge) for edge in edges.value.items]
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
 
@@ -31,12 +63,21 @@ def get_edges(
 def get_edge(
         project_id: str,
         edge_id: str,
-        edge_service: IEdgeService = Depends(get_edge_service)
+        response: Response,
+        if_none_match: str | None = Header(default=None),
+        edge_service: IEdgeService = Depends(get_edge_service),
+        graph_service: IGraphService = Depends(get_graph_service)
 ) -> EdgeResponseDto:
     try:
+        if if_none_match is not None:
+            version = graph_service.get_graph_version(project_id)
+            if is_not_modified(if_none_match, version):
+                return not_modified_response(version)
+
         edge = edge_service.get_edge(project_id, edge_id)
 
-        return EdgeMapper.to_dto(edge)
+        response.headers['ETag'] = to_etag(edge.version)
+        return EdgeMapper.to_dto(edge.value)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
     except EdgeNotFoundException as ex:
@@ -47,6 +88,8 @@ def get_edge(
 def create_edge(
         edge_request_dto: EdgeRequestDto,
         project_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
         edge_service: IEdgeService = Depends(get_edge_service)
 ) -> EdgeResponseDto:
     try:
@@ -54,14 +97,19 @@ def create_edge(
             project_id,
             EdgeMapper.to_entity(edge_request_dto),
             str(edge_request_dto.source_vertex_id),
-            str(edge_request_dto.target_vertex_id)
+            str(edge_request_dto.target_vertex_id),
+            expected_version
         )
 
-        return EdgeMapper.to_dto(edge)
+        response.headers['ETag'] = to_etag(edge.version)
+        return EdgeMapper.to_dto(edge.value)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
     except VertexNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
     except EdgeException as ex:
         raise HTTPException(status_code=ex.status_code, detail=[{'msg': ex.message, 'loc': ex.loc}])
 
@@ -71,6 +119,8 @@ def update_edge(
         edge_request_dto: EdgeRequestDto,
         project_id: str,
         edge_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
         service: IEdgeService = Depends(get_edge_service)
 ) -> EdgeResponseDto:
     try:
@@ -79,16 +129,21 @@ def update_edge(
             edge_id,
             str(edge_request_dto.source_vertex_id),
             str(edge_request_dto.target_vertex_id),
-            EdgeMapper.to_entity(edge_request_dto)
+            EdgeMapper.to_entity(edge_request_dto),
+            expected_version
         )
 
-        return EdgeMapper.to_dto(edge)
+        response.headers['ETag'] = to_etag(edge.version)
+        return EdgeMapper.to_dto(edge.value)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
     except VertexNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
     except EdgeNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
     except EdgeException as ex:
         raise HTTPException(status_code=ex.status_code, detail=[{'msg': ex.message, 'loc': ex.loc}])
 
@@ -97,11 +152,18 @@ def update_edge(
 def delete_edge(
         project_id: str,
         edge_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
         edge_service: IEdgeService = Depends(get_edge_service)
 ):
     try:
-        edge_service.delete_edge(project_id, edge_id)
+        result = edge_service.delete_edge(project_id, edge_id, expected_version)
+
+        response.headers['ETag'] = to_etag(result.version)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
     except EdgeNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
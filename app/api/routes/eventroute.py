@@ -0,0 +1,111 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app import settings
+from app.api.dependencies import get_change_feed, get_graph_service
+from app.api.etags import parse_etag
+from app.core.exceptions import ProjectNotFoundException
+from app.core.services import IGraphService
+from app.core.valueobjects import ChangeEvent
+from app.infrastructure.events import ChangeFeed, Subscription
+from app.mappers import ChangeEventMapper
+
+router = APIRouter(
+    prefix="/projects/{project_id}/events",
+    tags=["Event"]
+)
+
+
+@router.get('/', response_class=StreamingResponse, responses={
+    status.HTTP_200_OK: {'content': {'text/event-stream': {}}}
+})
+async def get_events(
+        project_id: str,
+        last_event_id: str | None = Header(default=None),
+        service: IGraphService = Depends(get_graph_service),
+        change_feed: ChangeFeed = Depends(get_change_feed)
+) -> StreamingResponse:
+    # Hint: Subscribed before the version is read, so no save in between can get lost
+    subscription = change_feed.subscribe(project_id)
+    try:
+        version = await run_in_threadpool(service.get_graph_version, project_id)
+    except ProjectNotFoundException as ex:
+        change_feed.unsubscribe(subscription)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except BaseException:
+        change_feed.unsubscribe(subscription)
+        raise
+
+    # A reconnecting client which missed saves has to fetch the Graph again, as past events aren't kept
+    missed_saves = last_event_id is not None and parse_etag(last_event_id) != version
+    initial_event = ChangeEvent(ChangeEvent.RESET, project_id, version) if missed_saves else None
+
+    return StreamingResponse(
+        _stream_events(service, change_feed, subscription, version, initial_event),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+async def _stream_events(
+        service: IGraphService,
+        change_feed: ChangeFeed,
+        subscription: Subscription,
+        version: int,
+        initial_event: ChangeEvent | None
+) -> AsyncIterator[str]:
+    keepalive_interval = settings.EVENTS_KEEPALIVE_INTERVAL_MS / 1000
+    poll_interval = settings.EVENTS_VERSION_POLL_INTERVAL_MS / 1000
+    timeout = poll_interval if 0 < poll_interval < keepalive_interval else keepalive_interval
+    idle = 0.0
+    unpublished_version = None
+
+    try:
+        if initial_event is not None:
+            yield ChangeEventMapper.to_sse(initial_event)
+
+        # Hint: The StreamingResponse cancels the generator once the client disconnects
+        while True:
+            event = await subscription.get(timeout=timeout)
+            if event is None and poll_interval > 0:
+                event, unpublished_version = await _poll_version(service, subscription, version, unpublished_version)
+            if event is None:
+                idle += timeout
+                if idle >= keepalive_interval:
+                    # Hint: A comment keeps proxies from closing the idle connection
+                    yield ': keepalive\n\n'
+                    idle = 0.0
+                continue
+
+            if event.version is not None:
+                version = max(version, event.version)
+            idle = 0.0
+            yield ChangeEventMapper.to_sse(event)
+            if event.kind == ChangeEvent.DELETE:
+                return
+    finally:
+        change_feed.unsubscribe(subscription)
+
+
+async def _poll_version(
+        service: IGraphService,
+        subscription: Subscription,
+        version: int,
+        unpublished_version: int | None
+) -> tuple[ChangeEvent | None, int | None]:
+    try:
+        current_version = await run_in_threadpool(service.get_graph_version, subscription.project_id)
+    except ProjectNotFoundException:
+        return ChangeEvent(ChangeEvent.DELETE, subscription.project_id), None
+
+    if current_version <= version:
+        return None, None
+    # A save of this process is published right after it got written, so a newer version is only reset once it
+    # still isn't covered by the published events on the next poll
+    if unpublished_version is not None and unpublished_version > version:
+        return ChangeEvent(ChangeEvent.RESET, subscription.project_id, current_version), None
+
+    return None, current_version
@@ -1,10 +1,19 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, Header, HTTPException, Response, status, Depends
+from fastapi.responses import StreamingResponse
 
-from app.api.dependencies import get_graph_service
-from app.api.dto import GraphResponseDto
-from app.core.exceptions import ProjectNotFoundException
+from app.api.dependencies import get_expected_version, get_graph_service, get_response_cache
+from app.api.dto import GraphDiffResponseDto, GraphRequestDto, GraphResponseDto
+from app.api.etags import is_not_modified, not_modified_response, to_etag, version_conflict_status_code
+from app.core.exceptions import (
+    GraphHistoryUnavailableException,
+    GraphImportException,
+    GraphVersionNotFoundException,
+    ProjectNotFoundException,
+    VersionConflictException
+)
 from app.core.services import IGraphService
-from app.mappers import GraphMapper
+from app.infrastructure.caches import CachedResponse, ResponseCache
+from app.mappers import GraphDiffMapper, GraphMapper
 
 router = APIRouter(
     prefix="/projects/{project_id}/graph",
@@ -12,11 +21,122 @@ router = APIRouter(
 )
 
 
-@router.get('/')
-def get_graph(project_id: str, service: IGraphService = Depends(get_graph_service)) -> GraphResponseDto:
+@router.get('/', response_model=GraphResponseDto)
+def get_graph(
+        project_id: str,
+        if_none_match: str | None = Header(default=None),
+        accept_encoding: str | None = Header(default=None),
+        service: IGraphService = Depends(get_graph_service),
+        response_cache: ResponseCache = Depends(get_response_cache)
+) -> Response:
+    try:
+        # Hint: Only the version is read up front, an unchanged Graph is neither loaded nor mapped
+        version = service.get_graph_version(project_id)
+        if is_not_modified(if_none_match, version):
+            return not_modified_response(version)
+
+        cached_response = response_cache.get(project_id, version)
+        if cached_response is None:
+            graph = service.get_graph(project_id)
+            body = GraphMapper.to_dto(graph).model_dump_json().encode()
+            cached_response = response_cache.put(project_id, graph.version, body)
+
+        return _to_response(cached_response, accept_encoding)
+    except ProjectNotFoundException as ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+
+
+@router.get('/export', response_class=StreamingResponse, responses={
+    status.HTTP_200_OK: {'content': {'application/x-ndjson': {}}}
+})
+def export_graph(
+        project_id: str,
+        if_none_match: str | None = Header(default=None),
+        service: IGraphService = Depends(get_graph_service)
+) -> Response:
+    # Hint: Streams the Graph as newline-delimited JSON, a line per Vertex and then per Edge. Unlike GET /graph the
+    # response is never built as a whole, which keeps the memory flat for large Graphs
     try:
+        version = service.get_graph_version(project_id)
+        if is_not_modified(if_none_match, version):
+            return not_modified_response(version)
+
+        # Hint: Loaded before the response starts, so an unknown Project still results in a 404
         graph = service.get_graph(project_id)
 
-        return GraphMapper.to_dto(graph)
+        return StreamingResponse(GraphMapper.to_ndjson(graph), media_type='application/x-ndjson',
+                                 headers={'ETag': to_etag(graph.version)})
+    except ProjectNotFoundException as ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+
+
+@router.put('/')
+def import_graph(
+        graph_request_dto: GraphRequestDto,
+        project_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
+        service: IGraphService = Depends(get_graph_service)
+) -> GraphResponseDto:
+    try:
+        vertices, edges = GraphMapper.to_elements(graph_request_dto)
+        graph = service.import_graph(project_id, vertices, edges, expected_version)
+
+        response.headers['ETag'] = to_etag(graph.version)
+        return GraphMapper.to_dto(graph.value)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
+    except GraphImportException as ex:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=[{'msg': message, 'loc': loc} for message, loc in ex.errors])
+
+
+@router.get('/diff')
+def get_graph_diff(
+        project_id: str,
+        base_project_id: str | None = None,
+        base_version: int | None = None,
+        version: int | None = None,
+        service: IGraphService = Depends(get_graph_service)
+) -> GraphDiffResponseDto:
+    # Hint: The base is another Project and/or an earlier version, by default the current Graph of this Project
+    if base_project_id is None and base_version is None and version is None:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=[{
+            'msg': 'Either base_project_id, base_version or version is required',
+            'loc': ['query']
+        }])
+
+    try:
+        graph_diff = service.diff_graphs(project_id, base_project_id, version, base_version)
+
+        return GraphDiffMapper.to_dto(graph_diff)
+    except ProjectNotFoundException as ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except GraphVersionNotFoundException as ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except GraphHistoryUnavailableException as ex:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=[{'msg': ex.message}])
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    if accept_encoding is None:
+        return False
+
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.strip().partition(';')
+        if name.strip().lower() in ('gzip', '*'):
+            return params.replace(' ', '').lower() not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+
+    return False
+
+
+def _to_response(cached_response: CachedResponse, accept_encoding: str | None) -> Response:
+    headers = {'ETag': to_etag(cached_response.version), 'Vary': 'Accept-Encoding'}
+    if cached_response.gzip_body is not None and _accepts_gzip(accept_encoding):
+        headers['Content-Encoding'] = 'gzip'
+        return Response(content=cached_response.gzip_body, media_type='application/json', headers=headers)
+
+    return Response(content=cached_response.body, media_type='application/json', headers=headers)
@@ -1,11 +1,13 @@
-from typing import List
+from typing import List, Set
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import JSONResponse
 
-from app.api.dependencies import get_project_service
+from app.api.dependencies import get_fields, get_list_query, get_project_service
 from app.api.dto import ProjectRequestDto, ProjectResponseDto
 from app.core.exceptions import ProjectException, ProjectNotFoundException, DeleteOutputException
 from app.core.services import IProjectService
+from app.core.valueobjects import ListQuery
 from app.mappers import ProjectMapper
 
 router = APIRouter(
@@ -15,10 +17,21 @@ router = APIRouter(
 
 
 @router.get('/')
-def get_projects(service: IProjectService = Depends(get_project_service)) -> List[ProjectResponseDto]:
-    projects = service.get_projects()
+def get_projects(
+        response: Response,
+        query: ListQuery = Depends(get_list_query),
+        fields: Set[str] | None = Depends(get_fields(ProjectResponseDto)),
+        service: IProjectService = Depends(get_project_service)
+) -> List[ProjectResponseDto]:
+    projects = service.get_projects(query)
+
+    headers = {'X-Total-Count': str(projects.total)}
+    if fields is not None:
+        return JSONResponse([ProjectMapper.to_partial_dto(project, fields) for project in projects.items],
+                            headers=headers)
 
-    return [ProjectMapper.to_dto(project) for project in projects]
+    response.headers.update(headers)
+    return [ProjectMapper.to_dto(project) for project in projects.items]
 
 
 @router.get('/{project_id}')
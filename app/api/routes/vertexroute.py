@@ -1,11 +1,25 @@
-from typing import List
+from typing import List, Set
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import JSONResponse
 
-from app.api.dependencies import get_vertex_service
-from app.api.dto import VertexResponseDto, VertexRequestDto
-from app.core.exceptions import ProjectNotFoundException, VertexNotFoundException, VertexException
-from app.core.services import IVertexService
+from app.api.dependencies import (
+    get_vertex_service,
+    get_expected_version,
+    get_fields,
+    get_graph_service,
+    get_list_query
+)
+from app.api.dto import VertexPositionRequestDto, VertexResponseDto, VertexRequestDto
+from app.api.etags import is_not_modified, not_modified_response, to_etag, version_conflict_status_code
+from app.core.exceptions import (
+    ProjectNotFoundException,
+    VertexNotFoundException,
+    VertexException,
+    VersionConflictException
+)
+from app.core.services import IVertexService, IGraphService
+from app.core.valueobjects import ListQuery
 from app.mappers import VertexMapper
 
 router = APIRouter(
@@ -17,12 +31,29 @@ router = APIRouter(
 @router.get('/')
 def get_vertices(
         project_id: str,
-        service: IVertexService = Depends(get_vertex_service)
+        response: Response,
+        query: ListQuery = Depends(get_list_query),
+        fields: Set[str] | None = Depends(get_fields(VertexResponseDto, {'position': {'position_x', 'position_y'}})),
+        if_none_match: str | None = Header(default=None),
+        service: IVertexService = Depends(get_vertex_service),
+        graph_service: IGraphService = Depends(get_graph_service)
 ) -> List[VertexResponseDto]:
     try:
-        vertices = service.get_vertices(project_id)
+        # Hint: The ETag is the version of the whole Graph, which can be read without loading it
+        if if_none_match is not None:
+            version = graph_service.get_graph_version(project_id)
+            if is_not_modified(if_none_match, version):
+                return not_modified_response(version)
+
+        vertices = service.get_vertices(project_id, query)
 
-        return [VertexMapper.to_dto(vertex) for vertex in vertices]
+        headers = {'ETag': to_etag(vertices.version), 'X-Total-Count': str(vertices.value.total)}
+        if fields is not None:
+            return JSONResponse([VertexMapper.to_partial_dto(vertex, fields) for vertex in vertices.value.items],
+                                headers=headers)
+
+        response.headers.update(headers)
+        return [VertexMapper.to_dto(vertex) for vertex in vertices.value.items]
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
 
@@ -31,12 +62,21 @@ def get_vertices(
 def get_vertex(
         project_id: str,
         vertex_id: str,
-        service: IVertexService = Depends(get_vertex_service)
+        response: Response,
+        if_none_match: str | None = Header(default=None),
+        service: IVertexService = Depends(get_vertex_service),
+        graph_service: IGraphService = Depends(get_graph_service)
 ) -> VertexResponseDto:
     try:
+        if if_none_match is not None:
+            version = graph_service.get_graph_version(project_id)
+            if is_not_modified(if_none_match, version):
+                return not_modified_response(version)
+
         vertex = service.get_vertex(project_id, vertex_id)
 
-        output = VertexMapper.to_dto(vertex)
+        output = VertexMapper.to_dto(vertex.value)
+        response.headers['ETag'] = to_etag(vertex.version)
         return output
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
@@ -48,14 +88,20 @@ def get_vertex(
 def create_vertex(
         vertex_request_dto: VertexRequestDto,
         project_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
         service: IVertexService = Depends(get_vertex_service)
 ) -> VertexResponseDto:
     try:
-        vertex = service.create_vertex(project_id, VertexMapper.to_entity(vertex_request_dto))
+        vertex = service.create_vertex(project_id, VertexMapper.to_entity(vertex_request_dto), expected_version)
 
-        return VertexMapper.to_dto(vertex)
+        response.headers['ETag'] = to_etag(vertex.version)
+        return VertexMapper.to_dto(vertex.value)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
     except VertexException as ex:
         raise HTTPException(status_code=ex.status_code, detail=[{'msg': ex.message, 'loc': ['body', ex.loc]}])
 
@@ -65,29 +111,63 @@ def update_vertex(
         vertex_request_dto: VertexRequestDto,
         project_id: str,
         vertex_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
         service: IVertexService = Depends(get_vertex_service)
 ) -> VertexResponseDto:
     try:
-        vertex = service.update_vertex(project_id, vertex_id, VertexMapper.to_entity(vertex_request_dto))
-
-        return VertexMapper.to_dto(vertex)
+        vertex = service.update_vertex(
+            project_id,
+            vertex_id,
+            VertexMapper.to_entity(vertex_request_dto),
+            expected_version
+        )
+
+        response.headers['ETag'] = to_etag(vertex.version)
+        return VertexMapper.to_dto(vertex.value)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
     except VertexNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
     except VertexException as ex:
         raise HTTPException(status_code=ex.status_code, detail=[{'msg': ex.message, 'loc': ['body', ex.loc]}])
 
 
+@router.patch('/positions', status_code=status.HTTP_202_ACCEPTED)
+def move_vertices(
+        positions: List[VertexPositionRequestDto],
+        project_id: str,
+        service: IVertexService = Depends(get_vertex_service)
+):
+    # Hint: Moves get coalesced and written shortly after, so there is no version (ETag) to answer with yet
+    try:
+        service.move_vertices(
+            project_id,
+            {str(position.id): (position.position_x, position.position_y) for position in positions}
+        )
+    except (ProjectNotFoundException, VertexNotFoundException) as ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+
+
 @router.delete('/{vertex_id}')
 def delete_vertex(
         project_id: str,
         vertex_id: str,
+        response: Response,
+        expected_version: int | None = Depends(get_expected_version),
         service: IVertexService = Depends(get_vertex_service)
 ):
     try:
-        service.delete_vertex(project_id, vertex_id)
+        result = service.delete_vertex(project_id, vertex_id, expected_version)
+
+        response.headers['ETag'] = to_etag(result.version)
     except ProjectNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
     except VertexNotFoundException as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{'msg': ex.message}])
+    except VersionConflictException as ex:
+        raise HTTPException(status_code=version_conflict_status_code(expected_version), detail=[{'msg': ex.message}],
+                            headers={'ETag': to_etag(ex.current_version)})
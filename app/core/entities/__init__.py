@@ -2,5 +2,5 @@ from .build import Build
 from .edge import Edge
 from .graph import Graph
 from .project import Project
-from .property import Property
+from .property import Datatype, Property
 from .vertex import Vertex
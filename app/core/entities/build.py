@@ -1,4 +1,6 @@
 class Build:
+    __slots__ = ('port', 'volume')
+
     def __init__(self, port: int, volume: str | None):
         self.port = port
         self.volume = volume
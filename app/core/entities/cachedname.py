@@ -0,0 +1,19 @@
+class cached_name:
+    # Hint: Like functools.cached_property for classes with __slots__, the value is kept in the slot '_<name>' until it
+    # gets reset to None
+
+    def __init__(self, function):
+        self.function = function
+        self.slot = '_' + function.__name__
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.slot)
+        if value is None:
+            value = self.function(instance)
+            setattr(instance, self.slot, value)
+
+        return value
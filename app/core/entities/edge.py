@@ -1,10 +1,27 @@
 from typing import List, TYPE_CHECKING
 
+from app.core.entities.cachedname import cached_name
+
 if TYPE_CHECKING:
     from app.core.entities import Property, Vertex
 
 
 class Edge:
+    # Derived Names, computed on first use and reset whenever the Name or one of the connected Vertices changes
+    CACHED_NAMES = (
+        '_name_upper',
+        '_name_lower',
+        '_out_type_name',
+        '_in_type_name',
+        '_out_field_name',
+        '_in_field_name',
+        '_logic_input_name',
+        '_order_by_input_name',
+        '_manipulate_input_name',
+        '_property_name'
+    )
+    __slots__ = ('id', '_name', 'properties', 'multi_edge', '_source_vertex', '_target_vertex', *CACHED_NAMES)
+
     def __init__(
             self,
             _id: str,
@@ -19,46 +36,93 @@ class Edge:
         self.source_vertex: Vertex | None = None
         self.target_vertex: Vertex | None = None
 
+    def __getstate__(self) -> dict:
+        # Hint: The cached names are left out, they get derived again from the name and the connected Vertices
+        return {
+            'id': self.id,
+            'name': self._name,
+            'properties': self.properties,
+            'multi_edge': self.multi_edge,
+            'source_vertex': self._source_vertex,
+            'target_vertex': self._target_vertex
+        }
+
+    def __setstate__(self, state: dict):
+        self.reset_cached_names()
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        self.reset_cached_names()
+
+    @property
+    def source_vertex(self) -> 'Vertex | None':
+        return self._source_vertex
+
+    @source_vertex.setter
+    def source_vertex(self, vertex: 'Vertex | None'):
+        self._source_vertex = vertex
+        self.reset_cached_names()
+
     @property
+    def target_vertex(self) -> 'Vertex | None':
+        return self._target_vertex
+
+    @target_vertex.setter
+    def target_vertex(self, vertex: 'Vertex | None'):
+        self._target_vertex = vertex
+        self.reset_cached_names()
+
+    @cached_name
     def name_upper(self) -> str:
         return self.name[0].upper() + self.name[1:]
 
-    @property
+    @cached_name
     def name_lower(self) -> str:
         return self.name[0].lower() + self.name[1:]
 
-    @property
+    @cached_name
     def out_type_name(self) -> str:
         return self.source_vertex.name_upper + 'To' + self.target_vertex.name_upper + self.name_upper + 'Edge'
 
-    @property
+    @cached_name
     def in_type_name(self) -> str:
         return self.target_vertex.name_upper + 'To' + self.source_vertex.name_upper + self.name_upper + 'Edge'
 
-    @property
+    @cached_name
     def out_field_name(self) -> str:
         return self.name_lower + 'Out'
 
-    @property
+    @cached_name
     def in_field_name(self) -> str:
         return self.name_lower + 'In'
 
-    @property
+    @cached_name
     def logic_input_name(self) -> str:
         return self.source_vertex.name_upper + 'To' + self.target_vertex.name_upper + self.name_upper + 'EdgeLogicInput'
 
-    @property
+    @cached_name
     def order_by_input_name(self) -> str:
         return self.source_vertex.name_upper + 'To' + self.target_vertex.name_upper + self.name_upper + 'EdgeOrderByInput'
 
-    @property
+    @cached_name
     def manipulate_input_name(self) -> str:
         return self.source_vertex.name_upper + 'To' + self.target_vertex.name_upper + 'Via' + self.name_upper + 'EdgeInput'
 
-    @property
+    @cached_name
     def property_name(self) -> str:
         return self.source_vertex.name_upper + 'To' + self.target_vertex.name_upper + self.name_upper + 'EdgeProperty'
 
+    def reset_cached_names(self):
+        for slot in self.CACHED_NAMES:
+            setattr(self, slot, None)
+
     def has_properties(self) -> bool:
         return len(self.properties) > 0
 
@@ -1,30 +1,71 @@
-from typing import List
+from typing import Dict, List
 
 from app.core.entities.edge import Edge
+from app.core.entities.indexedlist import IndexedList
 from app.core.entities.vertex import Vertex
 from app.core.exceptions import VertexNotFoundException, EdgeNotFoundException
 from app.core.validators import VertexValidator, EdgeValidator
+from app.core.valueobjects import GraphChange
 
 
 class Graph:
     def __init__(self):
-        self.vertices: List[Vertex] = []
-        self.edges: List[Edge] = []
+        # Hint: Insertion-ordered like lists (which defines the order for rendering), but removals are O(1)
+        self.vertices: IndexedList[Vertex] = IndexedList()
+        self.edges: IndexedList[Edge] = IndexedList()
+
+        # Lookup by Id, kept in step with the collections above
+        self._vertex_index: Dict[str, Vertex] = {}
+        self._edge_index: Dict[str, Edge] = {}
+        # Lookup by normalized Name (name_upper), used for the uniqueness Validation of Vertex-Names
+        self._vertex_name_index: Dict[str, Vertex] = {}
+
+        # Incremented by the Storage on every save, used for optimistic concurrency control
+        self.version: int = 0
+
+        # Changes since the Graph got loaded, consumed by the Storage when saving
+        self._changes: List[GraphChange] = []
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['vertices'] = list(self.vertices)
+        state['edges'] = list(self.edges)
+        state.pop('_changes', None)
+        state.pop('_vertex_index', None)
+        state.pop('_edge_index', None)
+        state.pop('_vertex_name_index', None)
+
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('version', 0)
+        self._changes = []
+        self.rebuild_indexes()
 
     #####################
     # Vertex Operations #
     #####################
     def find_vertex_by_id(self, vertex_id: str) -> Vertex:
-        for vertex in self.vertices:
-            if vertex.id == vertex_id:
-                return vertex
+        vertex = self._vertex_index.get(vertex_id)
+        if vertex is None:
+            raise VertexNotFoundException(f"Vertex with Id '{vertex_id}' not found")
+
+        return vertex
 
-        raise VertexNotFoundException(f"Vertex with Id '{vertex_id}' not found")
+    def get_vertex(self, vertex_id: str) -> Vertex | None:
+        return self._vertex_index.get(vertex_id)
+
+    def find_vertex_by_name(self, name_upper: str) -> Vertex | None:
+        return self._vertex_name_index.get(name_upper)
 
     def add_vertex(self, vertex: Vertex):
-        VertexValidator.validate_new_vertex(self.vertices, vertex)
+        VertexValidator.validate_indexed_vertex(self._vertex_index, self._vertex_name_index, vertex)
 
         self.vertices.append(vertex)
+        self._vertex_index[vertex.id] = vertex
+        self._vertex_name_index[vertex.name_upper] = vertex
+        self._record_vertex_put(vertex)
 
     def update_vertex(self, vertex_id: str, new_vertex: Vertex) -> Vertex:
         # Find existing Vertex
@@ -32,14 +73,25 @@ class Graph:
         new_vertex.id = vertex_id
 
         # Validate new Vertex
-        vertices_without_new_vertex = list(filter(lambda v: v.id != vertex_id, self.vertices))
-        VertexValidator.validate_new_vertex(vertices_without_new_vertex, new_vertex)
+        VertexValidator.validate_indexed_vertex(self._vertex_index, self._vertex_name_index, new_vertex, vertex)
 
         # Update Values
+        del self._vertex_name_index[vertex.name_upper]
+        self._vertex_name_index[new_vertex.name_upper] = vertex
         vertex.name = new_vertex.name
         vertex.position_x = new_vertex.position_x
         vertex.position_y = new_vertex.position_y
         vertex.properties = new_vertex.properties
+        self._record_vertex_put(vertex)
+
+        return vertex
+
+    def move_vertex(self, vertex_id: str, position_x: int, position_y: int) -> Vertex:
+        # Hint: The position is only used by the designer, so unlike update_vertex nothing has to be validated
+        vertex = self.find_vertex_by_id(vertex_id)
+        vertex.position_x = position_x
+        vertex.position_y = position_y
+        self._record_vertex_put(vertex)
 
         return vertex
 
@@ -48,27 +100,37 @@ class Graph:
 
         # Delete Edge from Target-Vertex's In-Edges + Delete Edge from Graph
         for edge in vertex.out_edges:
-            edge.target_vertex.in_edges.remove(edge)
+            edge.target_vertex.remove_in_edge(edge)
             self.edges.remove(edge)
+            del self._edge_index[edge.id]
+            self._changes.append(GraphChange(GraphChange.EDGE, GraphChange.DELETE, edge.id))
 
         # Delete Edge from Source-Vertex's Out-Edges + Delete Edge from Graph
         # Hint: In case of recursion the in_edge already got removed in the loop above, so no duplicate deletion
         for edge in vertex.in_edges:
-            edge.source_vertex.out_edges.remove(edge)
+            edge.source_vertex.remove_out_edge(edge)
             self.edges.remove(edge)
+            del self._edge_index[edge.id]
+            self._changes.append(GraphChange(GraphChange.EDGE, GraphChange.DELETE, edge.id))
 
         # Deletes the Vertex from the Graph and therefore all its Edges
         self.vertices.remove(vertex)
+        del self._vertex_index[vertex.id]
+        del self._vertex_name_index[vertex.name_upper]
+        self._changes.append(GraphChange(GraphChange.VERTEX, GraphChange.DELETE, vertex.id))
 
     ###################
     # Edge Operations #
     ###################
     def find_edge_by_id(self, edge_id: str) -> Edge:
-        for edge in self.edges:
-            if edge.id == edge_id:
-                return edge
+        edge = self._edge_index.get(edge_id)
+        if edge is None:
+            raise EdgeNotFoundException(f"Edge with Id '{edge_id}' not found")
+
+        return edge
 
-        raise EdgeNotFoundException(f"Edge with Id '{edge_id}' not found")
+    def get_edge(self, edge_id: str) -> Edge | None:
+        return self._edge_index.get(edge_id)
 
     def add_edge(self, edge: Edge, source_vertex_id: str, target_vertex_id: str):
         # Get Vertices which get connected through Edge
@@ -76,21 +138,14 @@ class Graph:
         target_vertex = self.find_vertex_by_id(target_vertex_id)
 
         # Validate the Edge
+        EdgeValidator.validate_indexed_edge(self._edge_index, edge)
         EdgeValidator.validate_edge_properties(
             edge,
             source_vertex,
             target_vertex
         )
-        EdgeValidator.validate_connected_vertices_connections(
-            edge,
-            source_vertex.out_edges,
-            target_vertex.in_edges
-        )
-        EdgeValidator.validate_connected_vertices_properties(
-            edge,
-            source_vertex.properties,
-            target_vertex.properties
-        )
+        EdgeValidator.validate_indexed_connections(edge, source_vertex, target_vertex)
+        EdgeValidator.validate_indexed_properties(edge, source_vertex, target_vertex)
 
         # Set values of Vertices
         source_vertex.add_out_edge(edge)
@@ -101,6 +156,8 @@ class Graph:
         edge.target_vertex = target_vertex
 
         self.edges.append(edge)
+        self._edge_index[edge.id] = edge
+        self._record_edge_put(edge)
 
     def update_edge(self, edge_id: str, source_vertex_id: str, target_vertex_id: str, new_edge: Edge) -> Edge:
         # Get Data
@@ -109,50 +166,102 @@ class Graph:
         edge = self.find_edge_by_id(edge_id)
 
         # Validate Edge
-        source_vertex_out_edges_without_new_edge = list(filter(lambda e: e != edge, source_vertex.out_edges))
-        target_vertex_in_edges_without_new_edge = list(filter(lambda e: e != edge, target_vertex.in_edges))
         EdgeValidator.validate_edge_properties(
             new_edge,
             source_vertex,
             target_vertex
         )
-        EdgeValidator.validate_connected_vertices_connections(
-            new_edge,
-            source_vertex_out_edges_without_new_edge,
-            target_vertex_in_edges_without_new_edge
-        )
-        EdgeValidator.validate_connected_vertices_properties(
-            new_edge,
-            source_vertex.properties,
-            target_vertex.properties
-        )
+        EdgeValidator.validate_indexed_connections(new_edge, source_vertex, target_vertex, edge)
+        EdgeValidator.validate_indexed_properties(new_edge, source_vertex, target_vertex)
 
+        # Disconnect Edge from previous Vertices
+        # Hint: Before renaming, as the Vertices index their Edges by name
+        edge.source_vertex.remove_out_edge(edge)
+        edge.target_vertex.remove_in_edge(edge)
         # Set Attributes of Edge
         edge.name = new_edge.name
         edge.properties = new_edge.properties
         edge.multi_edge = new_edge.multi_edge
-        # Disconnect Edge from previous Vertices
-        edge.source_vertex.out_edges.remove(edge)
-        edge.target_vertex.in_edges.remove(edge)
         # Connect Edge to new Vertices
         source_vertex.add_out_edge(edge)
         target_vertex.add_in_edge(edge)
         # Set Vertices of Edge
         edge.source_vertex = source_vertex
         edge.target_vertex = target_vertex
+        self._record_edge_put(edge)
 
         return edge
 
     def delete_edge(self, edge_id: str):
         edge = self.find_edge_by_id(edge_id)
 
-        edge.source_vertex.out_edges.remove(edge)
-        edge.target_vertex.in_edges.remove(edge)
+        edge.source_vertex.remove_out_edge(edge)
+        edge.target_vertex.remove_in_edge(edge)
         self.edges.remove(edge)
+        del self._edge_index[edge.id]
+        self._changes.append(GraphChange(GraphChange.EDGE, GraphChange.DELETE, edge.id))
 
     #########
     # Other #
     #########
+    def copy(self) -> 'Graph':
+        # Hint: Same version, the Properties are shared as they only ever get replaced
+        graph = Graph()
+        graph.version = self.version
+
+        vertices = {}
+        for vertex in self.vertices:
+            vertex_copy = Vertex(vertex.id, vertex.name, vertex.position_x, vertex.position_y, list(vertex.properties))
+            vertices[id(vertex)] = vertex_copy
+            graph.vertices.append(vertex_copy)
+
+        edges = {}
+        for edge in self.edges:
+            edge_copy = Edge(edge.id, edge.name, list(edge.properties), edge.multi_edge)
+            edge_copy.source_vertex = vertices[id(edge.source_vertex)]
+            edge_copy.target_vertex = vertices[id(edge.target_vertex)]
+            edges[id(edge)] = edge_copy
+            graph.edges.append(edge_copy)
+
+        # Hint: The Edges are connected in the original order, which defines the order of the generated fields
+        for vertex in self.vertices:
+            vertex_copy = vertices[id(vertex)]
+            vertex_copy.out_edges = IndexedList(edges[id(edge)] for edge in vertex.out_edges)
+            vertex_copy.in_edges = IndexedList(edges[id(edge)] for edge in vertex.in_edges)
+        graph.rebuild_indexes()
+
+        return graph
+
+    def rebuild_indexes(self):
+        # Hint: Has to be called after the Vertices or Edges got assigned directly, e.g. as lists when deserializing
+        if not isinstance(self.vertices, IndexedList):
+            self.vertices = IndexedList(self.vertices)
+        if not isinstance(self.edges, IndexedList):
+            self.edges = IndexedList(self.edges)
+        self._vertex_index = {vertex.id: vertex for vertex in self.vertices}
+        self._edge_index = {edge.id: edge for edge in self.edges}
+        self._vertex_name_index = {vertex.name_upper: vertex for vertex in self.vertices}
+        for vertex in self.vertices:
+            vertex.rebuild_indexes()
+
+    def _record_vertex_put(self, vertex: Vertex):
+        # Hint: Changes hold a copy, as the Vertex may change again before the Changes get saved
+        vertex_copy = Vertex(vertex.id, vertex.name, vertex.position_x, vertex.position_y, list(vertex.properties))
+        self._changes.append(GraphChange(GraphChange.VERTEX, GraphChange.PUT, vertex.id, vertex_copy))
+
+    def _record_edge_put(self, edge: Edge):
+        # Hint: Only the Ids of the connected Vertices are used, which never change
+        edge_copy = Edge(edge.id, edge.name, list(edge.properties), edge.multi_edge)
+        edge_copy.source_vertex = edge.source_vertex
+        edge_copy.target_vertex = edge.target_vertex
+        self._changes.append(GraphChange(GraphChange.EDGE, GraphChange.PUT, edge.id, edge_copy))
+
+    def pop_changes(self) -> List[GraphChange]:
+        changes = self._changes
+        self._changes = []
+
+        return changes
+
     def to_dict(self) -> dict:
         return {
             'vertices': [vertex.to_dict() for vertex in self.vertices],
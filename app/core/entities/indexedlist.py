@@ -0,0 +1,73 @@
+from itertools import islice
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, TypeVar
+
+T = TypeVar('T')
+
+
+class IndexedList(Generic[T]):
+    # Hint: Keeps the order of a list with O(1) appends, removals and membership tests, positional access is O(n)
+    __slots__ = ('_items',)
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: Dict[T, None] = dict.fromkeys(items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._items
+
+    def __getitem__(self, index: int | slice) -> T | List[T]:
+        if isinstance(index, slice):
+            # Hint: Pages from the start (e.g. offset and limit of a list request) don't copy the remaining elements
+            if index.step is None and (index.start or 0) >= 0 and (index.stop is None or index.stop >= 0):
+                return list(islice(self._items, index.start, index.stop))
+            return list(self._items)[index]
+
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError('IndexedList index out of range')
+
+        return next(islice(self._items, index, None))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IndexedList):
+            return list(self._items) == list(other._items)
+        if isinstance(other, list):
+            return list(self._items) == other
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'IndexedList({list(self._items)!r})'
+
+    def __reduce__(self):
+        return IndexedList, (list(self._items),)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._items.__sizeof__()
+
+    def append(self, item: T):
+        self._items[item] = None
+
+    def remove(self, item: T):
+        try:
+            del self._items[item]
+        except KeyError:
+            raise ValueError(f'{item!r} not in IndexedList') from None
+
+    def index(self, item: T) -> int:
+        for idx, element in enumerate(self._items):
+            if element is item:
+                return idx
+
+        raise ValueError(f'{item!r} not in IndexedList')
+
+    def sort(self, key: Callable[[T], object] | None = None, reverse: bool = False):
+        self._items = dict.fromkeys(sorted(self._items, key=key, reverse=reverse))
@@ -1,4 +1,6 @@
 class Project:
+    __slots__ = ('id', 'name')
+
     def __init__(self, _id: str, name: str):
         self.id = _id
         self.name = name
@@ -1,4 +1,7 @@
-class Datatype:
+from enum import Enum
+
+
+class Datatype(str, Enum):
     STRING = 'String'
     INT = 'Int'
     FLOAT = 'Float'
@@ -6,11 +9,21 @@ class Datatype:
 
 
 class Property:
+    __slots__ = ('key', 'required', 'datatype')
+
     def __init__(self, key: str, required: bool, datatype: Datatype):
         self.key = key
         self.required = required
         self.datatype = datatype
 
+    def __getstate__(self) -> dict:
+        # Hint: A plain dict, like the state of Properties pickled before they had __slots__
+        return {'key': self.key, 'required': self.required, 'datatype': self.datatype}
+
+    def __setstate__(self, state: dict):
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def to_dict(self) -> dict:
         return {
             'field_name': self.key
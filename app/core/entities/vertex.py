@@ -1,10 +1,37 @@
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, Set, TYPE_CHECKING
+
+from app.core.entities.cachedname import cached_name
+from app.core.entities.indexedlist import IndexedList
 
 if TYPE_CHECKING:
     from app.core.entities import Edge, Property
 
 
 class Vertex:
+    # Derived Names, computed on first use and reset whenever the Name changes
+    CACHED_NAMES = (
+        '_name_upper',
+        '_name_lower',
+        '_type_name',
+        '_logic_input_name',
+        '_order_by_input_name',
+        '_manipulate_input_name',
+        '_property_name'
+    )
+    __slots__ = (
+        'id',
+        '_name',
+        'position_x',
+        'position_y',
+        '_properties',
+        'property_keys',
+        'out_edges',
+        'in_edges',
+        '_out_edge_names',
+        '_in_edge_names',
+        *CACHED_NAMES
+    )
+
     def __init__(
             self,
             _id: str,
@@ -13,40 +40,89 @@ class Vertex:
             position_y: int,
             properties: List['Property']
     ):
+        self.out_edges: IndexedList[Edge] = IndexedList()
+        self.in_edges: IndexedList[Edge] = IndexedList()
+
+        # Connected Edges by name_lower, kept in step with the collections above by add_*_edge and remove_*_edge
+        self._out_edge_names: Dict[str, Edge] = {}
+        self._in_edge_names: Dict[str, Edge] = {}
+
         self.id = _id
         self.name = name
         self.position_x = position_x
         self.position_y = position_y
         self.properties = properties
 
-        self.out_edges: List[Edge] = []
-        self.in_edges: List[Edge] = []
+    def __getstate__(self) -> dict:
+        # Hint: The connected Edges are stored as plain lists and the indexes of their names are left out
+        return {
+            'id': self.id,
+            'name': self._name,
+            'position_x': self.position_x,
+            'position_y': self.position_y,
+            'properties': self._properties,
+            'out_edges': list(self.out_edges),
+            'in_edges': list(self.in_edges)
+        }
+
+    def __setstate__(self, state: dict):
+        # Hint: The indexes of the connected Edges get rebuilt by the Graph, once all Edges are unpickled
+        self.out_edges, self.in_edges = IndexedList(), IndexedList()
+        self._out_edge_names, self._in_edge_names = {}, {}
+        for key, value in state.items():
+            if key in ('out_edges', 'in_edges'):
+                value = IndexedList(value)
+            if key not in ('_out_edge_names', '_in_edge_names'):
+                setattr(self, key, value)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        self.reset_cached_names()
+        # Hint: The names of the connected Edges are derived from the name of this Vertex
+        for edge in self.out_edges:
+            edge.reset_cached_names()
+        for edge in self.in_edges:
+            edge.reset_cached_names()
 
     @property
+    def properties(self) -> List['Property']:
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties: List['Property']):
+        self._properties = properties
+        self.property_keys: Set[str] = {prop.key for prop in properties}
+
+    @cached_name
     def name_upper(self) -> str:
         return self.name[0].upper() + self.name[1:]
 
-    @property
+    @cached_name
     def name_lower(self) -> str:
         return self.name[0].lower() + self.name[1:]
 
-    @property
+    @cached_name
     def type_name(self) -> str:
         return self.name_upper + 'Vertex'
 
-    @property
+    @cached_name
     def logic_input_name(self) -> str:
         return self.name_upper + 'VertexLogicInput'
 
-    @property
+    @cached_name
     def order_by_input_name(self) -> str:
         return self.name_upper + 'VertexOrderByInput'
 
-    @property
+    @cached_name
     def manipulate_input_name(self) -> str:
         return self.name_upper + 'VertexInput'
 
-    @property
+    @cached_name
     def property_name(self) -> str:
         return self.name_upper + 'VertexProperty'
 
@@ -55,9 +131,40 @@ class Vertex:
 
     def add_out_edge(self, edge: 'Edge'):
         self.out_edges.append(edge)
+        self._out_edge_names[edge.name_lower] = edge
 
     def add_in_edge(self, edge: 'Edge'):
         self.in_edges.append(edge)
+        self._in_edge_names[edge.name_lower] = edge
+
+    def remove_out_edge(self, edge: 'Edge'):
+        self.out_edges.remove(edge)
+        if self._out_edge_names.get(edge.name_lower) is edge:
+            del self._out_edge_names[edge.name_lower]
+
+    def remove_in_edge(self, edge: 'Edge'):
+        self.in_edges.remove(edge)
+        if self._in_edge_names.get(edge.name_lower) is edge:
+            del self._in_edge_names[edge.name_lower]
+
+    def find_out_edge_by_name(self, name_lower: str) -> 'Edge | None':
+        return self._out_edge_names.get(name_lower)
+
+    def find_in_edge_by_name(self, name_lower: str) -> 'Edge | None':
+        return self._in_edge_names.get(name_lower)
+
+    def reset_cached_names(self):
+        for slot in self.CACHED_NAMES:
+            setattr(self, slot, None)
+
+    def rebuild_indexes(self):
+        # Hint: Has to be called after the connected Edges got assigned directly, e.g. as lists
+        if not isinstance(self.out_edges, IndexedList):
+            self.out_edges = IndexedList(self.out_edges)
+        if not isinstance(self.in_edges, IndexedList):
+            self.in_edges = IndexedList(self.in_edges)
+        self._out_edge_names = {edge.name_lower: edge for edge in self.out_edges}
+        self._in_edge_names = {edge.name_lower: edge for edge in self.in_edges}
 
     def to_dict(self) -> dict:
         return {
@@ -1,6 +1,11 @@
+from .batch.batchexception import BatchException
 from .build.buildexception import BuildException
 from .edge.edgeexception import EdgeException
 from .edge.edgenotfoundexception import EdgeNotFoundException
+from .graph.graphhistoryunavailableexception import GraphHistoryUnavailableException
+from .graph.graphimportexception import GraphImportException
+from .graph.graphversionnotfoundexception import GraphVersionNotFoundException
+from .graph.versionconflictexception import VersionConflictException
 from .output.deleteoutputexception import DeleteOutputException
 from .project.projectexception import ProjectException
 from .project.projectnotfoundexception import ProjectNotFoundException
@@ -0,0 +1,7 @@
+class BatchException(Exception):
+    def __init__(self, message: str, index: int, cause: Exception):
+        self.message = message
+        # Position of the failed command within the batch and the exception it failed with
+        self.index = index
+        self.cause = cause
+        super().__init__(self.message)
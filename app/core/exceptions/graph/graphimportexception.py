@@ -0,0 +1,9 @@
+from typing import List, Tuple
+
+
+class GraphImportException(Exception):
+    def __init__(self, message: str, errors: List[Tuple[str, list]]):
+        self.message = message
+        # Every error of the imported Graph as (message, loc)
+        self.errors = errors
+        super().__init__(self.message)
@@ -0,0 +1,4 @@
+class GraphVersionNotFoundException(Exception):
+    def __init__(self, message):
+        self.message = message
+        super().__init__(message)
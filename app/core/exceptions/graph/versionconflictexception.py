@@ -0,0 +1,5 @@
+class VersionConflictException(Exception):
+    def __init__(self, message: str, current_version: int):
+        self.message = message
+        self.current_version = current_version
+        super().__init__(self.message)
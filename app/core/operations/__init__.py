@@ -1 +1,3 @@
+from app.core.operations.diffoperation import DiffOperation
+from app.core.operations.importoperation import ImportOperation
 from app.core.operations.renderoperation import RenderOperation
@@ -0,0 +1,166 @@
+from typing import Dict, List
+
+from app.core.entities import Edge, Graph, Property, Vertex
+from app.core.valueobjects import Difference, GraphDiff
+
+
+class DiffOperation:
+    # Hint: Elements are matched by Id and otherwise by name (Edges also by their Vertices), so also Graphs of
+    # different Projects can be compared
+    @staticmethod
+    def diff(old_graph: Graph, new_graph: Graph) -> GraphDiff:
+        differences: List[Difference] = []
+
+        # Matched Vertices and Edges, by the Id of the old element
+        vertex_matches = DiffOperation._match_vertices(old_graph, new_graph)
+        edge_matches = DiffOperation._match_edges(old_graph, new_graph, vertex_matches)
+
+        matched_new_vertices = {id(vertex) for vertex in vertex_matches.values()}
+        for new_vertex in new_graph.vertices:
+            if id(new_vertex) not in matched_new_vertices:
+                differences.append(Difference(Difference.VERTEX, Difference.ADDED, new_vertex.id, new_vertex.name))
+        for old_vertex in old_graph.vertices:
+            new_vertex = vertex_matches.get(old_vertex.id)
+            if new_vertex is None:
+                differences.append(Difference(Difference.VERTEX, Difference.REMOVED, old_vertex.id, old_vertex.name))
+            else:
+                DiffOperation._diff_vertex(old_vertex, new_vertex, differences)
+
+        matched_new_edges = {id(edge) for edge in edge_matches.values()}
+        for new_edge in new_graph.edges:
+            if id(new_edge) not in matched_new_edges:
+                differences.append(Difference(Difference.EDGE, Difference.ADDED, new_edge.id, new_edge.name))
+        for old_edge in old_graph.edges:
+            new_edge = edge_matches.get(old_edge.id)
+            if new_edge is None:
+                differences.append(Difference(Difference.EDGE, Difference.REMOVED, old_edge.id, old_edge.name))
+            else:
+                DiffOperation._diff_edge(old_edge, new_edge, vertex_matches, differences)
+
+        return GraphDiff(old_graph.version, new_graph.version, differences)
+
+    ###########
+    # Helpers #
+    ###########
+    @staticmethod
+    def _match_vertices(old_graph: Graph, new_graph: Graph) -> Dict[str, Vertex]:
+        matches: Dict[str, Vertex] = {}
+        unmatched: List[Vertex] = []
+        for new_vertex in new_graph.vertices:
+            old_vertex = old_graph.get_vertex(new_vertex.id)
+            if old_vertex is not None:
+                matches[old_vertex.id] = new_vertex
+            else:
+                unmatched.append(new_vertex)
+
+        # Hint: Only old Vertices whose Id is gone from the new Graph can be matched by name
+        for new_vertex in unmatched:
+            old_vertex = old_graph.find_vertex_by_name(new_vertex.name_upper)
+            if old_vertex is not None and old_vertex.id not in matches and new_graph.get_vertex(old_vertex.id) is None:
+                matches[old_vertex.id] = new_vertex
+
+        return matches
+
+    @staticmethod
+    def _match_edges(old_graph: Graph, new_graph: Graph, vertex_matches: Dict[str, Vertex]) -> Dict[str, Edge]:
+        matches: Dict[str, Edge] = {}
+        unmatched: List[Edge] = []
+        for new_edge in new_graph.edges:
+            old_edge = old_graph.get_edge(new_edge.id)
+            if old_edge is not None:
+                matches[old_edge.id] = new_edge
+            else:
+                unmatched.append(new_edge)
+
+        # Hint: The name of an Edge is unique among the outgoing Edges of its source Vertex
+        old_vertex_ids = {new_vertex.id: old_vertex_id for old_vertex_id, new_vertex in vertex_matches.items()}
+        for new_edge in unmatched:
+            old_source_id = old_vertex_ids.get(new_edge.source_vertex.id)
+            if old_source_id is None:
+                continue
+
+            old_edge = old_graph.get_vertex(old_source_id).find_out_edge_by_name(new_edge.name_lower)
+            if (
+                old_edge is not None
+                and old_edge.id not in matches
+                and new_graph.get_edge(old_edge.id) is None
+                and vertex_matches.get(old_edge.target_vertex.id) is new_edge.target_vertex
+            ):
+                matches[old_edge.id] = new_edge
+
+        return matches
+
+    @staticmethod
+    def _diff_vertex(old_vertex: Vertex, new_vertex: Vertex, differences: List[Difference]):
+        if old_vertex.name != new_vertex.name:
+            differences.append(Difference(
+                Difference.VERTEX, Difference.RENAMED, new_vertex.id, new_vertex.name, old_vertex.name, new_vertex.name
+            ))
+        DiffOperation._diff_properties(old_vertex.properties, new_vertex.properties, new_vertex.id, differences)
+
+    @staticmethod
+    def _diff_edge(old_edge: Edge, new_edge: Edge, vertex_matches: Dict[str, Vertex], differences: List[Difference]):
+        if old_edge.name != new_edge.name:
+            differences.append(Difference(
+                Difference.EDGE, Difference.RENAMED, new_edge.id, new_edge.name, old_edge.name, new_edge.name
+            ))
+        if old_edge.multi_edge != new_edge.multi_edge:
+            differences.append(Difference(
+                Difference.EDGE, Difference.MULTI_EDGE_CHANGED, new_edge.id, new_edge.name,
+                old_edge.multi_edge, new_edge.multi_edge
+            ))
+        if (
+            vertex_matches.get(old_edge.source_vertex.id) is not new_edge.source_vertex
+            or vertex_matches.get(old_edge.target_vertex.id) is not new_edge.target_vertex
+        ):
+            differences.append(Difference(
+                Difference.EDGE, Difference.RECONNECTED, new_edge.id, new_edge.name,
+                f'{old_edge.source_vertex.name} -> {old_edge.target_vertex.name}',
+                f'{new_edge.source_vertex.name} -> {new_edge.target_vertex.name}'
+            ))
+        DiffOperation._diff_properties(old_edge.properties, new_edge.properties, new_edge.id, differences)
+
+    @staticmethod
+    def _diff_properties(
+            old_properties: List[Property],
+            new_properties: List[Property],
+            owner_id: str,
+            differences: List[Difference]
+    ):
+        old_by_key = {prop.key: prop for prop in old_properties}
+        new_by_key = {prop.key: prop for prop in new_properties}
+
+        # Pairs of matched Properties, either by key or as renamed at the same position
+        pairs = []
+        renamed_keys = set()
+        for position, new_prop in enumerate(new_properties):
+            old_prop = old_by_key.get(new_prop.key)
+            if old_prop is None and position < len(old_properties):
+                candidate = old_properties[position]
+                if candidate.key not in new_by_key:
+                    old_prop = candidate
+                    renamed_keys.add(candidate.key)
+                    differences.append(Difference(
+                        Difference.PROPERTY, Difference.RENAMED, owner_id, new_prop.key, candidate.key, new_prop.key
+                    ))
+
+            if old_prop is None:
+                differences.append(Difference(Difference.PROPERTY, Difference.ADDED, owner_id, new_prop.key))
+            else:
+                pairs.append((old_prop, new_prop))
+
+        for old_prop in old_properties:
+            if old_prop.key not in new_by_key and old_prop.key not in renamed_keys:
+                differences.append(Difference(Difference.PROPERTY, Difference.REMOVED, owner_id, old_prop.key))
+
+        for old_prop, new_prop in pairs:
+            if old_prop.datatype != new_prop.datatype:
+                differences.append(Difference(
+                    Difference.PROPERTY, Difference.DATATYPE_CHANGED, owner_id, new_prop.key,
+                    old_prop.datatype, new_prop.datatype
+                ))
+            if old_prop.required != new_prop.required:
+                differences.append(Difference(
+                    Difference.PROPERTY, Difference.REQUIRED_CHANGED, owner_id, new_prop.key,
+                    old_prop.required, new_prop.required
+                ))
@@ -0,0 +1,50 @@
+from typing import List, Tuple
+
+from app.core.entities import Edge, Graph, Vertex
+from app.core.exceptions import EdgeException, GraphImportException, VertexException
+
+
+class ImportOperation:
+    @staticmethod
+    def build_graph(vertices: List[Vertex], edges: List[Tuple[Edge, str, str]]) -> Graph:
+        # Hint: Invalid elements are skipped, so all errors get raised together as a GraphImportException
+        graph = Graph()
+        errors: List[Tuple[str, list]] = []
+
+        invalid_vertex_ids = set()
+        for idx, vertex in enumerate(vertices):
+            try:
+                graph.add_vertex(vertex)
+            except VertexException as ex:
+                errors.append((ex.message, ['body', 'vertices', idx, ex.loc]))
+                invalid_vertex_ids.add(vertex.id)
+
+        for idx, (edge, source_vertex_id, target_vertex_id) in enumerate(edges):
+            # Hint: Edges of invalid Vertices are skipped silently, their error got already reported
+            if source_vertex_id in invalid_vertex_ids or target_vertex_id in invalid_vertex_ids:
+                continue
+
+            if graph.get_edge(edge.id) is not None:
+                errors.append((f"Edge with Id '{edge.id}' already exists", ['body', 'edges', idx, 'id']))
+                continue
+            if graph.get_vertex(source_vertex_id) is None:
+                errors.append((f"Vertex with Id '{source_vertex_id}' not found",
+                               ['body', 'edges', idx, 'source_vertex_id']))
+                continue
+            if graph.get_vertex(target_vertex_id) is None:
+                errors.append((f"Vertex with Id '{target_vertex_id}' not found",
+                               ['body', 'edges', idx, 'target_vertex_id']))
+                continue
+
+            try:
+                graph.add_edge(edge, source_vertex_id, target_vertex_id)
+            except EdgeException as ex:
+                # Hint: The loc of the EdgeException is relative to the body of a single Edge
+                errors.append((ex.message, ['body', 'edges', idx, *ex.loc[1:]]))
+
+        if errors:
+            raise GraphImportException(f'Imported Graph has {len(errors)} invalid element(s)', errors)
+
+        graph.pop_changes()
+
+        return graph
@@ -1,3 +1,5 @@
+from .batch.batchrepository import BatchRepository
+from .batch.batchrepositoryinterface import IBatchRepository
 from .edge.edgerepository import EdgeRepository
 from .edge.edgerepositoryinterface import IEdgeRepository
 from .graph.graphrepository import GraphRepository
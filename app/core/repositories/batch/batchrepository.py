@@ -0,0 +1,100 @@
+from typing import List
+
+from app.core.entities import Edge, Graph, Vertex
+from app.core.entities.indexedlist import IndexedList
+from app.core.exceptions import (
+    BatchException,
+    EdgeException,
+    EdgeNotFoundException,
+    ProjectNotFoundException,
+    VertexException,
+    VertexNotFoundException
+)
+from app.core.repositories.batch.batchrepositoryinterface import IBatchRepository
+from app.core.repositories.graphmutation import mutate_graph
+from app.core.valueobjects import BatchCommand, Versioned
+from app.infrastructure.storages import IProjectStorage
+
+
+class BatchRepository(IBatchRepository):
+    def __init__(self, storage: IProjectStorage):
+        self.storage = storage
+
+    def apply_commands(
+            self,
+            project_id: str,
+            commands: List[BatchCommand],
+            expected_version: int | None = None
+    ) -> Versioned[List[BatchCommand]]:
+        def mutation(graph):
+            results: List[BatchCommand] = []
+            for idx, command in enumerate(commands):
+                try:
+                    results.append(self._apply_command(graph, command))
+                except (VertexException, VertexNotFoundException, EdgeException, EdgeNotFoundException) as ex:
+                    # Hint: The Graph is only saved after all commands succeeded, so nothing of the batch is persisted
+                    raise BatchException(f'Operation {idx} failed: {ex.message}', idx, ex)
+
+            return results
+
+        try:
+            return mutate_graph(self.storage, project_id, mutation, expected_version)
+        except ValueError as ex:
+            raise ProjectNotFoundException(str(ex))
+
+    @staticmethod
+    def _apply_command(graph: Graph, command: BatchCommand) -> BatchCommand:
+        # Hint: The elements are copied, as a retried mutation must not reuse elements connected to a discarded Graph
+        if command.element_type == BatchCommand.VERTEX:
+            if command.action == BatchCommand.DELETE:
+                graph.delete_vertex(command.element_id)
+                return BatchCommand(BatchCommand.VERTEX, BatchCommand.DELETE, command.element_id)
+
+            new_vertex = command.element
+            vertex = Vertex(command.element_id, new_vertex.name, new_vertex.position_x, new_vertex.position_y,
+                            list(new_vertex.properties))
+            if command.action == BatchCommand.CREATE:
+                graph.add_vertex(vertex)
+            else:
+                vertex = graph.update_vertex(command.element_id, vertex)
+
+            return BatchCommand(BatchCommand.VERTEX, command.action, vertex.id, BatchRepository._snapshot_vertex(vertex))
+
+        if command.action == BatchCommand.DELETE:
+            graph.delete_edge(command.element_id)
+            return BatchCommand(BatchCommand.EDGE, BatchCommand.DELETE, command.element_id)
+
+        new_edge = command.element
+        edge = Edge(command.element_id, new_edge.name, list(new_edge.properties), new_edge.multi_edge)
+        if command.action == BatchCommand.CREATE:
+            graph.add_edge(edge, command.source_vertex_id, command.target_vertex_id)
+        else:
+            edge = graph.update_edge(command.element_id, command.source_vertex_id, command.target_vertex_id, edge)
+
+        return BatchCommand(
+            BatchCommand.EDGE,
+            command.action,
+            edge.id,
+            BatchRepository._snapshot_edge(edge),
+            edge.source_vertex.id,
+            edge.target_vertex.id
+        )
+
+    @staticmethod
+    def _snapshot_vertex(vertex: Vertex) -> Vertex:
+        # Hint: Results hold the state after their own command, later commands of the batch may change the elements
+        snapshot = Vertex(vertex.id, vertex.name, vertex.position_x, vertex.position_y, list(vertex.properties))
+        snapshot.out_edges = IndexedList(BatchRepository._snapshot_edge(edge) for edge in vertex.out_edges)
+        snapshot.in_edges = IndexedList(BatchRepository._snapshot_edge(edge) for edge in vertex.in_edges)
+        snapshot.rebuild_indexes()
+
+        return snapshot
+
+    @staticmethod
+    def _snapshot_edge(edge: Edge) -> Edge:
+        # Hint: Of the connected Vertices only the Ids are used, which never change
+        snapshot = Edge(edge.id, edge.name, list(edge.properties), edge.multi_edge)
+        snapshot.source_vertex = edge.source_vertex
+        snapshot.target_vertex = edge.target_vertex
+
+        return snapshot
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.core.valueobjects import BatchCommand, Versioned
+
+
+class IBatchRepository(ABC):
+    @abstractmethod
+    def apply_commands(
+            self,
+            project_id: str,
+            commands: List[BatchCommand],
+            expected_version: int | None = None
+    ) -> Versioned[List[BatchCommand]]:
+        pass
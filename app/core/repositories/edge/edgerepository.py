@@ -1,8 +1,8 @@
-from typing import List
-
 from app.core.entities import Edge
 from app.core.exceptions import ProjectNotFoundException
 from app.core.repositories.edge.edgerepositoryinterface import IEdgeRepository
+from app.core.repositories.graphmutation import mutate_graph
+from app.core.valueobjects import ListQuery, Page, Versioned
 from app.infrastructure.storages import IProjectStorage
 
 
@@ -10,31 +10,40 @@ class EdgeRepository(IEdgeRepository):
     def __init__(self, storage: IProjectStorage):
         self.storage = storage
 
-    def get_edges(self, project_id: str) -> List[Edge]:
+    def get_edges(self, project_id: str, query: ListQuery | None = None) -> Versioned[Page[Edge]]:
         try:
             graph = self.storage.load_graph(project_id)
-            edges = graph.edges
+            edges = (query or ListQuery()).apply(graph.edges)
 
-            return edges
+            return Versioned(edges, graph.version)
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
 
-    def get_edge(self, project_id: str, edge_id: str) -> Edge:
+    def get_edge(self, project_id: str, edge_id: str) -> Versioned[Edge]:
         try:
-            graph = self.storage.load_graph(project_id)
-            edge = graph.find_edge_by_id(edge_id)
+            # Hint: The version is read before the Edge, so a concurrent write can only make it look outdated
+            version = self.storage.get_graph_version(project_id)
+            edge = self.storage.load_edge(project_id, edge_id)
 
-            return edge
+            return Versioned(edge, version)
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
 
-    def create_edge(self, project_id: str, edge: Edge, source_vertex_id: str, target_vertex_id: str) -> Edge:
-        try:
-            graph = self.storage.load_graph(project_id)
+    def create_edge(
+            self,
+            project_id: str,
+            edge: Edge,
+            source_vertex_id: str,
+            target_vertex_id: str,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
+        def mutation(graph):
             graph.add_edge(edge, source_vertex_id, target_vertex_id)
-            self.storage.save_graph(project_id, graph)
 
             return edge
+
+        try:
+            return mutate_graph(self.storage, project_id, mutation, expected_version)
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
 
@@ -44,21 +53,26 @@ class EdgeRepository(IEdgeRepository):
             edge_id: str,
             source_vertex_id: str,
             target_vertex_id: str,
-            edge: Edge
-    ) -> Edge:
+            edge: Edge,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
         try:
-            graph = self.storage.load_graph(project_id)
-            updated_edge = graph.update_edge(edge_id, source_vertex_id, target_vertex_id, edge)
-            self.storage.save_graph(project_id, graph)
-
-            return updated_edge
+            return mutate_graph(
+                self.storage,
+                project_id,
+                lambda graph: graph.update_edge(edge_id, source_vertex_id, target_vertex_id, edge),
+                expected_version
+            )
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
 
-    def delete_edge(self, project_id: str, edge_id: str):
+    def delete_edge(self, project_id: str, edge_id: str, expected_version: int | None = None) -> Versioned[None]:
         try:
-            graph = self.storage.load_graph(project_id)
-            graph.delete_edge(edge_id)
-            self.storage.save_graph(project_id, graph)
+            return mutate_graph(
+                self.storage,
+                project_id,
+                lambda graph: graph.delete_edge(edge_id),
+                expected_version
+            )
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
@@ -1,32 +1,41 @@
 from abc import ABC, abstractmethod
-from typing import List
 
 from app.core.entities import Edge
+from app.core.valueobjects import ListQuery, Page, Versioned
 
 
 class IEdgeRepository(ABC):
     @abstractmethod
-    def get_edges(self, project_id: str) -> List[Edge]:
+    def get_edges(self, project_id: str, query: ListQuery | None = None) -> Versioned[Page[Edge]]:
         pass
 
     @abstractmethod
-    def get_edge(self, project_id: str, edge_id: str) -> Edge:
+    def get_edge(self, project_id: str, edge_id: str) -> Versioned[Edge]:
         pass
 
     @abstractmethod
-    def create_edge(self, project_id: str, edge: Edge, source_vertex_id: str, target_vertex_id: str) -> Edge:
+    def create_edge(
+            self,
+            project_id: str,
+            edge: Edge,
+            source_vertex_id: str,
+            target_vertex_id: str,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
         pass
 
     @abstractmethod
     def update_edge(
-            self, project_id: str,
+            self,
+            project_id: str,
             edge_id: str,
             source_vertex_id: str,
             target_vertex_id: str,
-            edge: Edge
-    ) -> Edge:
+            edge: Edge,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
         pass
 
     @abstractmethod
-    def delete_edge(self, project_id: str, edge_id: str):
+    def delete_edge(self, project_id: str, edge_id: str, expected_version: int | None = None) -> Versioned[None]:
         pass
@@ -1,6 +1,8 @@
 from app.core.entities import Graph
 from app.core.exceptions import ProjectNotFoundException
 from app.core.repositories.graph.graphrepositoryinterface import IGraphRepository
+from app.core.repositories.graphmutation import replace_graph
+from app.core.valueobjects import Versioned
 from app.infrastructure.storages import IProjectStorage
 
 
@@ -15,3 +17,23 @@ class GraphRepository(IGraphRepository):
             return graph
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
+
+    def get_graph_version(self, project_id: str) -> int:
+        try:
+            return self.storage.get_graph_version(project_id)
+        except ValueError as ex:
+            raise ProjectNotFoundException(str(ex))
+
+    def get_graph_at_version(self, project_id: str, version: int) -> Graph:
+        try:
+            graph = self.storage.load_graph_at_version(project_id, version)
+
+            return graph
+        except ValueError as ex:
+            raise ProjectNotFoundException(str(ex))
+
+    def replace_graph(self, project_id: str, graph: Graph, expected_version: int | None = None) -> Versioned[Graph]:
+        try:
+            return replace_graph(self.storage, project_id, graph, expected_version)
+        except ValueError as ex:
+            raise ProjectNotFoundException(str(ex))
@@ -1,9 +1,22 @@
 from abc import ABC, abstractmethod
 
 from app.core.entities import Graph
+from app.core.valueobjects import Versioned
 
 
 class IGraphRepository(ABC):
     @abstractmethod
     def get_graph(self, project_id: str) -> Graph:
         pass
+
+    @abstractmethod
+    def get_graph_version(self, project_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def get_graph_at_version(self, project_id: str, version: int) -> Graph:
+        pass
+
+    @abstractmethod
+    def replace_graph(self, project_id: str, graph: Graph, expected_version: int | None = None) -> Versioned[Graph]:
+        pass
@@ -0,0 +1,62 @@
+from typing import Callable, TypeVar
+
+from app.core.entities import Graph
+from app.core.exceptions import VersionConflictException
+from app.core.valueobjects import Versioned
+from app.infrastructure.storages import IProjectStorage
+
+T = TypeVar('T')
+
+MAX_ATTEMPTS = 5
+
+
+def mutate_graph(
+        storage: IProjectStorage,
+        project_id: str,
+        mutation: Callable[[Graph], T],
+        expected_version: int | None = None
+) -> Versioned[T]:
+    # Hint: Without an expected_version, a concurrent write just re-applies the mutation on the fresh Graph
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        graph = storage.load_graph(project_id, for_update=True)
+        if expected_version is not None and graph.version != expected_version:
+            raise VersionConflictException(
+                f'Graph version {graph.version} does not match the expected version {expected_version}',
+                graph.version
+            )
+
+        result = mutation(graph)
+        try:
+            storage.save_graph(project_id, graph, graph.pop_changes())
+        except VersionConflictException:
+            if expected_version is not None or attempt == MAX_ATTEMPTS:
+                raise
+            continue
+
+        return Versioned(result, graph.version)
+
+
+def replace_graph(
+        storage: IProjectStorage,
+        project_id: str,
+        graph: Graph,
+        expected_version: int | None = None
+) -> Versioned[Graph]:
+    # Hint: Written without changes, so the storages persist the Graph as a whole (e.g. as a new snapshot)
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        current_version = storage.get_graph_version(project_id)
+        if expected_version is not None and current_version != expected_version:
+            raise VersionConflictException(
+                f'Graph version {current_version} does not match the expected version {expected_version}',
+                current_version
+            )
+
+        graph.version = current_version
+        try:
+            storage.save_graph(project_id, graph)
+        except VersionConflictException:
+            if expected_version is not None or attempt == MAX_ATTEMPTS:
+                raise
+            continue
+
+        return Versioned(graph, graph.version)
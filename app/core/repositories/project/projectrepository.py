@@ -1,8 +1,7 @@
-from typing import List
-
 from app.core.entities import Project
 from app.core.exceptions import ProjectNotFoundException, ProjectException
 from app.core.repositories.project.projectrepositoryinterface import IProjectRepository
+from app.core.valueobjects import ListQuery, Page
 from app.infrastructure.storages import IProjectStorage
 
 
@@ -10,8 +9,8 @@ class ProjectRepository(IProjectRepository):
     def __init__(self, storage: IProjectStorage):
         self.storage = storage
 
-    def get_projects(self) -> List[Project]:
-        projects = self.storage.get_projects()
+    def get_projects(self, query: ListQuery | None = None) -> Page[Project]:
+        projects = (query or ListQuery()).apply(self.storage.get_projects())
 
         return projects
 
@@ -1,57 +1,90 @@
-from typing import List
+from typing import Dict, Tuple
 
 from app.core.entities import Vertex
 from app.core.exceptions import ProjectNotFoundException
+from app.core.repositories.graphmutation import mutate_graph
 from app.core.repositories.vertex.vertexrepositoryinterface import IVertexRepository
+from app.core.valueobjects import ListQuery, Page, Versioned
+from app.infrastructure.caches import PositionBuffer
 from app.infrastructure.storages.project.projectstorageinterface import IProjectStorage
 
 
 class VertexRepository(IVertexRepository):
-    def __init__(self, storage: IProjectStorage):
+    def __init__(self, storage: IProjectStorage, position_buffer: PositionBuffer | None = None):
         self.storage = storage
+        # Hint: A PositionBuffer without a running flush thread writes every move right away
+        self.position_buffer = position_buffer if position_buffer is not None else PositionBuffer()
 
-    def get_vertices(self, project_id: str) -> List[Vertex]:
+    def get_vertices(self, project_id: str, query: ListQuery | None = None) -> Versioned[Page[Vertex]]:
         try:
             graph = self.storage.load_graph(project_id)
-            vertices = graph.vertices
+            vertices = (query or ListQuery()).apply(graph.vertices)
 
-            return vertices
+            return Versioned(vertices, graph.version)
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
 
-    def get_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+    def get_vertex(self, project_id: str, vertex_id: str) -> Versioned[Vertex]:
         try:
-            graph = self.storage.load_graph(project_id)
-            vertex = graph.find_vertex_by_id(vertex_id)
+            # Hint: The version is read before the Vertex, so a concurrent write can only make it look outdated
+            version = self.storage.get_graph_version(project_id)
+            vertex = self.storage.load_vertex(project_id, vertex_id)
 
-            return vertex
+            return Versioned(vertex, version)
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
 
-    def create_vertex(self, project_id: str, vertex: Vertex) -> Vertex:
-        try:
-            graph = self.storage.load_graph(project_id)
+    def create_vertex(self, project_id: str, vertex: Vertex, expected_version: int | None = None) -> Versioned[Vertex]:
+        def mutation(graph):
             graph.add_vertex(vertex)
-            self.storage.save_graph(project_id, graph)
 
             return vertex
+
+        try:
+            return mutate_graph(self.storage, project_id, mutation, expected_version)
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
 
-    def update_vertex(self, project_id: str, vertex_id: str, vertex: Vertex) -> Vertex:
+    def update_vertex(
+            self,
+            project_id: str,
+            vertex_id: str,
+            vertex: Vertex,
+            expected_version: int | None = None
+    ) -> Versioned[Vertex]:
+        pending_position = self.position_buffer.discard(project_id, vertex_id)
         try:
-            graph = self.storage.load_graph(project_id)
-            updated_vertex = graph.update_vertex(vertex_id, vertex)
-            self.storage.save_graph(project_id, graph)
-
-            return updated_vertex
+            return mutate_graph(
+                self.storage,
+                project_id,
+                lambda graph: graph.update_vertex(vertex_id, vertex),
+                expected_version
+            )
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
+        except Exception:
+            # Hint: The update got rejected, so the last move of the Vertex still has to be written
+            if pending_position is not None:
+                self.position_buffer.restore(project_id, self.storage, vertex_id, pending_position)
+            raise
 
-    def delete_vertex(self, project_id: str, vertex_id: str):
+    def move_vertices(self, project_id: str, positions: Dict[str, Tuple[int, int]]):
         try:
             graph = self.storage.load_graph(project_id)
-            graph.delete_vertex(vertex_id)
-            self.storage.save_graph(project_id, graph)
+        except ValueError as ex:
+            raise ProjectNotFoundException(str(ex))
+
+        for vertex_id in positions:
+            graph.find_vertex_by_id(vertex_id)
+        self.position_buffer.update(project_id, self.storage, positions)
+
+    def delete_vertex(self, project_id: str, vertex_id: str, expected_version: int | None = None) -> Versioned[None]:
+        try:
+            return mutate_graph(
+                self.storage,
+                project_id,
+                lambda graph: graph.delete_vertex(vertex_id),
+                expected_version
+            )
         except ValueError as ex:
             raise ProjectNotFoundException(str(ex))
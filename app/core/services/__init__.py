@@ -1,3 +1,5 @@
+from .batch.batchservice import BatchService
+from .batch.batchserviceinterface import IBatchService
 from .build.buildservice import BuildService
 from .build.buildserviceinterface import IBuildService
 from .edge.edgeservice import EdgeService
@@ -0,0 +1,20 @@
+from typing import List
+
+from app.core.repositories import IBatchRepository
+from app.core.services.batch.batchserviceinterface import IBatchService
+from app.core.valueobjects import BatchCommand, Versioned
+
+
+class BatchService(IBatchService):
+    def __init__(self, repository: IBatchRepository):
+        self.repository = repository
+
+    def apply_batch(
+            self,
+            project_id: str,
+            commands: List[BatchCommand],
+            expected_version: int | None = None
+    ) -> Versioned[List[BatchCommand]]:
+        results = self.repository.apply_commands(project_id, commands, expected_version)
+
+        return results
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.core.valueobjects import BatchCommand, Versioned
+
+
+class IBatchService(ABC):
+    @abstractmethod
+    def apply_batch(
+            self,
+            project_id: str,
+            commands: List[BatchCommand],
+            expected_version: int | None = None
+    ) -> Versioned[List[BatchCommand]]:
+        pass
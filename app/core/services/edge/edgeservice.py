@@ -1,26 +1,32 @@
-from typing import List
-
 from app.core.entities import Edge
 from app.core.repositories import IEdgeRepository
 from app.core.services.edge.edgeserviceinterface import IEdgeService
+from app.core.valueobjects import ListQuery, Page, Versioned
 
 
 class EdgeService(IEdgeService):
     def __init__(self, repository: IEdgeRepository):
         self.repository = repository
 
-    def get_edges(self, project_id: str) -> List[Edge]:
-        edges = self.repository.get_edges(project_id)
+    def get_edges(self, project_id: str, query: ListQuery | None = None) -> Versioned[Page[Edge]]:
+        edges = self.repository.get_edges(project_id, query)
 
         return edges
 
-    def get_edge(self, project_id: str, edge_id: str) -> Edge:
+    def get_edge(self, project_id: str, edge_id: str) -> Versioned[Edge]:
         edge = self.repository.get_edge(project_id, edge_id)
 
         return edge
 
-    def create_edge(self, project_id: str, edge: Edge, source_vertex_id: str, target_vertex_id: str) -> Edge:
-        edge = self.repository.create_edge(project_id, edge, source_vertex_id, target_vertex_id)
+    def create_edge(
+            self,
+            project_id: str,
+            edge: Edge,
+            source_vertex_id: str,
+            target_vertex_id: str,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
+        edge = self.repository.create_edge(project_id, edge, source_vertex_id, target_vertex_id, expected_version)
 
         return edge
 
@@ -30,11 +36,14 @@ class EdgeService(IEdgeService):
             edge_id: str,
             source_vertex_id: str,
             target_vertex_id: str,
-            edge: Edge
-    ) -> Edge:
-        edge = self.repository.update_edge(project_id, edge_id, source_vertex_id, target_vertex_id, edge)
+            edge: Edge,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
+        edge = self.repository.update_edge(
+            project_id, edge_id, source_vertex_id, target_vertex_id, edge, expected_version
+        )
 
         return edge
 
-    def delete_edge(self, project_id: str, edge_id: str):
-        self.repository.delete_edge(project_id, edge_id)
+    def delete_edge(self, project_id: str, edge_id: str, expected_version: int | None = None) -> Versioned[None]:
+        return self.repository.delete_edge(project_id, edge_id, expected_version)
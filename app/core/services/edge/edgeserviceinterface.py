@@ -1,20 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List
 
 from app.core.entities import Edge
+from app.core.valueobjects import ListQuery, Page, Versioned
 
 
 class IEdgeService(ABC):
     @abstractmethod
-    def get_edges(self, project_id: str) -> List[Edge]:
+    def get_edges(self, project_id: str, query: ListQuery | None = None) -> Versioned[Page[Edge]]:
         pass
 
     @abstractmethod
-    def get_edge(self, project_id: str, edge_id: str) -> Edge:
+    def get_edge(self, project_id: str, edge_id: str) -> Versioned[Edge]:
         pass
 
     @abstractmethod
-    def create_edge(self, project_id: str, edge: Edge, source_vertex_id: str, target_vertex_id: str) -> Edge:
+    def create_edge(
+            self,
+            project_id: str,
+            edge: Edge,
+            source_vertex_id: str,
+            target_vertex_id: str,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
         pass
 
     @abstractmethod
@@ -24,10 +31,11 @@ class IEdgeService(ABC):
             edge_id: str,
             source_vertex_id: str,
             target_vertex_id: str,
-            edge: Edge
-    ) -> Edge:
+            edge: Edge,
+            expected_version: int | None = None
+    ) -> Versioned[Edge]:
         pass
 
     @abstractmethod
-    def delete_edge(self, project_id: str, edge_id: str):
+    def delete_edge(self, project_id: str, edge_id: str, expected_version: int | None = None) -> Versioned[None]:
         pass
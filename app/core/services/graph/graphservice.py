@@ -1,6 +1,10 @@
-from app.core.entities import Graph
+from typing import List, Tuple
+
+from app.core.entities import Edge, Graph, Vertex
+from app.core.operations import DiffOperation, ImportOperation
 from app.core.repositories import IGraphRepository
 from app.core.services.graph.graphserviceinterface import IGraphService
+from app.core.valueobjects import GraphDiff, Versioned
 
 
 class GraphService(IGraphService):
@@ -11,3 +15,36 @@ class GraphService(IGraphService):
         graph = self.repository.get_graph(project_id)
 
         return graph
+
+    def get_graph_version(self, project_id: str) -> int:
+        return self.repository.get_graph_version(project_id)
+
+    def diff_graphs(
+            self,
+            project_id: str,
+            base_project_id: str | None = None,
+            version: int | None = None,
+            base_version: int | None = None
+    ) -> GraphDiff:
+        # Hint: Without a base Project the versions of the same Project are compared
+        base_graph = self._get_graph(base_project_id if base_project_id is not None else project_id, base_version)
+        graph = self._get_graph(project_id, version)
+
+        return DiffOperation.diff(base_graph, graph)
+
+    def import_graph(
+            self,
+            project_id: str,
+            vertices: List[Vertex],
+            edges: List[Tuple[Edge, str, str]],
+            expected_version: int | None = None
+    ) -> Versioned[Graph]:
+        graph = ImportOperation.build_graph(vertices, edges)
+
+        return self.repository.replace_graph(project_id, graph, expected_version)
+
+    def _get_graph(self, project_id: str, version: int | None) -> Graph:
+        if version is None:
+            return self.repository.get_graph(project_id)
+
+        return self.repository.get_graph_at_version(project_id, version)
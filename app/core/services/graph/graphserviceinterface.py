@@ -1,9 +1,35 @@
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 
-from app.core.entities import Graph
+from app.core.entities import Edge, Graph, Vertex
+from app.core.valueobjects import GraphDiff, Versioned
 
 
 class IGraphService(ABC):
     @abstractmethod
     def get_graph(self, project_id: str) -> Graph:
         pass
+
+    @abstractmethod
+    def get_graph_version(self, project_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def diff_graphs(
+            self,
+            project_id: str,
+            base_project_id: str | None = None,
+            version: int | None = None,
+            base_version: int | None = None
+    ) -> GraphDiff:
+        pass
+
+    @abstractmethod
+    def import_graph(
+            self,
+            project_id: str,
+            vertices: List[Vertex],
+            edges: List[Tuple[Edge, str, str]],
+            expected_version: int | None = None
+    ) -> Versioned[Graph]:
+        pass
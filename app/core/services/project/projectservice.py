@@ -1,6 +1,7 @@
 from app.core.entities import Project
 from app.core.repositories import IProjectRepository, IOutputRepository
 from app.core.services.project.projectserviceinterface import IProjectService
+from app.core.valueobjects import ListQuery, Page
 
 
 class ProjectService(IProjectService):
@@ -8,8 +9,8 @@ class ProjectService(IProjectService):
         self.project_repository = project_repository
         self.output_repository = output_repository
 
-    def get_projects(self):
-        projects = self.project_repository.get_projects()
+    def get_projects(self, query: ListQuery | None = None) -> Page[Project]:
+        projects = self.project_repository.get_projects(query)
 
         return projects
 
@@ -1,12 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List
-
 from app.core.entities import Project
+from app.core.valueobjects import ListQuery, Page
 
 
 class IProjectService(ABC):
     @abstractmethod
-    def get_projects(self) -> List[Project]:
+    def get_projects(self, query: ListQuery | None = None) -> Page[Project]:
         pass
 
     @abstractmethod
@@ -1,33 +1,43 @@
-from typing import List
+from typing import Dict, Tuple
 
 from app.core.entities import Vertex
 from app.core.repositories import IVertexRepository
 from app.core.services.vertex.vertexserviceinterface import IVertexService
+from app.core.valueobjects import ListQuery, Page, Versioned
 
 
 class VertexService(IVertexService):
     def __init__(self, repository: IVertexRepository):
         self.repository = repository
 
-    def get_vertices(self, project_id: str) -> List[Vertex]:
-        vertices = self.repository.get_vertices(project_id)
+    def get_vertices(self, project_id: str, query: ListQuery | None = None) -> Versioned[Page[Vertex]]:
+        vertices = self.repository.get_vertices(project_id, query)
 
         return vertices
 
-    def get_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+    def get_vertex(self, project_id: str, vertex_id: str) -> Versioned[Vertex]:
         vertex = self.repository.get_vertex(project_id, vertex_id)
 
         return vertex
 
-    def create_vertex(self, project_id: str, vertex: Vertex) -> Vertex:
-        vertex = self.repository.create_vertex(project_id, vertex)
+    def create_vertex(self, project_id: str, vertex: Vertex, expected_version: int | None = None) -> Versioned[Vertex]:
+        vertex = self.repository.create_vertex(project_id, vertex, expected_version)
 
         return vertex
 
-    def update_vertex(self, project_id: str, vertex_id: str, vertex: Vertex) -> Vertex:
-        vertex = self.repository.update_vertex(project_id, vertex_id, vertex)
+    def update_vertex(
+            self,
+            project_id: str,
+            vertex_id: str,
+            vertex: Vertex,
+            expected_version: int | None = None
+    ) -> Versioned[Vertex]:
+        vertex = self.repository.update_vertex(project_id, vertex_id, vertex, expected_version)
 
         return vertex
 
-    def delete_vertex(self, project_id: str, vertex_id: str):
-        self.repository.delete_vertex(project_id, vertex_id)
+    def move_vertices(self, project_id: str, positions: Dict[str, Tuple[int, int]]):
+        self.repository.move_vertices(project_id, positions)
+
+    def delete_vertex(self, project_id: str, vertex_id: str, expected_version: int | None = None) -> Versioned[None]:
+        return self.repository.delete_vertex(project_id, vertex_id, expected_version)
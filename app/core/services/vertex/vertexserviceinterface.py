@@ -1,26 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Tuple
 
 from app.core.entities import Vertex
+from app.core.valueobjects import ListQuery, Page, Versioned
 
 
 class IVertexService(ABC):
     @abstractmethod
-    def get_vertices(self, project_id: str) -> List[Vertex]:
+    def get_vertices(self, project_id: str, query: ListQuery | None = None) -> Versioned[Page[Vertex]]:
         pass
 
     @abstractmethod
-    def get_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+    def get_vertex(self, project_id: str, vertex_id: str) -> Versioned[Vertex]:
         pass
 
     @abstractmethod
-    def create_vertex(self, project_id: str, vertex: Vertex) -> Vertex:
+    def create_vertex(self, project_id: str, vertex: Vertex, expected_version: int | None = None) -> Versioned[Vertex]:
         pass
 
     @abstractmethod
-    def update_vertex(self, project_id: str, vertex_id: str, vertex: Vertex) -> Vertex:
+    def update_vertex(
+            self,
+            project_id: str,
+            vertex_id: str,
+            vertex: Vertex,
+            expected_version: int | None = None
+    ) -> Versioned[Vertex]:
         pass
 
     @abstractmethod
-    def delete_vertex(self, project_id: str, vertex_id: str):
+    def move_vertices(self, project_id: str, positions: Dict[str, Tuple[int, int]]):
+        pass
+
+    @abstractmethod
+    def delete_vertex(self, project_id: str, vertex_id: str, expected_version: int | None = None) -> Versioned[None]:
         pass
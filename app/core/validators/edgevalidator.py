@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from app.core.entities.edge import Edge
 from app.core.entities.property import Property
@@ -55,6 +55,53 @@ class EdgeValidator:
                     ['body', 'name']
                 )
 
+    @staticmethod
+    def validate_indexed_connections(
+            new_edge: Edge,
+            source_vertex: Vertex,
+            target_vertex: Vertex,
+            existing_edge: Edge | None = None
+    ):
+        # Same Validation as validate_connected_vertices_connections, but on the Edge-Name Indexes of the Vertices
+        # Hint: existing_edge is the Edge which gets updated, so it doesn't conflict with itself
+        edge = source_vertex.find_out_edge_by_name(new_edge.name_lower)
+        if edge is not None and edge is not existing_edge:
+            raise EdgeException(
+                f"Source-Vertex already has an outgoing edge with name '{edge.name}'",
+                422,
+                ['body', 'name']
+            )
+
+        edge = target_vertex.find_in_edge_by_name(new_edge.name_lower)
+        if edge is not None and edge is not existing_edge:
+            raise EdgeException(
+                f"Target-Vertex already has an incoming edge with name '{edge.name}'",
+                422,
+                ['body', 'name']
+            )
+
+    @staticmethod
+    def validate_indexed_edge(edges_by_id: Dict[str, Edge], new_edge: Edge):
+        if new_edge.id in edges_by_id:
+            raise EdgeException(f"Edge with Id '{new_edge.id}' already exists", 409, ['body', 'id'])
+
+    @staticmethod
+    def validate_indexed_properties(new_edge: Edge, source_vertex: Vertex, target_vertex: Vertex):
+        # Same Validation as validate_connected_vertices_properties, but on the Property-Keys of the Vertices
+        if new_edge.out_field_name in source_vertex.property_keys:
+            raise EdgeException(
+                f"Edge name has conflict with property '{new_edge.out_field_name}' of Source-Vertex",
+                422,
+                ['body', 'name']
+            )
+
+        if new_edge.in_field_name in target_vertex.property_keys:
+            raise EdgeException(
+                f"Edge name has conflict with property '{new_edge.in_field_name}' of Target-Vertex",
+                422,
+                ['body', 'name']
+            )
+
     @staticmethod
     def validate_edge_properties(new_edge: Edge, source_vertex: Vertex, target_vertex: Vertex):
         for idx, prop in enumerate(new_edge.properties):
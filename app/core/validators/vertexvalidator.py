@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from app.core.entities.vertex import Vertex
 from app.core.exceptions import VertexException
@@ -13,3 +13,20 @@ class VertexValidator:
                 raise VertexException(f"Vertex with Id '{vertex.id}' already exists", status_code=409, loc='id')
             if new_vertex.name_upper == vertex.name_upper:
                 raise VertexException(f"Vertex with Name '{vertex.name}' already exists", status_code=422, loc='name')
+
+    @staticmethod
+    def validate_indexed_vertex(
+            vertices_by_id: Dict[str, Vertex],
+            vertices_by_name: Dict[str, Vertex],
+            new_vertex: Vertex,
+            existing_vertex: Vertex | None = None
+    ):
+        # Same Validations as above, but on the Indexes of a Graph (Names normalized by name_upper)
+        # Hint: existing_vertex is the Vertex which gets updated, so it doesn't conflict with itself
+        vertex = vertices_by_id.get(new_vertex.id)
+        if vertex is not None and vertex is not existing_vertex:
+            raise VertexException(f"Vertex with Id '{vertex.id}' already exists", status_code=409, loc='id')
+
+        vertex = vertices_by_name.get(new_vertex.name_upper)
+        if vertex is not None and vertex is not existing_vertex:
+            raise VertexException(f"Vertex with Name '{vertex.name}' already exists", status_code=422, loc='name')
@@ -1 +1,7 @@
+from .batchcommand import BatchCommand
+from .changeevent import ChangeEvent
 from .file import File
+from .graphchange import GraphChange
+from .graphdiff import Difference, GraphDiff
+from .listquery import ListQuery, Page
+from .versioned import Versioned
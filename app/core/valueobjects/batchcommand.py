@@ -0,0 +1,24 @@
+class BatchCommand:
+    # Hint: Once applied, element holds a copy of the created or updated element, as it was right after this command
+    VERTEX = 'vertex'
+    EDGE = 'edge'
+
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+    def __init__(
+            self,
+            element_type: str,
+            action: str,
+            element_id: str,
+            element=None,
+            source_vertex_id: str | None = None,
+            target_vertex_id: str | None = None
+    ):
+        self.element_type = element_type
+        self.action = action
+        self.element_id = element_id
+        self.element = element
+        self.source_vertex_id = source_vertex_id
+        self.target_vertex_id = target_vertex_id
@@ -0,0 +1,22 @@
+from typing import List
+
+from app.core.valueobjects.graphchange import GraphChange
+
+
+class ChangeEvent:
+    CHANGE = 'change'
+    # The Graph got replaced as a whole or changes were missed, subscribers have to fetch it again
+    RESET = 'reset'
+    DELETE = 'delete'
+
+    def __init__(
+            self,
+            kind: str,
+            project_id: str,
+            version: int | None = None,
+            changes: List[GraphChange] | None = None
+    ):
+        self.kind = kind
+        self.project_id = project_id
+        self.version = version
+        self.changes = changes if changes is not None else []
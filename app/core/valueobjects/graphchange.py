@@ -0,0 +1,12 @@
+class GraphChange:
+    VERTEX = 'vertex'
+    EDGE = 'edge'
+
+    PUT = 'put'
+    DELETE = 'delete'
+
+    def __init__(self, element_type: str, action: str, element_id: str, element=None):
+        self.element_type = element_type
+        self.action = action
+        self.element_id = element_id
+        self.element = element
@@ -0,0 +1,44 @@
+from typing import List
+
+
+class Difference:
+    VERTEX = 'vertex'
+    EDGE = 'edge'
+    PROPERTY = 'property'
+
+    ADDED = 'added'
+    REMOVED = 'removed'
+    RENAMED = 'renamed'
+    DATATYPE_CHANGED = 'datatype_changed'
+    REQUIRED_CHANGED = 'required_changed'
+    MULTI_EDGE_CHANGED = 'multi_edge_changed'
+    RECONNECTED = 'reconnected'
+
+    def __init__(
+            self,
+            element_type: str,
+            kind: str,
+            element_id: str,
+            name: str,
+            old_value=None,
+            new_value=None
+    ):
+        self.element_type = element_type
+        self.kind = kind
+        # Id of the element in the new Graph, or in the old Graph if it got removed. Properties have no Id of their
+        # own, for them it's the Id of the Vertex or Edge they belong to
+        self.element_id = element_id
+        # Name of the element (the key for Properties), as in the new Graph if it still exists
+        self.name = name
+        self.old_value = old_value
+        self.new_value = new_value
+
+
+class GraphDiff:
+    def __init__(self, old_version: int, new_version: int, differences: List[Difference]):
+        self.old_version = old_version
+        self.new_version = new_version
+        self.differences = differences
+
+    def is_empty(self) -> bool:
+        return len(self.differences) == 0
@@ -0,0 +1,27 @@
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+class Page(Generic[T]):
+    # Hint: total counts all elements matching the filter, not only the selected ones
+    def __init__(self, items: List[T], total: int):
+        self.items = items
+        self.total = total
+
+
+class ListQuery:
+    def __init__(self, offset: int = 0, limit: int | None = None, name_prefix: str | None = None):
+        self.offset = offset
+        self.limit = limit
+        # Hint: Names are compared case-insensitively, like the uniqueness checks of Vertices and Edges
+        self.name_prefix = name_prefix
+
+    def apply(self, elements: Sequence[T]) -> Page[T]:
+        if self.name_prefix:
+            prefix = self.name_prefix.upper()
+            elements = [element for element in elements if element.name.upper().startswith(prefix)]
+
+        stop = None if self.limit is None else self.offset + self.limit
+
+        return Page(list(elements[self.offset:stop]), len(elements))
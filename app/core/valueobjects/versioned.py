@@ -0,0 +1,9 @@
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class Versioned(Generic[T]):
+    def __init__(self, value: T, version: int):
+        self.value = value
+        self.version = version
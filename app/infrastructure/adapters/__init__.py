@@ -1,3 +1,5 @@
+from .groupcommitter import GroupCommitter
 from .outputfolderadapter import OutputFolderAdapter
 from .projectfolderadapter import ProjectFolderAdapter
+from .sqliteadapter import SQLiteAdapter
 from .templatefolderadapter import TemplateFolderAdapter
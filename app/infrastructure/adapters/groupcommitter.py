@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+from typing import Dict, Iterable, Set
+
+
+class GroupCommitter:
+    def __init__(self, window: float = 0.005):
+        self.window = window
+        self.flushes = 0
+        self.synced_files = 0
+        self.synced_folders = 0
+
+        self._condition = threading.Condition()
+        self._pending_files: Set[str] = set()
+        self._pending_folders: Set[str] = set()
+        self._batch = 0
+        self._flushed_batch = -1
+        self._flushing = False
+        self._errors: Dict[int, OSError] = {}
+
+    def sync(self, files: Iterable[str] = (), folders: Iterable[str] = ()):
+        with self._condition:
+            self._pending_files.update(files)
+            self._pending_folders.update(folders)
+            batch = self._batch
+            while self._flushed_batch < batch and self._flushing:
+                self._condition.wait()
+            if self._flushed_batch >= batch:
+                self._raise_error(batch)
+                return
+            self._flushing = True
+
+        # Hint: Leader of the batch, other writers join until the window closes
+        time.sleep(self.window)
+        with self._condition:
+            files, self._pending_files = self._pending_files, set()
+            folders, self._pending_folders = self._pending_folders, set()
+            batch = self._batch
+            self._batch += 1
+
+        error = None
+        try:
+            for file in files:
+                fsync_file(file)
+            for folder in folders:
+                fsync_folder(folder)
+        except OSError as e:
+            error = e
+
+        with self._condition:
+            if error is not None:
+                self._errors[batch] = error
+            self._flushed_batch = batch
+            self._flushing = False
+            self.flushes += 1
+            self.synced_files += len(files)
+            self.synced_folders += len(folders)
+            self._condition.notify_all()
+        self._raise_error(batch)
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                'flushes': self.flushes,
+                'synced_files': self.synced_files,
+                'synced_folders': self.synced_folders
+            }
+
+    def _raise_error(self, batch: int):
+        error = self._errors.get(batch)
+        if error is not None:
+            raise error
+
+
+def fsync_file(path: str):
+    try:
+        file = open(path, 'rb')
+    except FileNotFoundError:
+        # Hint: Got deleted in the meantime (e.g. a compacted journal), so there is nothing left to sync
+        return
+    with file:
+        os.fsync(file.fileno())
+
+
+def fsync_folder(folder: str):
+    # Hint: Folders can't be opened for syncing on Windows, renames are durable there once the file is synced
+    if os.name == 'nt':
+        return
+    fd = os.open(folder, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -1,33 +1,255 @@
+import json
 import os
 import pickle
-from typing import List
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    # Hint: Not available on Windows
+    fcntl = None
 
 from app.core.entities import Project, Graph
+from app.infrastructure.serializers import GraphSerializer
+from .groupcommitter import GroupCommitter, fsync_file, fsync_folder
 
 
 class ProjectFolderAdapter:
-    def __init__(self, project_folder='projects'):
+    # Hint: 'group' batches the fsyncs of concurrent writes, 'never' leaves flushing to the operating system
+    FILE_SYNC_ALWAYS = 'always'
+    FILE_SYNC_GROUP = 'group'
+    FILE_SYNC_NEVER = 'never'
+
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, project_folder='projects', manifest_file_name='.manifest.json', file_sync=FILE_SYNC_ALWAYS,
+                 group_committer: GroupCommitter | None = None):
+        if file_sync not in (self.FILE_SYNC_ALWAYS, self.FILE_SYNC_GROUP, self.FILE_SYNC_NEVER):
+            raise ValueError(f'Invalid file sync mode: {file_sync}')
         self.project_folder = project_folder
+        self.manifest_file_name = manifest_file_name
+        self.file_sync = file_sync
+        self.group_committer = group_committer
+        if self.file_sync == self.FILE_SYNC_GROUP and self.group_committer is None:
+            self.group_committer = GroupCommitter()
+
+    @contextmanager
+    def lock_project(self, project: Project, shared: bool = False) -> Iterator[None]:
+        # Hint: Not reentrant, so code holding the lock must not acquire it again
+        with self._lock_file(self.generate_lock_path(project), shared):
+            yield
+
+    @contextmanager
+    def lock_manifest(self) -> Iterator[None]:
+        with self._lock_file(self.generate_manifest_path() + '.lock', shared=False):
+            yield
+
+    @contextmanager
+    def _lock_file(self, path: str, shared: bool) -> Iterator[None]:
+        if fcntl is None:
+            # Hint: Without fcntl only the threads of this process can be serialized
+            with ProjectFolderAdapter._locks_guard:
+                lock = ProjectFolderAdapter._locks.setdefault(path, threading.Lock())
+            with lock:
+                yield
+            return
+
+        # Hint: flock locks belong to the open file, so separate opens also exclude each other within a process
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
 
     def get_project_files(self) -> List[str]:
         base_directory = os.getcwd()
         path = os.path.join(base_directory, self.project_folder)
-        project_files = [f for f in os.listdir(path) if os.path.isfile(os.path.join(path, f)) and f != '.gitkeep']
+        project_files = [f for f in os.listdir(path) if os.path.isfile(os.path.join(path, f)) and f.endswith('.pickle')]
 
         return project_files
 
+    def generate_project_file_name(self, project: Project) -> str:
+        return f'{project.name}_{project.id}.pickle'
+
     def generate_project_path(self, project: Project):
         base_directory = os.getcwd()
-        path = os.path.join(base_directory, self.project_folder, f'{project.name}_{project.id}.pickle')
+        path = os.path.join(base_directory, self.project_folder, self.generate_project_file_name(project))
+
+        return path
+
+    def generate_lock_path(self, project: Project) -> str:
+        base_directory = os.getcwd()
+        path = os.path.join(base_directory, self.project_folder, f'{project.name}_{project.id}.lock')
 
         return path
 
-    def read_pickle(self, path: str) -> Graph:
+    def generate_journal_path(self, project: Project) -> str:
+        base_directory = os.getcwd()
+        path = os.path.join(base_directory, self.project_folder, f'{project.name}_{project.id}.journal')
+
+        return path
+
+    def generate_manifest_path(self) -> str:
+        base_directory = os.getcwd()
+        path = os.path.join(base_directory, self.project_folder, self.manifest_file_name)
+
+        return path
+
+    def get_file_signature(self, path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def get_file_signature_if_exists(self, path: str) -> Tuple[int, int] | None:
+        try:
+            return self.get_file_signature(path)
+        except FileNotFoundError:
+            return None
+
+    def get_manifest_signature(self) -> Tuple[int, int] | None:
+        return self.get_file_signature_if_exists(self.generate_manifest_path())
+
+    def read_manifest(self) -> dict | None:
+        try:
+            with open(self.generate_manifest_path(), 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def write_manifest(self, manifest: dict) -> Tuple[int, int]:
+        return self._write_atomic(self.generate_manifest_path(), json.dumps(manifest).encode('utf-8'))
+
+    def delete_file(self, path: str):
+        os.remove(path)
+
+    def delete_file_if_exists(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def read_journal(self, path: str) -> List[dict]:
+        try:
+            with open(path, 'rb') as file:
+                lines = file.read().split(b'\n')
+        except FileNotFoundError:
+            return []
+
+        # Hint: Records which got torn by a crash while appending are skipped
+        records = []
+        for line in lines:
+            record = self._parse_journal_record(line)
+            if record is not None:
+                records.append(record)
+
+        return records
+
+    def read_last_journal_record(self, path: str, op: str, block_size: int = 4096) -> dict | None:
+        # Reads the journal backwards block by block, usually the Record is on its last line
+        try:
+            file = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        with file:
+            position = file.seek(0, os.SEEK_END)
+            rest = b''
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                file.seek(position)
+                lines = (file.read(read_size) + rest).split(b'\n')
+                # Hint: The first line may be cut off by the block boundary, so it gets completed by the next block
+                rest = lines.pop(0) if position > 0 else b''
+                for line in reversed(lines):
+                    record = self._parse_journal_record(line)
+                    if record is not None and record.get('op') == op:
+                        return record
+
+        return None
+
+    def append_journal(self, path: str, records: List[dict], sync: bool = True) -> bool:
+        content = b''.join(json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n' for record in records)
+
+        with open(path, 'a+b') as file:
+            created = file.tell() == 0
+            # Terminate a torn Record first, so it doesn't swallow the new ones
+            if not created:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b'\n':
+                    content = b'\n' + content
+            file.write(content)
+        if sync:
+            self.sync_journal(path, created)
+
+        return created
+
+    def sync_journal(self, path: str, created: bool = False):
+        if self.file_sync == self.FILE_SYNC_ALWAYS:
+            fsync_file(path)
+            if created:
+                fsync_folder(os.path.dirname(path))
+        elif self.file_sync == self.FILE_SYNC_GROUP:
+            self.group_committer.sync(files=[path], folders=[os.path.dirname(path)] if created else [])
+
+    def read_graph(self, path: str) -> Graph:
+        with open(path, 'rb') as file:
+            content = file.read()
+
+        # Hint: Project files written before the GraphSerializer existed are plain pickles
+        if not GraphSerializer.is_serialized_graph(content):
+            return pickle.loads(content)
+
+        return GraphSerializer.deserialize(content)
+
+    def read_graph_version(self, path: str) -> int:
         with open(path, 'rb') as file:
-            graph = pickle.load(file)
+            header = file.read(GraphSerializer.HEADER_SIZE)
+        if not GraphSerializer.is_serialized_graph(header):
+            return self.read_graph(path).version
+
+        return GraphSerializer.read_version(header)
+
+    def write_graph(self, path: str, graph: Graph, lock: ContextManager | None = None):
+        self._write_atomic(path, GraphSerializer.serialize(graph), lock)
+
+    def _write_atomic(self, path: str, content: bytes, lock: ContextManager | None = None) -> Tuple[int, int]:
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(content)
+                if self.file_sync == self.FILE_SYNC_ALWAYS:
+                    file.flush()
+                    os.fsync(file.fileno())
+            # The content has to be durable before the rename, otherwise a crash can leave an empty file behind
+            if self.file_sync == self.FILE_SYNC_GROUP:
+                self.group_committer.sync(files=[tmp_path])
+            # Hint: The signature is taken from the temporary file, as os.replace keeps mtime and size
+            signature = self.get_file_signature(tmp_path)
+            # Hint: Only the rename holds the lock, the syncs around it are shared with other writers
+            with lock if lock is not None else nullcontext():
+                os.replace(tmp_path, path)
+        except BaseException:
+            self.delete_file_if_exists(tmp_path)
+            raise
+
+        if self.file_sync == self.FILE_SYNC_ALWAYS:
+            fsync_folder(os.path.dirname(path))
+        elif self.file_sync == self.FILE_SYNC_GROUP:
+            self.group_committer.sync(folders=[os.path.dirname(path)])
+
+        return signature
 
-        return graph
+    @staticmethod
+    def _parse_journal_record(line: bytes) -> dict | None:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
 
-    def write_pickle(self, path: str, graph: Graph):
-        with open(path, 'wb') as file:
-            pickle.dump(graph, file, protocol=pickle.HIGHEST_PROTOCOL)
+        return record if isinstance(record, dict) else None
@@ -0,0 +1,98 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class SQLiteAdapter:
+    schema = """
+        CREATE TABLE IF NOT EXISTS projects (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            revision INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TABLE IF NOT EXISTS vertices (
+            project_id TEXT NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+            id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            position_x INTEGER NOT NULL,
+            position_y INTEGER NOT NULL,
+            PRIMARY KEY (project_id, id)
+        );
+
+        CREATE TABLE IF NOT EXISTS vertex_properties (
+            project_id TEXT NOT NULL,
+            vertex_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            key TEXT NOT NULL,
+            required INTEGER NOT NULL,
+            datatype TEXT NOT NULL,
+            PRIMARY KEY (project_id, vertex_id, position),
+            FOREIGN KEY (project_id, vertex_id) REFERENCES vertices (project_id, id) ON DELETE CASCADE
+        );
+
+        CREATE TABLE IF NOT EXISTS edges (
+            project_id TEXT NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+            id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            multi_edge INTEGER NOT NULL,
+            source_vertex_id TEXT NOT NULL,
+            target_vertex_id TEXT NOT NULL,
+            out_position INTEGER NOT NULL,
+            in_position INTEGER NOT NULL,
+            PRIMARY KEY (project_id, id),
+            FOREIGN KEY (project_id, source_vertex_id) REFERENCES vertices (project_id, id) ON DELETE CASCADE,
+            FOREIGN KEY (project_id, target_vertex_id) REFERENCES vertices (project_id, id) ON DELETE CASCADE
+        );
+        CREATE INDEX IF NOT EXISTS edges_source_vertex ON edges (project_id, source_vertex_id);
+        CREATE INDEX IF NOT EXISTS edges_target_vertex ON edges (project_id, target_vertex_id);
+
+        CREATE TABLE IF NOT EXISTS edge_properties (
+            project_id TEXT NOT NULL,
+            edge_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            key TEXT NOT NULL,
+            required INTEGER NOT NULL,
+            datatype TEXT NOT NULL,
+            PRIMARY KEY (project_id, edge_id, position),
+            FOREIGN KEY (project_id, edge_id) REFERENCES edges (project_id, id) ON DELETE CASCADE
+        );
+    """
+
+    def __init__(self, database='projects/projects.sqlite3'):
+        self.database = database
+        self._local = threading.local()
+
+    def get_connection(self) -> sqlite3.Connection:
+        # Hint: sqlite3 Connections must not be shared between Threads, so every Thread gets its own one
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            path = os.path.join(os.getcwd(), self.database)
+            connection = sqlite3.connect(path, isolation_level=None)
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            connection.execute('PRAGMA foreign_keys = ON')
+            connection.executescript(self.schema)
+            self._local.connection = connection
+
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self.get_connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        else:
+            connection.execute('COMMIT')
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,4 @@
+from .graphcache import GraphCache
+from .positionbuffer import PositionBuffer
+from .responsecache import CachedResponse, ResponseCache
+from .writebehindbuffer import WriteBehindBuffer
@@ -0,0 +1,123 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Tuple
+
+from app.core.entities import Graph
+
+
+def estimate_graph_size(graph: Graph) -> int:
+    # Hint: Only a rough estimate, enough to keep the cache within its memory budget
+    size = sys.getsizeof(graph) + sys.getsizeof(graph.vertices) + sys.getsizeof(graph.edges)
+
+    for element in [*graph.vertices, *graph.edges]:
+        size += sys.getsizeof(element) + sys.getsizeof(element.id) + sys.getsizeof(element.name)
+        size += sys.getsizeof(element.properties)
+        for prop in element.properties:
+            size += sys.getsizeof(prop) + sys.getsizeof(prop.key)
+        size += _estimate_cached_names_size(element)
+
+    for vertex in graph.vertices:
+        size += sys.getsizeof(vertex.out_edges) + sys.getsizeof(vertex.in_edges)
+        size += sys.getsizeof(vertex.property_keys)
+
+    return size
+
+
+def _estimate_cached_names_size(element) -> int:
+    # Names which aren't computed yet are counted as well, as the cached Graph computes them on first use
+    size = 0
+    for slot in element.CACHED_NAMES:
+        name = getattr(element, slot)
+        if name is None:
+            name = getattr(type(element), slot[1:]).function(element)
+        size += sys.getsizeof(name)
+
+    return size
+
+
+class GraphCache:
+    # Hint: Entries are only served for the signature they got stored with, while watched that is the generation
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[str, Tuple[Hashable, Graph, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.watched = False
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, project_id: str, signature: Hashable) -> Graph | None:
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            cached_signature, graph, _ = entry
+            if cached_signature != signature:
+                # Underlying File changed since the Graph got cached
+                self._remove(project_id)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(project_id)
+            self.hits += 1
+
+            return graph
+
+    def put(self, project_id: str, signature: Hashable, graph: Graph):
+        size = estimate_graph_size(graph)
+
+        with self._lock:
+            self._remove(project_id)
+
+            # Graphs which don't fit into the budget at all are not cached
+            if self.max_entries <= 0 or size > self.max_bytes:
+                return
+
+            self._entries[project_id] = (signature, graph, size)
+            self.size_bytes += size
+
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+                evicted_project_id = next(iter(self._entries))
+                self._remove(evicted_project_id)
+                self.evictions += 1
+
+    def get_generation(self, project_id: str) -> Hashable:
+        # Hint: A Graph loaded before an invalidation is stored under an outdated generation and never served
+        with self._lock:
+            return self._epoch, self._generations.get(project_id, 0)
+
+    def invalidate(self, project_id: str):
+        with self._lock:
+            self._remove(project_id)
+            self._generations[project_id] = self._generations.get(project_id, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self._epoch += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self.size_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def _remove(self, project_id: str):
+        entry = self._entries.pop(project_id, None)
+        if entry is not None:
+            self.size_bytes -= entry[2]
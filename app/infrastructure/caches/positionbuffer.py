@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+from typing import Dict, Tuple, TYPE_CHECKING
+
+from app.core.exceptions import VersionConflictException, VertexNotFoundException
+
+if TYPE_CHECKING:
+    from app.infrastructure.storages import IProjectStorage
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+
+
+class PendingPositions:
+    def __init__(self, storage: 'IProjectStorage', positions: Dict[str, Tuple[int, int]]):
+        self.storage = storage
+        self.positions = positions
+        self.updates = 1
+
+
+class PositionBuffer:
+    # Moves are last-writer-wins per process. Moves of one Vertex sent to different worker processes within one
+    # flush_interval may be written in any order, so a drag should stay on one connection.
+    def __init__(self, flush_interval: float = 0.1):
+        self.flush_interval = flush_interval
+
+        self._entries: Dict[str, PendingPositions] = {}
+        self._lock = threading.Lock()
+        # Held during the whole write, so discard() can't miss a position that is being written
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.updates = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.last_flush_ms = 0.0
+
+    def update(self, project_id: str, storage: 'IProjectStorage', positions: Dict[str, Tuple[int, int]]):
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                self._entries[project_id] = PendingPositions(storage, dict(positions))
+            else:
+                entry.storage = storage
+                entry.positions.update(positions)
+                entry.updates += 1
+            self.updates += 1
+            running = self._thread is not None
+
+        if not running:
+            self.flush_project(project_id)
+
+    def discard(self, project_id: str, vertex_id: str) -> Tuple[int, int] | None:
+        # Called before a Vertex gets updated as a whole, so an older pending position can't overwrite the update
+        with self._flush_lock, self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                return None
+
+            return entry.positions.pop(vertex_id, None)
+
+    def restore(self, project_id: str, storage: 'IProjectStorage', vertex_id: str, position: Tuple[int, int]):
+        # Puts back a discarded position if the update of the Vertex failed, unless the Vertex got moved since
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                self._entries[project_id] = PendingPositions(storage, {vertex_id: position})
+            else:
+                entry.positions.setdefault(vertex_id, position)
+            running = self._thread is not None
+
+        if not running:
+            self.flush_project(project_id)
+
+    def flush(self):
+        with self._lock:
+            project_ids = list(self._entries)
+
+        for project_id in project_ids:
+            self.flush_project(project_id)
+
+    def flush_project(self, project_id: str):
+        with self._flush_lock:
+            with self._lock:
+                entry = self._entries.pop(project_id, None)
+            if entry is None or not entry.positions:
+                return
+
+            start = time.perf_counter()
+            try:
+                self._write(project_id, entry)
+            except ValueError:
+                # The Project got deleted in the meantime
+                logger.warning(f"Discarding {len(entry.positions)} position(s) of deleted Project '{project_id}'")
+                return
+            except Exception:
+                logger.exception(f"Writing positions of Project '{project_id}' failed, retrying with the next flush")
+                with self._lock:
+                    # Positions updated in the meantime are newer and win
+                    newer = self._entries.get(project_id)
+                    if newer is not None:
+                        entry.positions.update(newer.positions)
+                        entry.updates += newer.updates
+                    self._entries[project_id] = entry
+                    self.flush_errors += 1
+                return
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            with self._lock:
+                self.flushes += 1
+                self.last_flush_ms = duration_ms
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='position-flusher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'pending_projects': len(self._entries),
+                'pending_vertices': sum(len(entry.positions) for entry in self._entries.values()),
+                'updates': self.updates,
+                'flushes': self.flushes,
+                'flush_errors': self.flush_errors,
+                'last_flush_ms': self.last_flush_ms
+            }
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    @staticmethod
+    def _write(project_id: str, entry: PendingPositions):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            graph = entry.storage.load_graph(project_id, for_update=True)
+            for vertex_id, (position_x, position_y) in entry.positions.items():
+                try:
+                    graph.move_vertex(vertex_id, position_x, position_y)
+                except VertexNotFoundException:
+                    pass
+
+            changes = graph.pop_changes()
+            if not changes:
+                return
+            try:
+                entry.storage.save_graph(project_id, graph, changes)
+            except VersionConflictException:
+                if attempt == MAX_ATTEMPTS:
+                    raise
+                continue
+
+            return
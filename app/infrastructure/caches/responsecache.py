@@ -0,0 +1,93 @@
+import gzip
+import threading
+from collections import OrderedDict
+
+
+class CachedResponse:
+
+    def __init__(self, version: int, body: bytes, gzip_body: bytes | None = None):
+        self.version = version
+        self.body = body
+        self.gzip_body = gzip_body
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + (len(self.gzip_body) if self.gzip_body is not None else 0)
+
+
+class ResponseCache:
+    # Hint: Entries are only served for the Graph version they got built from, so every save makes them unreachable
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 64 * 1024 * 1024, compress: bool = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.compress = compress
+
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, project_id: str, version: int) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None or entry.version != version:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(project_id)
+            self.hits += 1
+
+            return entry
+
+    def put(self, project_id: str, version: int, body: bytes) -> CachedResponse:
+        # Hint: Compressed once while building the entry, instead of on every request
+        entry = CachedResponse(version, body, gzip.compress(body) if self.compress else None)
+
+        with self._lock:
+            current = self._entries.get(project_id)
+            # A slower request must not replace the response of a newer version
+            if current is not None and current.version > version:
+                return entry
+            self._remove(project_id)
+
+            # Responses which don't fit into the budget at all are not cached
+            if self.max_entries <= 0 or entry.size > self.max_bytes:
+                return entry
+
+            self._entries[project_id] = entry
+            self.size_bytes += entry.size
+
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+                evicted_project_id = next(iter(self._entries))
+                self._remove(evicted_project_id)
+                self.evictions += 1
+
+        return entry
+
+    def invalidate(self, project_id: str):
+        with self._lock:
+            self._remove(project_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self.size_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def _remove(self, project_id: str):
+        entry = self._entries.pop(project_id, None)
+        if entry is not None:
+            self.size_bytes -= entry.size
@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+from typing import Dict, List, TYPE_CHECKING
+
+from app.core.entities import Graph
+from app.core.exceptions import VersionConflictException
+from app.core.valueobjects import GraphChange
+
+if TYPE_CHECKING:
+    from app.infrastructure.storages import IProjectStorage
+
+logger = logging.getLogger(__name__)
+
+
+class DirtyGraph:
+    def __init__(
+            self,
+            storage: 'IProjectStorage',
+            graph: Graph,
+            base_version: int,
+            changes: List[GraphChange] | None,
+            dirty_since: float
+    ):
+        self.storage = storage
+        self.graph = graph
+        self.base_version = base_version
+        # None if the whole Graph has to be written
+        self.changes = changes
+        self.dirty_since = dirty_since
+        self.saves = 1
+
+
+class WriteBehindBuffer:
+    # Buffered Graphs are only visible to this process, so only one process may buffer the writes of a Project
+    def __init__(self, flush_interval: float = 1.0, max_dirty: int = 64, max_unflushed: float = 5.0):
+        self.flush_interval = flush_interval
+        self.max_dirty = max_dirty
+        self.max_unflushed = max_unflushed
+
+        self._entries: Dict[str, DirtyGraph] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes, so the changes of a Project are written in order
+        self._flush_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.saves = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.discarded_graphs = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    def get(self, project_id: str) -> Graph | None:
+        with self._lock:
+            entry = self._entries.get(project_id)
+
+            return entry.graph if entry is not None else None
+
+    def save(
+            self,
+            project_id: str,
+            storage: 'IProjectStorage',
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        expected_version = graph.version if base_version is None else base_version
+        with self._lock:
+            entry = self._entries.get(project_id)
+            current_version = entry.graph.version if entry is not None else storage.get_graph_version(project_id)
+            if current_version != expected_version:
+                raise VersionConflictException(
+                    f'Graph was modified concurrently (expected version {expected_version}, found {current_version})',
+                    current_version
+                )
+
+            if base_version is None:
+                graph.version += 1
+            if entry is None:
+                entry = DirtyGraph(storage, graph, current_version, changes, time.monotonic())
+                self._entries[project_id] = entry
+            else:
+                entry.storage = storage
+                entry.graph = graph
+                entry.changes = None if entry.changes is None or changes is None else entry.changes + changes
+                entry.saves += 1
+            self.saves += 1
+
+            # max_unflushed bounds how long a save may only exist in memory, 0 writes every save through
+            overdue = time.monotonic() - entry.dirty_since >= self.max_unflushed
+            dirty_graphs = len(self._entries)
+
+        if overdue:
+            self.flush_project(project_id)
+        elif dirty_graphs > self.max_dirty:
+            if self._thread is not None:
+                self._wake_event.set()
+            else:
+                self.flush()
+
+    def discard(self, project_id: str):
+        with self._flush_lock, self._lock:
+            self._entries.pop(project_id, None)
+
+    def flush(self):
+        with self._lock:
+            project_ids = list(self._entries)
+
+        for project_id in project_ids:
+            self.flush_project(project_id)
+
+    def flush_project(self, project_id: str):
+        with self._flush_lock:
+            with self._lock:
+                entry = self._entries.get(project_id)
+                if entry is None:
+                    return
+
+                # Saves during the write are based on the flushed version and keep the Graph dirty
+                graph, changes, base_version, saves = entry.graph, entry.changes, entry.base_version, entry.saves
+                dirty_since = entry.dirty_since
+                entry.changes, entry.base_version, entry.saves = [], graph.version, 0
+                entry.dirty_since = time.monotonic()
+
+            start = time.perf_counter()
+            try:
+                entry.storage.save_graph(project_id, graph, changes, base_version)
+            except (VersionConflictException, ValueError):
+                # The Project got modified or deleted by another process, the buffered Graph can't be written anymore
+                logger.error(f"Discarding {saves} unflushed save(s) of Project '{project_id}'", exc_info=True)
+                with self._lock:
+                    self._entries.pop(project_id, None)
+                    self.discarded_graphs += 1
+                return
+            except Exception:
+                logger.exception(f"Flushing Project '{project_id}' failed, retrying with the next flush")
+                with self._lock:
+                    entry.changes = None if changes is None or entry.changes is None else changes + entry.changes
+                    entry.base_version = base_version
+                    entry.saves += saves
+                    entry.dirty_since = dirty_since
+                    self.flush_errors += 1
+                return
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            with self._lock:
+                if entry.graph is graph:
+                    self._entries.pop(project_id, None)
+                self.flushes += 1
+                self.last_flush_ms = duration_ms
+                self.max_flush_ms = max(self.max_flush_ms, duration_ms)
+                self.total_flush_ms += duration_ms
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='write-behind-flusher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._wake_event.set()
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                'dirty_graphs': len(self._entries),
+                'unflushed_saves': sum(entry.saves for entry in self._entries.values()),
+                'oldest_unflushed_ms': max(((now - entry.dirty_since) * 1000 for entry in self._entries.values()),
+                                           default=0.0),
+                'saves': self.saves,
+                'flushes': self.flushes,
+                'flush_errors': self.flush_errors,
+                'discarded_graphs': self.discarded_graphs,
+                'last_flush_ms': self.last_flush_ms,
+                'max_flush_ms': self.max_flush_ms,
+                'avg_flush_ms': self.total_flush_ms / self.flushes if self.flushes > 0 else 0.0
+            }
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.flush_interval)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                return
+
+            self.flush()
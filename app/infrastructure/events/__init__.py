@@ -0,0 +1 @@
+from .changefeed import ChangeFeed, Subscription
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from typing import Dict, List
+
+from app.core.valueobjects import ChangeEvent
+
+
+class Subscription:
+    # Hint: Consumed within the event loop it subscribed from
+
+    def __init__(self, project_id: str, loop: asyncio.AbstractEventLoop, max_pending: int):
+        self.project_id = project_id
+        self.loop = loop
+        self.max_pending = max_pending
+        self.queue: asyncio.Queue[ChangeEvent] = asyncio.Queue()
+
+    async def get(self, timeout: float) -> ChangeEvent | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def push(self, event: ChangeEvent):
+        # Hint: A subscriber which can't keep up only gets told to fetch the Graph again, instead of piling up events
+        if self.queue.qsize() >= self.max_pending:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = ChangeEvent(ChangeEvent.RESET, event.project_id, event.version)
+
+        self.queue.put_nowait(event)
+
+
+class ChangeFeed:
+    # Hint: Only saves of this process get published, other workers are detected by polling the version (see
+    # EVENTS_VERSION_POLL_INTERVAL_MS)
+
+    def __init__(self, max_pending: int = 1000):
+        self.max_pending = max_pending
+
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+        self._lock = threading.Lock()
+
+        self.published = 0
+
+    def subscribe(self, project_id: str) -> Subscription:
+        # Hint: Has to be called from within the event loop which consumes the Subscription
+        subscription = Subscription(project_id, asyncio.get_running_loop(), self.max_pending)
+        with self._lock:
+            self._subscriptions.setdefault(project_id, []).append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.project_id, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.project_id, None)
+
+    def publish(self, event: ChangeEvent):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.project_id, []))
+            self.published += 1
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.push, event)
+            except RuntimeError:
+                # The event loop of the subscriber is closed already
+                self.unsubscribe(subscription)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'projects': len(self._subscriptions),
+                'subscribers': sum(len(subscriptions) for subscriptions in self._subscriptions.values()),
+                'published': self.published
+            }
@@ -0,0 +1 @@
+from .pickletosqlite import migrate_pickle_projects
@@ -0,0 +1,47 @@
+# Imports all Projects stored as pickle files (including not yet compacted journals) into a SQLite database.
+# Usage: python -m app.infrastructure.migrations.pickletosqlite --projects projects --database projects/projects.sqlite3
+import argparse
+from typing import List
+
+from app.core.entities import Project
+from app.infrastructure.adapters import ProjectFolderAdapter, SQLiteAdapter
+from app.infrastructure.storages.project.journalprojectstorage import JournalProjectStorage
+from app.infrastructure.storages.project.sqliteprojectstorage import SQLiteProjectStorage
+
+
+def migrate_pickle_projects(folder_adapter: ProjectFolderAdapter, sqlite_storage: SQLiteProjectStorage) -> List[Project]:
+    pickle_storage = JournalProjectStorage(folder_adapter)
+
+    projects = pickle_storage.get_projects()
+    for project in projects:
+        graph = pickle_storage.load_graph(project.id)
+
+        try:
+            sqlite_storage.get_project(project.id)
+        except ValueError:
+            sqlite_storage.create_project(project)
+        # Hint: The imported Graph replaces whatever is stored, so it is based on the current version
+        graph.version = sqlite_storage.get_graph_version(project.id)
+        sqlite_storage.save_graph(project.id, graph)
+
+    return projects
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import pickled Projects into a SQLite database.')
+    parser.add_argument('--projects', default='projects', help='Folder containing the pickled Projects')
+    parser.add_argument('--database', default='projects/projects.sqlite3', help='Path of the SQLite database')
+    args = parser.parse_args()
+
+    projects = migrate_pickle_projects(
+        ProjectFolderAdapter(project_folder=args.projects),
+        SQLiteProjectStorage(SQLiteAdapter(database=args.database))
+    )
+
+    for project in projects:
+        print(f"Migrated Project '{project.name}' ({project.id})")
+    print(f'Migrated {len(projects)} Project(s)')
+
+
+if __name__ == '__main__':
+    main()
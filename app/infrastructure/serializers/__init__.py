@@ -0,0 +1 @@
+from .graphserializer import GraphSerializer, GraphSerializationException
@@ -0,0 +1,141 @@
+import gc
+import json
+import struct
+from typing import Dict, List, Tuple
+
+from app.core.entities import Datatype, Edge, Graph, Property, Vertex
+
+
+class GraphSerializationException(Exception):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class GraphSerializer:
+    # Hint: Layout is magic | format version | graph version (since format version 2) | JSON body of the tables
+    # [vertices, edges, adjacency], which reference each other by index instead of storing cyclic references
+    MAGIC = b'GSGF'
+    FORMAT_VERSION = 2
+    HEADER = struct.Struct('>4sH')
+    GRAPH_VERSION = struct.Struct('>Q')
+    HEADER_SIZE = HEADER.size + GRAPH_VERSION.size
+    DATATYPES = [Datatype.STRING, Datatype.INT, Datatype.FLOAT, Datatype.BOOLEAN]
+
+    @classmethod
+    def is_serialized_graph(cls, content: bytes) -> bool:
+        return content[:len(cls.MAGIC)] == cls.MAGIC
+
+    @classmethod
+    def serialize(cls, graph: Graph) -> bytes:
+        datatype_codes = {datatype: code for code, datatype in enumerate(cls.DATATYPES)}
+        vertex_indexes: Dict[str, int] = {vertex.id: idx for idx, vertex in enumerate(graph.vertices)}
+        edge_indexes: Dict[str, int] = {edge.id: idx for idx, edge in enumerate(graph.edges)}
+
+        vertices = [
+            [
+                vertex.id,
+                vertex.name,
+                vertex.position_x,
+                vertex.position_y,
+                [[prop.key, int(prop.required), datatype_codes[prop.datatype]] for prop in vertex.properties]
+            ]
+            for vertex in graph.vertices
+        ]
+        edges = [
+            [
+                edge.id,
+                edge.name,
+                int(edge.multi_edge),
+                vertex_indexes[edge.source_vertex.id],
+                vertex_indexes[edge.target_vertex.id],
+                [[prop.key, int(prop.required), datatype_codes[prop.datatype]] for prop in edge.properties]
+            ]
+            for edge in graph.edges
+        ]
+        adjacency = [
+            [[edge_indexes[edge.id] for edge in vertex.out_edges], [edge_indexes[edge.id] for edge in vertex.in_edges]]
+            for vertex in graph.vertices
+        ]
+
+        body = json.dumps([vertices, edges, adjacency], separators=(',', ':'), ensure_ascii=False)
+
+        header = cls.HEADER.pack(cls.MAGIC, cls.FORMAT_VERSION) + cls.GRAPH_VERSION.pack(graph.version)
+
+        return header + body.encode('utf-8')
+
+    @classmethod
+    def read_version(cls, content: bytes) -> int:
+        _, version = cls._read_header(content)
+
+        return version
+
+    @classmethod
+    def deserialize(cls, content: bytes) -> Graph:
+        body_offset, version = cls._read_header(content)
+
+        # Hint: Creating many objects at once repeatedly triggers the cyclic garbage collector, which then
+        # traverses the whole Graph built so far. Nothing collectable is created here, so it is paused.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            graph = cls._build_graph(*json.loads(content[body_offset:]))
+        finally:
+            if gc_enabled:
+                gc.enable()
+        graph.version = version
+
+        return graph
+
+    @classmethod
+    def _read_header(cls, content: bytes) -> Tuple[int, int]:
+        if not cls.is_serialized_graph(content):
+            raise GraphSerializationException('Content is not a serialized Graph')
+        _, format_version = cls.HEADER.unpack_from(content)
+        if format_version > cls.FORMAT_VERSION:
+            raise GraphSerializationException(f'Unsupported Graph format version {format_version}')
+
+        # Hint: Format version 1 had no graph version yet
+        if format_version < 2:
+            return cls.HEADER.size, 0
+        version, = cls.GRAPH_VERSION.unpack_from(content, cls.HEADER.size)
+
+        return cls.HEADER_SIZE, version
+
+    @classmethod
+    def _build_graph(cls, vertex_rows: list, edge_rows: list, adjacency: list) -> Graph:
+        datatypes = cls.DATATYPES
+
+        vertices: List[Vertex] = []
+        for _id, name, position_x, position_y, properties in vertex_rows:
+            vertices.append(Vertex(
+                _id,
+                name,
+                position_x,
+                position_y,
+                [Property(key, bool(required), datatypes[datatype]) for key, required, datatype in properties]
+            ))
+
+        edges: List[Edge] = []
+        for _id, name, multi_edge, source_vertex_idx, target_vertex_idx, properties in edge_rows:
+            edge = Edge(
+                _id,
+                name,
+                [Property(key, bool(required), datatypes[datatype]) for key, required, datatype in properties],
+                bool(multi_edge)
+            )
+            edge.source_vertex = vertices[source_vertex_idx]
+            edge.target_vertex = vertices[target_vertex_idx]
+            edges.append(edge)
+
+        # Rebuild Adjacency in the stored order of connections
+        for vertex, (out_edge_indexes, in_edge_indexes) in zip(vertices, adjacency):
+            vertex.out_edges = [edges[idx] for idx in out_edge_indexes]
+            vertex.in_edges = [edges[idx] for idx in in_edge_indexes]
+
+        graph = Graph()
+        graph.vertices = vertices
+        graph.edges = edges
+        graph.rebuild_indexes()
+
+        return graph
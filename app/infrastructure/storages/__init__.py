@@ -1,6 +1,12 @@
 from .output.outputstorage import OutputStorage
 from .output.outputstorageinterface import IOutputStorage
+from .project.cachedprojectstorage import CachedProjectStorage
+from .project.journalprojectstorage import JournalProjectStorage
 from .project.pickleprojectstorage import PickleProjectStorage
+from .project.projectmanifest import ProjectManifest
 from .project.projectstorageinterface import IProjectStorage
+from .project.publishingprojectstorage import PublishingProjectStorage
+from .project.sqliteprojectstorage import SQLiteProjectStorage
+from .project.writebehindprojectstorage import WriteBehindProjectStorage
 from .template.templatestorage import TemplateStorage
 from .template.templatestorageinterface import ITemplateStorage
@@ -0,0 +1,95 @@
+from typing import Hashable, List
+
+from app.core.entities import Edge, Graph, Project, Vertex
+from app.core.valueobjects import GraphChange
+from app.infrastructure.caches import GraphCache
+from app.infrastructure.storages.project.projectstorageinterface import IProjectStorage
+
+
+class CachedProjectStorage(IProjectStorage):
+    def __init__(self, storage: IProjectStorage, cache: GraphCache):
+        self.storage = storage
+        self.cache = cache
+
+    def get_projects(self) -> List[Project]:
+        return self.storage.get_projects()
+
+    def get_project(self, project_id: str) -> Project:
+        return self.storage.get_project(project_id)
+
+    def create_project(self, project: Project) -> Project:
+        return self.storage.create_project(project)
+
+    def delete_project(self, project_id: str):
+        try:
+            self.storage.delete_project(project_id)
+        finally:
+            self.cache.invalidate(project_id)
+
+    def get_graph_signature(self, project_id: str) -> Hashable:
+        return self.storage.get_graph_signature(project_id)
+
+    def get_graph_version(self, project_id: str) -> int:
+        return self.storage.get_graph_version(project_id)
+
+    def load_graph(self, project_id: str, for_update: bool = False) -> Graph:
+        # Cached Graphs are shared between requests, so mutations need a private instance
+        if for_update:
+            return self.storage.load_graph(project_id, for_update=True)
+
+        # Taken before loading, so a change in between only causes a miss on the next read
+        signature = self._get_signature(project_id)
+        graph = self.cache.get(project_id, signature)
+        if graph is None:
+            graph = self.storage.load_graph(project_id)
+            self.cache.put(project_id, signature, graph)
+
+        return graph
+
+    def load_graph_at_version(self, project_id: str, version: int) -> Graph:
+        graph = self.load_graph(project_id)
+        if graph.version == version:
+            return graph
+
+        return self.storage.load_graph_at_version(project_id, version)
+
+    def load_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+        graph = self._get_cached_graph(project_id)
+        if graph is None:
+            return self.storage.load_vertex(project_id, vertex_id)
+        vertex = graph.find_vertex_by_id(vertex_id)
+
+        return vertex
+
+    def load_edge(self, project_id: str, edge_id: str) -> Edge:
+        graph = self._get_cached_graph(project_id)
+        if graph is None:
+            return self.storage.load_edge(project_id, edge_id)
+        edge = graph.find_edge_by_id(edge_id)
+
+        return edge
+
+    def save_graph(
+            self,
+            project_id: str,
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        try:
+            self.storage.save_graph(project_id, graph, changes, base_version)
+        finally:
+            self.cache.invalidate(project_id)
+
+    def _get_signature(self, project_id: str) -> Hashable:
+        if self.cache.watched:
+            return self.cache.get_generation(project_id)
+
+        return self.storage.get_graph_signature(project_id)
+
+    def _get_cached_graph(self, project_id: str) -> Graph | None:
+        # Storages without element reads load the whole Graph anyway, so it might as well get cached
+        if not self.storage.element_reads:
+            return self.load_graph(project_id)
+
+        return self.cache.get(project_id, self._get_signature(project_id))
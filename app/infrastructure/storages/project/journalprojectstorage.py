@@ -0,0 +1,195 @@
+from typing import Dict, Hashable, List
+
+from app.core.entities import Datatype, Edge, Graph, Project, Property, Vertex
+from app.core.valueobjects import GraphChange
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.storages.project.pickleprojectstorage import PickleProjectStorage
+from app.infrastructure.storages.project.projectmanifest import ProjectManifest
+
+
+class JournalProjectStorage(PickleProjectStorage):
+    # Hint: Saves append their changes to a journal next to the snapshot, which gets compacted once it grows too large
+
+    def __init__(
+            self,
+            folder_adapter: ProjectFolderAdapter,
+            manifest: ProjectManifest | None = None,
+            max_journal_entries: int = 1000,
+            max_journal_bytes: int = 4 * 1024 * 1024
+    ):
+        super().__init__(folder_adapter, manifest)
+        self.max_journal_entries = max_journal_entries
+        self.max_journal_bytes = max_journal_bytes
+
+        # Number of Journal-Records per Project, as far as known from loading the Graph through this instance
+        self._journal_entries: Dict[str, int] = {}
+
+    def get_graph_signature(self, project_id: str) -> Hashable:
+        project = self.get_project(project_id)
+        snapshot_signature = self.folder_adapter.get_file_signature(self.folder_adapter.generate_project_path(project))
+        journal_signature = self.folder_adapter.get_file_signature_if_exists(
+            self.folder_adapter.generate_journal_path(project)
+        )
+
+        return snapshot_signature, journal_signature
+
+    def save_graph(
+            self,
+            project_id: str,
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        project = self.get_project(project_id)
+        with self.folder_adapter.lock_project(project):
+            self._check_version(project, graph.version if base_version is None else base_version)
+            new_version = graph.version + 1 if base_version is None else graph.version
+            if changes is None:
+                previous_version = graph.version
+                graph.version = new_version
+                try:
+                    self._compact(project, graph)
+                except BaseException:
+                    graph.version = previous_version
+                    raise
+                return
+
+            # Hint: Every save ends with a version Record, so the current version is known without a snapshot read
+            journal_path = self.folder_adapter.generate_journal_path(project)
+            records = [self._to_record(change) for change in changes]
+            created = self.folder_adapter.append_journal(
+                journal_path,
+                records + [{'op': 'version', 'version': new_version}],
+                sync=False
+            )
+            graph.version = new_version
+
+            # Compact Journal if it got too large
+            entries = self._journal_entries.get(project_id, 0) + len(records)
+            self._journal_entries[project_id] = entries
+            _, journal_size = self.folder_adapter.get_file_signature(journal_path)
+            if entries >= self.max_journal_entries or journal_size >= self.max_journal_bytes:
+                self._compact(project, graph)
+                return
+
+        # Synced after releasing the lock, so concurrent saves can share their fsyncs
+        self.folder_adapter.sync_journal(journal_path, created)
+
+    def compact(self, project_id: str, graph: Graph):
+        project = self.get_project(project_id)
+        with self.folder_adapter.lock_project(project):
+            self._compact(project, graph)
+
+    ###########
+    # Helpers #
+    ###########
+    def _read_graph_version(self, project: Project) -> int:
+        record = self.folder_adapter.read_last_journal_record(
+            self.folder_adapter.generate_journal_path(project),
+            'version'
+        )
+        if record is not None:
+            return record['version']
+
+        return super()._read_graph_version(project)
+
+    def _read_graph(self, project: Project) -> Graph:
+        graph = super()._read_graph(project)
+        records = self.folder_adapter.read_journal(self.folder_adapter.generate_journal_path(project))
+
+        self._replay_journal(graph, records)
+        graph.pop_changes()
+        self._journal_entries[project.id] = sum(1 for record in records if record['op'] != 'version')
+
+        return graph
+
+    def _read_graph_at_version(self, project: Project, version: int) -> Graph | None:
+        # Hint: The journal holds every version since the last compaction, each ending with its version Record
+        graph = super()._read_graph(project)
+        if graph.version == version:
+            return graph
+        if graph.version > version:
+            return None
+
+        records = self.folder_adapter.read_journal(self.folder_adapter.generate_journal_path(project))
+        self._replay_journal(graph, records, version)
+        if graph.version != version:
+            return None
+        graph.pop_changes()
+
+        return graph
+
+    def _delete_files(self, project: Project):
+        super()._delete_files(project)
+        self.folder_adapter.delete_file_if_exists(self.folder_adapter.generate_journal_path(project))
+
+    def _compact(self, project: Project, graph: Graph):
+        # Hint: If the process dies between writing the snapshot and deleting the journal, the saves in the journal
+        # are skipped when replaying it, as the snapshot has their versions already
+        self._write_snapshot(project, graph)
+        self.folder_adapter.delete_file_if_exists(self.folder_adapter.generate_journal_path(project))
+        self._journal_entries[project.id] = 0
+
+    @staticmethod
+    def _to_record(change: GraphChange) -> dict:
+        if change.action == GraphChange.DELETE:
+            return {'op': f'delete_{change.element_type}', 'id': change.element_id}
+
+        element = change.element
+        record = {
+            'op': f'put_{change.element_type}',
+            'id': element.id,
+            'name': element.name,
+            'properties': [[prop.key, prop.required, prop.datatype] for prop in element.properties]
+        }
+        if change.element_type == GraphChange.VERTEX:
+            record['position_x'] = element.position_x
+            record['position_y'] = element.position_y
+        else:
+            record['multi_edge'] = element.multi_edge
+            record['source_vertex_id'] = element.source_vertex.id
+            record['target_vertex_id'] = element.target_vertex.id
+
+        return record
+
+    @classmethod
+    def _replay_journal(cls, graph: Graph, records: List[dict], until_version: int | None = None):
+        # Replays the Records of every save, which ends with its version Record. Saves the snapshot contains already
+        # (the journal of a compaction which got interrupted before deleting it) and torn saves are skipped.
+        save_records = []
+        for record in records:
+            if record['op'] != 'version':
+                save_records.append(record)
+                continue
+
+            if record['version'] > graph.version:
+                for save_record in save_records:
+                    cls._replay_record(graph, save_record)
+                graph.version = record['version']
+            save_records = []
+            if graph.version == until_version:
+                return
+
+    @staticmethod
+    def _replay_record(graph: Graph, record: dict):
+        op = record['op']
+        properties = [
+            Property(key, required, Datatype(datatype)) for key, required, datatype in record.get('properties', [])
+        ]
+
+        if op == 'put_vertex':
+            vertex = Vertex(record['id'], record['name'], record['position_x'], record['position_y'], properties)
+            if graph.get_vertex(record['id']) is None:
+                graph.add_vertex(vertex)
+            else:
+                graph.update_vertex(record['id'], vertex)
+        elif op == 'delete_vertex':
+            graph.delete_vertex(record['id'])
+        elif op == 'put_edge':
+            edge = Edge(record['id'], record['name'], properties, record['multi_edge'])
+            if graph.get_edge(record['id']) is None:
+                graph.add_edge(edge, record['source_vertex_id'], record['target_vertex_id'])
+            else:
+                graph.update_edge(record['id'], record['source_vertex_id'], record['target_vertex_id'], edge)
+        elif op == 'delete_edge':
+            graph.delete_edge(record['id'])
@@ -1,56 +1,158 @@
-import os
-from typing import List
-
-from app.core.entities import Graph, Project
+from contextlib import contextmanager
+from typing import ContextManager, Hashable, Iterator, List
+
+from app.core.entities import Edge, Graph, Project, Vertex
+from app.core.exceptions import (
+    GraphHistoryUnavailableException,
+    GraphVersionNotFoundException,
+    VersionConflictException
+)
+from app.core.valueobjects import GraphChange
 from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.storages.project.projectmanifest import ProjectManifest
 from app.infrastructure.storages.project.projectstorageinterface import IProjectStorage
 
 
 class PickleProjectStorage(IProjectStorage):
-    def __init__(self, folder_adapter: ProjectFolderAdapter):
+    def __init__(self, folder_adapter: ProjectFolderAdapter, manifest: ProjectManifest | None = None):
         self.folder_adapter = folder_adapter
+        self.manifest = manifest if manifest is not None else ProjectManifest(folder_adapter)
 
     def get_projects(self) -> List[Project]:
-        project_files = self.folder_adapter.get_project_files()
-
-        projects = []
-        for file in project_files:
-            file_name = file.split('.')[0]
-            name, _id = file_name.split('_')
-            projects.append(Project(_id, name))
+        projects = self.manifest.get_projects()
 
         return projects
 
     def get_project(self, project_id: str) -> Project:
-        projects = self.get_projects()
-        for project in projects:
-            if project.id == project_id:
-                return project
+        project = self.manifest.find_project(project_id)
+        if project is None:
+            raise ValueError('Project not found')
 
-        raise ValueError('Project not found')
+        return project
 
     def create_project(self, project: Project) -> Project:
         path = self.folder_adapter.generate_project_path(project)
 
         graph = Graph()
-        self.folder_adapter.write_pickle(path, graph)
+        self.folder_adapter.write_graph(path, graph)
+        self.manifest.add_project(project)
 
         return project
 
     def delete_project(self, project_id: str):
+        project = self.get_project(project_id)
+        with self.folder_adapter.lock_project(project):
+            self._delete_files(project)
+        self.manifest.remove_project(project_id)
+        self.folder_adapter.delete_file_if_exists(self.folder_adapter.generate_lock_path(project))
+
+    def get_graph_signature(self, project_id: str) -> Hashable:
         project = self.get_project(project_id)
         path = self.folder_adapter.generate_project_path(project)
+        signature = self.folder_adapter.get_file_signature(path)
 
-        os.remove(path)
+        return signature
 
-    def load_graph(self, project_id: str) -> Graph:
+    def get_graph_version(self, project_id: str) -> int:
         project = self.get_project(project_id)
-        path = self.folder_adapter.generate_project_path(project)
-        graph = self.folder_adapter.read_pickle(path)
+        with self.folder_adapter.lock_project(project, shared=True):
+            try:
+                version = self._read_graph_version(project)
+            except FileNotFoundError:
+                # The Project got deleted after it was looked up
+                raise ValueError('Project not found')
+
+        return version
+
+    def load_graph(self, project_id: str, for_update: bool = False) -> Graph:
+        project = self.get_project(project_id)
+        with self.folder_adapter.lock_project(project, shared=True):
+            graph = self._read_graph(project)
 
         return graph
 
-    def save_graph(self, project_id: str, graph: Graph):
+    def load_graph_at_version(self, project_id: str, version: int) -> Graph:
         project = self.get_project(project_id)
+        with self.folder_adapter.lock_project(project, shared=True):
+            graph = self._read_graph_at_version(project, version)
+
+        if graph is None:
+            raise GraphVersionNotFoundException(f"Version {version} of the Graph of Project '{project_id}' not found")
+
+        return graph
+
+    def load_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+        graph = self.load_graph(project_id)
+        vertex = graph.find_vertex_by_id(vertex_id)
+
+        return vertex
+
+    def load_edge(self, project_id: str, edge_id: str) -> Edge:
+        graph = self.load_graph(project_id)
+        edge = graph.find_edge_by_id(edge_id)
+
+        return edge
+
+    def save_graph(
+            self,
+            project_id: str,
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        project = self.get_project(project_id)
+        previous_version = graph.version
+        lock = self._lock_for_update(project, graph.version if base_version is None else base_version)
+        if base_version is None:
+            graph.version += 1
+        try:
+            self._write_snapshot(project, graph, lock)
+        except BaseException:
+            graph.version = previous_version
+            raise
+
+    ###########
+    # Helpers #
+    ###########
+    @contextmanager
+    def _lock_for_update(self, project: Project, expected_version: int) -> Iterator[None]:
+        with self.folder_adapter.lock_project(project):
+            self._check_version(project, expected_version)
+            yield
+
+    # Hint: The helpers below expect the caller to hold the lock of the Project
+
+    def _check_version(self, project: Project, expected_version: int):
+        current_version = self._read_graph_version(project)
+        if current_version != expected_version:
+            raise VersionConflictException(
+                f'Graph was modified concurrently (expected version {expected_version}, found {current_version})',
+                current_version
+            )
+
+    def _read_graph_version(self, project: Project) -> int:
+        path = self.folder_adapter.generate_project_path(project)
+
+        return self.folder_adapter.read_graph_version(path)
+
+    def _read_graph(self, project: Project) -> Graph:
         path = self.folder_adapter.generate_project_path(project)
-        self.folder_adapter.write_pickle(path, graph)
+
+        return self.folder_adapter.read_graph(path)
+
+    def _read_graph_at_version(self, project: Project, version: int) -> Graph | None:
+        # Hint: Only the latest version is kept in the snapshot
+        graph = self._read_graph(project)
+        if graph.version > version:
+            raise GraphHistoryUnavailableException(
+                f"Earlier versions of the Graph of Project '{project.id}' are not kept, only version {graph.version}"
+            )
+
+        return graph if graph.version == version else None
+
+    def _write_snapshot(self, project: Project, graph: Graph, lock: ContextManager | None = None):
+        path = self.folder_adapter.generate_project_path(project)
+        self.folder_adapter.write_graph(path, graph, lock)
+
+    def _delete_files(self, project: Project):
+        self.folder_adapter.delete_file(self.folder_adapter.generate_project_path(project))
@@ -0,0 +1,94 @@
+import threading
+from typing import Dict, List, Tuple
+
+from app.core.entities import Project
+from app.infrastructure.adapters import ProjectFolderAdapter
+
+
+class ProjectManifest:
+    # Hint: Changes of other processes are picked up by comparing the signature of the manifest file, or while
+    # watched by the watcher calling invalidate()
+    format_version = 1
+
+    def __init__(self, folder_adapter: ProjectFolderAdapter):
+        self.folder_adapter = folder_adapter
+
+        self._projects: Dict[str, Tuple[str, str]] = {}
+        self._signature: Tuple[int, int] | None = None
+        self._lock = threading.RLock()
+        self.watched = False
+
+    def get_projects(self) -> List[Project]:
+        with self._lock:
+            self._ensure_loaded()
+
+            return [Project(_id, name) for _id, (name, _) in self._projects.items()]
+
+    def find_project(self, project_id: str) -> Project | None:
+        with self._lock:
+            self._ensure_loaded()
+
+            entry = self._projects.get(project_id)
+            if entry is None:
+                return None
+
+            return Project(project_id, entry[0])
+
+    def add_project(self, project: Project):
+        with self._lock, self.folder_adapter.lock_manifest():
+            self._ensure_loaded(manifest_locked=True)
+
+            self._projects[project.id] = (project.name, self.folder_adapter.generate_project_file_name(project))
+            self._write()
+
+    def remove_project(self, project_id: str):
+        with self._lock, self.folder_adapter.lock_manifest():
+            self._ensure_loaded(manifest_locked=True)
+
+            if self._projects.pop(project_id, None) is not None:
+                self._write()
+
+    def rebuild(self):
+        with self._lock, self.folder_adapter.lock_manifest():
+            self._rebuild()
+
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+
+    def _ensure_loaded(self, manifest_locked: bool = False):
+        if self.watched and self._signature is not None and not manifest_locked:
+            return
+
+        signature = self.folder_adapter.get_manifest_signature()
+        if signature is not None and signature == self._signature:
+            return
+
+        manifest = self.folder_adapter.read_manifest() if signature is not None else None
+        if manifest is None or manifest.get('version') != self.format_version:
+            if manifest_locked:
+                self._rebuild()
+            else:
+                self.rebuild()
+            return
+
+        self._projects = {entry['id']: (entry['name'], entry['file']) for entry in manifest['projects']}
+        self._signature = signature
+
+    def _rebuild(self):
+        projects: Dict[str, Tuple[str, str]] = {}
+        for file in sorted(self.folder_adapter.get_project_files()):
+            file_name = file.split('.')[0]
+            name, _id = file_name.split('_')
+            projects[_id] = (name, file)
+
+        self._projects = projects
+        self._write()
+
+    def _write(self):
+        self._signature = self.folder_adapter.write_manifest({
+            'version': self.format_version,
+            'projects': [
+                {'id': _id, 'name': name, 'file': file} for _id, (name, file) in self._projects.items()
+            ]
+        })
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Hashable, List
 
-from app.core.entities import Graph, Project
+from app.core.entities import Edge, Graph, Project, Vertex
+from app.core.valueobjects import GraphChange
 
 
 class IProjectStorage(ABC):
+    # Set by storages whose load_vertex and load_edge don't load the whole Graph
+    element_reads = False
+
     @abstractmethod
     def get_projects(self) -> List[Project]:
         pass
@@ -22,9 +26,38 @@ class IProjectStorage(ABC):
         pass
 
     @abstractmethod
-    def load_graph(self, project_id: str) -> Graph:
+    def get_graph_signature(self, project_id: str) -> Hashable:
+        pass
+
+    @abstractmethod
+    def get_graph_version(self, project_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def load_graph(self, project_id: str, for_update: bool = False) -> Graph:
+        pass
+
+    @abstractmethod
+    def load_graph_at_version(self, project_id: str, version: int) -> Graph:
+        # Hint: Storages which only keep the current version raise a GraphHistoryUnavailableException
+        pass
+
+    @abstractmethod
+    def load_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+        pass
+
+    @abstractmethod
+    def load_edge(self, project_id: str, edge_id: str) -> Edge:
         pass
 
     @abstractmethod
-    def save_graph(self, project_id: str, graph: Graph):
+    def save_graph(
+            self,
+            project_id: str,
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        # Hint: Compare-and-swap against the stored version, which has to equal the version of the Graph (or
+        # base_version, then the Graph keeps its own version instead of getting incremented)
         pass
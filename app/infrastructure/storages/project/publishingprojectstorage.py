@@ -0,0 +1,59 @@
+from typing import Hashable, List
+
+from app.core.entities import Edge, Graph, Project, Vertex
+from app.core.valueobjects import ChangeEvent, GraphChange
+from app.infrastructure.events import ChangeFeed
+from app.infrastructure.storages.project.projectstorageinterface import IProjectStorage
+
+
+class PublishingProjectStorage(IProjectStorage):
+    # Hint: Saves without changes replace the Graph as a whole and get published as a reset
+
+    def __init__(self, storage: IProjectStorage, feed: ChangeFeed):
+        self.storage = storage
+        self.feed = feed
+
+    def get_projects(self) -> List[Project]:
+        return self.storage.get_projects()
+
+    def get_project(self, project_id: str) -> Project:
+        return self.storage.get_project(project_id)
+
+    def create_project(self, project: Project) -> Project:
+        return self.storage.create_project(project)
+
+    def delete_project(self, project_id: str):
+        self.storage.delete_project(project_id)
+        self.feed.publish(ChangeEvent(ChangeEvent.DELETE, project_id))
+
+    def get_graph_signature(self, project_id: str) -> Hashable:
+        return self.storage.get_graph_signature(project_id)
+
+    def get_graph_version(self, project_id: str) -> int:
+        return self.storage.get_graph_version(project_id)
+
+    def load_graph(self, project_id: str, for_update: bool = False) -> Graph:
+        return self.storage.load_graph(project_id, for_update)
+
+    def load_graph_at_version(self, project_id: str, version: int) -> Graph:
+        return self.storage.load_graph_at_version(project_id, version)
+
+    def load_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+        return self.storage.load_vertex(project_id, vertex_id)
+
+    def load_edge(self, project_id: str, edge_id: str) -> Edge:
+        return self.storage.load_edge(project_id, edge_id)
+
+    def save_graph(
+            self,
+            project_id: str,
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        self.storage.save_graph(project_id, graph, changes, base_version)
+
+        if changes is None:
+            self.feed.publish(ChangeEvent(ChangeEvent.RESET, project_id, graph.version))
+        else:
+            self.feed.publish(ChangeEvent(ChangeEvent.CHANGE, project_id, graph.version, changes))
@@ -0,0 +1,351 @@
+import sqlite3
+from typing import Dict, Hashable, Iterable, List
+
+from app.core.entities import Datatype, Edge, Graph, Project, Property, Vertex
+from app.core.exceptions import (
+    EdgeNotFoundException,
+    GraphHistoryUnavailableException,
+    GraphVersionNotFoundException,
+    VersionConflictException,
+    VertexNotFoundException
+)
+from app.core.valueobjects import GraphChange
+from app.infrastructure.adapters import SQLiteAdapter
+from app.infrastructure.storages.project.projectstorageinterface import IProjectStorage
+
+
+class SQLiteProjectStorage(IProjectStorage):
+    # Hint: Saves with changes only touch the rows of the changed elements, without changes the whole Project gets
+    # replaced
+    element_reads = True
+
+    def __init__(self, adapter: SQLiteAdapter):
+        self.adapter = adapter
+
+    ###########
+    # Project #
+    ###########
+    def get_projects(self) -> List[Project]:
+        rows = self.adapter.get_connection().execute('SELECT id, name FROM projects ORDER BY rowid').fetchall()
+
+        return [Project(_id, name) for _id, name in rows]
+
+    def get_project(self, project_id: str) -> Project:
+        row = self.adapter.get_connection().execute(
+            'SELECT id, name FROM projects WHERE id = ?', (project_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError('Project not found')
+
+        return Project(*row)
+
+    def create_project(self, project: Project) -> Project:
+        with self.adapter.transaction() as connection:
+            connection.execute('INSERT INTO projects (id, name) VALUES (?, ?)', (project.id, project.name))
+
+        return project
+
+    def delete_project(self, project_id: str):
+        with self.adapter.transaction() as connection:
+            cursor = connection.execute('DELETE FROM projects WHERE id = ?', (project_id,))
+            if cursor.rowcount == 0:
+                raise ValueError('Project not found')
+
+    #########
+    # Graph #
+    #########
+    def get_graph_signature(self, project_id: str) -> Hashable:
+        row = self.adapter.get_connection().execute(
+            'SELECT revision FROM projects WHERE id = ?', (project_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError('Project not found')
+
+        return row[0]
+
+    def get_graph_version(self, project_id: str) -> int:
+        # Hint: The revision of the Project is its Graph version
+        return self.get_graph_signature(project_id)
+
+    def load_graph(self, project_id: str, for_update: bool = False) -> Graph:
+        connection = self.adapter.get_connection()
+        # Hint: A read transaction makes sure all tables are read from the same state
+        connection.execute('BEGIN')
+        try:
+            version = self.get_graph_version(project_id)
+            vertex_rows = connection.execute(
+                'SELECT id, name, position_x, position_y FROM vertices WHERE project_id = ? ORDER BY rowid',
+                (project_id,)
+            ).fetchall()
+            edge_rows = connection.execute(
+                'SELECT id, name, multi_edge, source_vertex_id, target_vertex_id, out_position, in_position FROM edges '
+                'WHERE project_id = ? ORDER BY rowid',
+                (project_id,)
+            ).fetchall()
+            vertex_properties = self._select_properties(connection, 'vertex', project_id)
+            edge_properties = self._select_properties(connection, 'edge', project_id)
+        finally:
+            connection.execute('COMMIT')
+
+        graph = Graph()
+        for _id, name, position_x, position_y in vertex_rows:
+            graph.add_vertex(Vertex(_id, name, position_x, position_y, vertex_properties.get(_id, [])))
+        for _id, name, multi_edge, source_vertex_id, target_vertex_id, _, _ in edge_rows:
+            edge = Edge(_id, name, edge_properties.get(_id, []), bool(multi_edge))
+            graph.add_edge(edge, source_vertex_id, target_vertex_id)
+        graph.pop_changes()
+        self._sort_connected_edges(graph.vertices, edge_rows)
+        graph.version = version
+
+        return graph
+
+    def load_graph_at_version(self, project_id: str, version: int) -> Graph:
+        # Hint: The rows only hold the latest version of the Graph
+        graph = self.load_graph(project_id)
+        if graph.version > version:
+            raise GraphHistoryUnavailableException(
+                f"Earlier versions of the Graph of Project '{project_id}' are not kept, only version {graph.version}"
+            )
+        if graph.version != version:
+            raise GraphVersionNotFoundException(f"Version {version} of the Graph of Project '{project_id}' not found")
+
+        return graph
+
+    def load_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+        connection = self.adapter.get_connection()
+        connection.execute('BEGIN')
+        try:
+            self.get_project(project_id)
+            vertex_row = connection.execute(
+                'SELECT id, name, position_x, position_y FROM vertices WHERE project_id = ? AND id = ?',
+                (project_id, vertex_id)
+            ).fetchone()
+            if vertex_row is None:
+                raise VertexNotFoundException(f"Vertex with Id '{vertex_id}' not found")
+
+            edge_rows = connection.execute(
+                'SELECT id, name, multi_edge, source_vertex_id, target_vertex_id, out_position, in_position FROM edges '
+                'WHERE project_id = ? AND (source_vertex_id = ? OR target_vertex_id = ?) ORDER BY rowid',
+                (project_id, vertex_id, vertex_id)
+            ).fetchall()
+            vertices = self._select_vertices(connection, project_id, self._connected_vertex_ids(edge_rows) | {vertex_id})
+            edges = self._build_edges(connection, project_id, edge_rows, vertices)
+        finally:
+            connection.execute('COMMIT')
+
+        vertex = vertices[vertex_id]
+        for edge in edges:
+            if edge.source_vertex is vertex:
+                vertex.add_out_edge(edge)
+            if edge.target_vertex is vertex:
+                vertex.add_in_edge(edge)
+        self._sort_connected_edges([vertex], edge_rows)
+
+        return vertex
+
+    def load_edge(self, project_id: str, edge_id: str) -> Edge:
+        connection = self.adapter.get_connection()
+        connection.execute('BEGIN')
+        try:
+            self.get_project(project_id)
+            edge_rows = connection.execute(
+                'SELECT id, name, multi_edge, source_vertex_id, target_vertex_id, out_position, in_position FROM edges '
+                'WHERE project_id = ? AND id = ?',
+                (project_id, edge_id)
+            ).fetchall()
+            if len(edge_rows) == 0:
+                raise EdgeNotFoundException(f"Edge with Id '{edge_id}' not found")
+
+            vertices = self._select_vertices(connection, project_id, self._connected_vertex_ids(edge_rows))
+            edges = self._build_edges(connection, project_id, edge_rows, vertices)
+        finally:
+            connection.execute('COMMIT')
+
+        return edges[0]
+
+    def save_graph(
+            self,
+            project_id: str,
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        expected_version = graph.version if base_version is None else base_version
+        new_version = graph.version + 1 if base_version is None else graph.version
+        with self.adapter.transaction() as connection:
+            cursor = connection.execute(
+                'UPDATE projects SET revision = ? WHERE id = ? AND revision = ?',
+                (new_version, project_id, expected_version)
+            )
+            if cursor.rowcount == 0:
+                current_version = self.get_graph_version(project_id)
+                raise VersionConflictException(
+                    f'Graph was modified concurrently (expected version {expected_version}, found {current_version})',
+                    current_version
+                )
+
+            if changes is None:
+                self._replace_graph(connection, project_id, graph)
+            else:
+                self._apply_changes(connection, project_id, changes)
+        graph.version = new_version
+
+    def _replace_graph(self, connection: sqlite3.Connection, project_id: str, graph: Graph):
+        connection.execute('DELETE FROM vertices WHERE project_id = ?', (project_id,))
+        out_positions, in_positions = {}, {}
+        for vertex in graph.vertices:
+            self._upsert_vertex(connection, project_id, vertex)
+            out_positions.update((edge.id, idx) for idx, edge in enumerate(vertex.out_edges))
+            in_positions.update((edge.id, idx) for idx, edge in enumerate(vertex.in_edges))
+        for edge in graph.edges:
+            self._upsert_edge(connection, project_id, edge, out_positions[edge.id], in_positions[edge.id])
+
+    def _apply_changes(self, connection: sqlite3.Connection, project_id: str, changes: List[GraphChange]):
+        for change in changes:
+            if change.element_type == GraphChange.VERTEX and change.action == GraphChange.PUT:
+                self._upsert_vertex(connection, project_id, change.element)
+            elif change.element_type == GraphChange.VERTEX and change.action == GraphChange.DELETE:
+                connection.execute(
+                    'DELETE FROM vertices WHERE project_id = ? AND id = ?', (project_id, change.element_id)
+                )
+            elif change.element_type == GraphChange.EDGE and change.action == GraphChange.PUT:
+                self._upsert_edge(connection, project_id, change.element)
+            elif change.element_type == GraphChange.EDGE and change.action == GraphChange.DELETE:
+                connection.execute(
+                    'DELETE FROM edges WHERE project_id = ? AND id = ?', (project_id, change.element_id)
+                )
+
+    ###########
+    # Helpers #
+    ###########
+    @staticmethod
+    def _connected_vertex_ids(edge_rows: Iterable[tuple]) -> set:
+        vertex_ids = set()
+        for _, _, _, source_vertex_id, target_vertex_id, _, _ in edge_rows:
+            vertex_ids.add(source_vertex_id)
+            vertex_ids.add(target_vertex_id)
+
+        return vertex_ids
+
+    @staticmethod
+    def _select_properties(
+            connection: sqlite3.Connection,
+            element_type: str,
+            project_id: str,
+            element_ids: Iterable[str] | None = None
+    ) -> Dict[str, List[Property]]:
+        query = (f'SELECT {element_type}_id, key, required, datatype FROM {element_type}_properties '
+                 f'WHERE project_id = ?')
+        parameters = [project_id]
+        if element_ids is not None:
+            element_ids = list(element_ids)
+            query += f" AND {element_type}_id IN ({', '.join('?' * len(element_ids))})"
+            parameters += element_ids
+        query += f' ORDER BY {element_type}_id, position'
+
+        properties: Dict[str, List[Property]] = {}
+        for element_id, key, required, datatype in connection.execute(query, parameters):
+            properties.setdefault(element_id, []).append(Property(key, bool(required), Datatype(datatype)))
+
+        return properties
+
+    def _select_vertices(self, connection: sqlite3.Connection, project_id: str, vertex_ids: set) -> Dict[str, Vertex]:
+        vertex_ids = list(vertex_ids)
+        rows = connection.execute(
+            f"SELECT id, name, position_x, position_y FROM vertices "
+            f"WHERE project_id = ? AND id IN ({', '.join('?' * len(vertex_ids))})",
+            [project_id, *vertex_ids]
+        ).fetchall()
+        properties = self._select_properties(connection, 'vertex', project_id, vertex_ids)
+
+        return {
+            _id: Vertex(_id, name, position_x, position_y, properties.get(_id, []))
+            for _id, name, position_x, position_y in rows
+        }
+
+    def _build_edges(
+            self,
+            connection: sqlite3.Connection,
+            project_id: str,
+            edge_rows: List[tuple],
+            vertices: Dict[str, Vertex]
+    ) -> List[Edge]:
+        properties = self._select_properties(connection, 'edge', project_id, [row[0] for row in edge_rows])
+
+        edges = []
+        for _id, name, multi_edge, source_vertex_id, target_vertex_id, _, _ in edge_rows:
+            edge = Edge(_id, name, properties.get(_id, []), bool(multi_edge))
+            edge.source_vertex = vertices[source_vertex_id]
+            edge.target_vertex = vertices[target_vertex_id]
+            edges.append(edge)
+
+        return edges
+
+    @staticmethod
+    def _upsert_vertex(connection: sqlite3.Connection, project_id: str, vertex: Vertex):
+        # Hint: An Upsert keeps the rowid of existing rows, which defines the order of the Vertices
+        connection.execute(
+            'INSERT INTO vertices (project_id, id, name, position_x, position_y) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (project_id, id) DO UPDATE SET '
+            'name = excluded.name, position_x = excluded.position_x, position_y = excluded.position_y',
+            (project_id, vertex.id, vertex.name, vertex.position_x, vertex.position_y)
+        )
+        connection.execute(
+            'DELETE FROM vertex_properties WHERE project_id = ? AND vertex_id = ?', (project_id, vertex.id)
+        )
+        connection.executemany(
+            'INSERT INTO vertex_properties (project_id, vertex_id, position, key, required, datatype) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            [(project_id, vertex.id, idx, prop.key, prop.required, prop.datatype)
+             for idx, prop in enumerate(vertex.properties)]
+        )
+
+    @staticmethod
+    def _sort_connected_edges(vertices: Iterable[Vertex], edge_rows: List[tuple]):
+        # Restores the order in which the Edges got connected to the Vertices
+        out_positions = {row[0]: row[5] for row in edge_rows}
+        in_positions = {row[0]: row[6] for row in edge_rows}
+        for vertex in vertices:
+            vertex.out_edges.sort(key=lambda e: out_positions[e.id])
+            vertex.in_edges.sort(key=lambda e: in_positions[e.id])
+
+    @staticmethod
+    def _upsert_edge(
+            connection: sqlite3.Connection,
+            project_id: str,
+            edge: Edge,
+            out_position: int | None = None,
+            in_position: int | None = None
+    ):
+        # Hint: Updating an Edge (re)connects it as last Edge of its Vertices, like Graph.update_edge does
+        if out_position is None:
+            out_position = connection.execute(
+                'SELECT COALESCE(MAX(out_position), -1) + 1 FROM edges WHERE project_id = ? AND source_vertex_id = ?',
+                (project_id, edge.source_vertex.id)
+            ).fetchone()[0]
+        if in_position is None:
+            in_position = connection.execute(
+                'SELECT COALESCE(MAX(in_position), -1) + 1 FROM edges WHERE project_id = ? AND target_vertex_id = ?',
+                (project_id, edge.target_vertex.id)
+            ).fetchone()[0]
+
+        connection.execute(
+            'INSERT INTO edges '
+            '(project_id, id, name, multi_edge, source_vertex_id, target_vertex_id, out_position, in_position) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (project_id, id) DO UPDATE SET '
+            'name = excluded.name, multi_edge = excluded.multi_edge, '
+            'source_vertex_id = excluded.source_vertex_id, target_vertex_id = excluded.target_vertex_id, '
+            'out_position = excluded.out_position, in_position = excluded.in_position',
+            (project_id, edge.id, edge.name, edge.multi_edge, edge.source_vertex.id, edge.target_vertex.id,
+             out_position, in_position)
+        )
+        connection.execute(
+            'DELETE FROM edge_properties WHERE project_id = ? AND edge_id = ?', (project_id, edge.id)
+        )
+        connection.executemany(
+            'INSERT INTO edge_properties (project_id, edge_id, position, key, required, datatype) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            [(project_id, edge.id, idx, prop.key, prop.required, prop.datatype)
+             for idx, prop in enumerate(edge.properties)]
+        )
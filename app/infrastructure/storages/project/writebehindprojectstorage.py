@@ -0,0 +1,87 @@
+from typing import Hashable, List
+
+from app.core.entities import Edge, Graph, Project, Vertex
+from app.core.exceptions import GraphHistoryUnavailableException, GraphVersionNotFoundException
+from app.core.valueobjects import GraphChange
+from app.infrastructure.caches import WriteBehindBuffer
+from app.infrastructure.storages.project.projectstorageinterface import IProjectStorage
+
+
+class WriteBehindProjectStorage(IProjectStorage):
+    def __init__(self, storage: IProjectStorage, buffer: WriteBehindBuffer):
+        self.storage = storage
+        self.buffer = buffer
+
+    def get_projects(self) -> List[Project]:
+        return self.storage.get_projects()
+
+    def get_project(self, project_id: str) -> Project:
+        return self.storage.get_project(project_id)
+
+    def create_project(self, project: Project) -> Project:
+        return self.storage.create_project(project)
+
+    def delete_project(self, project_id: str):
+        self.buffer.discard(project_id)
+        self.storage.delete_project(project_id)
+
+    def get_graph_signature(self, project_id: str) -> Hashable:
+        graph = self.buffer.get(project_id)
+        if graph is not None:
+            return 'write-behind', graph.version
+
+        return self.storage.get_graph_signature(project_id)
+
+    def get_graph_version(self, project_id: str) -> int:
+        graph = self.buffer.get(project_id)
+        if graph is not None:
+            return graph.version
+
+        return self.storage.get_graph_version(project_id)
+
+    def load_graph(self, project_id: str, for_update: bool = False) -> Graph:
+        graph = self.buffer.get(project_id)
+        if graph is None:
+            return self.storage.load_graph(project_id, for_update)
+
+        return graph.copy() if for_update else graph
+
+    def load_graph_at_version(self, project_id: str, version: int) -> Graph:
+        # Only the newest unflushed version is kept
+        graph = self.buffer.get(project_id)
+        if graph is not None and graph.version == version:
+            return graph
+
+        try:
+            return self.storage.load_graph_at_version(project_id, version)
+        except GraphVersionNotFoundException:
+            # Versions between the stored and the buffered one got coalesced and were never written
+            if graph is not None and graph.version > version:
+                raise GraphHistoryUnavailableException(
+                    f"Earlier versions of the Graph of Project '{project_id}' are not kept, only version {graph.version}"
+                )
+            raise
+
+    def load_vertex(self, project_id: str, vertex_id: str) -> Vertex:
+        graph = self.buffer.get(project_id)
+        if graph is None:
+            return self.storage.load_vertex(project_id, vertex_id)
+
+        return graph.find_vertex_by_id(vertex_id)
+
+    def load_edge(self, project_id: str, edge_id: str) -> Edge:
+        graph = self.buffer.get(project_id)
+        if graph is None:
+            return self.storage.load_edge(project_id, edge_id)
+
+        return graph.find_edge_by_id(edge_id)
+
+    def save_graph(
+            self,
+            project_id: str,
+            graph: Graph,
+            changes: List[GraphChange] | None = None,
+            base_version: int | None = None
+    ):
+        # The buffer keeps the Graph itself, so the caller must not mutate it afterwards
+        self.buffer.save(project_id, self.storage, graph, changes, base_version)
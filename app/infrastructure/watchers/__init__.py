@@ -0,0 +1 @@
+from .cacheinvalidationwatcher import CacheInvalidationWatcher
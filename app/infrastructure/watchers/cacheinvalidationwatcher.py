@@ -0,0 +1,123 @@
+import logging
+import os
+import threading
+from typing import Callable, List, Set
+
+import watchfiles
+
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.caches import GraphCache
+from app.infrastructure.storages import ProjectManifest
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationWatcher:
+    PROJECT_FILE_EXTENSIONS = ('.pickle', '.journal')
+    IGNORED_FILE_EXTENSIONS = ('.tmp', '.lock')
+
+    def __init__(
+            self,
+            project_folder_adapter: ProjectFolderAdapter,
+            graph_cache: GraphCache,
+            manifest: ProjectManifest,
+            debounce_ms: int = 50
+    ):
+        self.project_folder_adapter = project_folder_adapter
+        self.graph_cache = graph_cache
+        self.manifest = manifest
+        self.debounce_ms = debounce_ms
+
+        self._project_listeners: List[Callable[[str], None]] = []
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def project_folder(self) -> str:
+        return os.path.realpath(os.path.join(os.getcwd(), self.project_folder_adapter.project_folder))
+
+    @property
+    def watching(self) -> bool:
+        return self.graph_cache.watched
+
+    def add_project_listener(self, listener: Callable[[str], None]):
+        self._project_listeners.append(listener)
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        os.makedirs(self.project_folder, exist_ok=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='cache-invalidation-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+
+        self._set_watched(False)
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def handle_changes(self, paths: Set[str]):
+        for path in paths:
+            path = os.path.realpath(path)
+            folder, file_name = os.path.split(path)
+
+            if folder == self.project_folder:
+                self._handle_project_folder_change(file_name)
+
+    def _handle_project_folder_change(self, file_name: str):
+        if file_name == self.project_folder_adapter.manifest_file_name:
+            self.manifest.invalidate()
+            return
+
+        stem, extension = os.path.splitext(file_name)
+        if extension in self.PROJECT_FILE_EXTENSIONS:
+            project_id = stem.rsplit('_', 1)[-1]
+            self.graph_cache.invalidate(project_id)
+            self._notify(project_id)
+        else:
+            # Not a file of a single Project (e.g. the SQLite database)
+            self.graph_cache.clear()
+
+    def _notify(self, project_id: str):
+        for listener in self._project_listeners:
+            try:
+                listener(project_id)
+            except Exception:
+                logger.exception('Cache invalidation listener failed')
+
+    def _set_watched(self, watched: bool):
+        # Entries cached while not watching may be outdated already
+        self.graph_cache.clear()
+        self.manifest.invalidate()
+        self.graph_cache.watched = watched
+        self.manifest.watched = watched
+
+    def _run(self):
+        try:
+            # yield_on_timeout: the first, possibly empty, batch shows that the watcher is active
+            for changes in watchfiles.watch(
+                    self.project_folder,
+                    watch_filter=self._filter,
+                    debounce=self.debounce_ms,
+                    step=min(self.debounce_ms, 50),
+                    rust_timeout=1000,
+                    yield_on_timeout=True,
+                    stop_event=self._stop_event,
+                    raise_interrupt=False
+            ):
+                if not self.watching:
+                    self._set_watched(True)
+                self.handle_changes({path for _, path in changes})
+        except Exception:
+            logger.exception('Cache invalidation watcher stopped, falling back to signature checks')
+        finally:
+            if self.watching:
+                self._set_watched(False)
+
+    def _filter(self, change: watchfiles.Change, path: str) -> bool:
+        return not path.endswith(self.IGNORED_FILE_EXTENSIONS)
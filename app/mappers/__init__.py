@@ -1,5 +1,8 @@
+from .batchmapper import BatchMapper
 from .buildmapper import BuildMapper
+from .changeeventmapper import ChangeEventMapper
 from .edgemapper import EdgeMapper
+from .graphdiffmapper import GraphDiffMapper
 from .graphmapper import GraphMapper
 from .mapper import Mapper
 from .projectmapper import ProjectMapper
@@ -0,0 +1,41 @@
+import uuid
+
+from app.api.dto import BatchOperationRequestDto, BatchResultResponseDto
+from app.core.valueobjects import BatchCommand
+from app.mappers.edgemapper import EdgeMapper
+from app.mappers.mapper import Mapper
+from app.mappers.vertexmapper import VertexMapper
+
+
+class BatchMapper(Mapper):
+    @staticmethod
+    def to_entity(dto: BatchOperationRequestDto) -> BatchCommand:
+        element_id = str(dto.id) if dto.id is not None else str(uuid.uuid4())
+
+        if dto.vertex is not None:
+            return BatchCommand(dto.element_type.value, dto.action.value, element_id, VertexMapper.to_entity(dto.vertex))
+        if dto.edge is not None:
+            return BatchCommand(
+                dto.element_type.value,
+                dto.action.value,
+                element_id,
+                EdgeMapper.to_entity(dto.edge),
+                str(dto.edge.source_vertex_id),
+                str(dto.edge.target_vertex_id)
+            )
+
+        return BatchCommand(dto.element_type.value, dto.action.value, element_id)
+
+    @staticmethod
+    def to_dto(entity: BatchCommand) -> BatchResultResponseDto:
+        result_dto = BatchResultResponseDto(
+            action=entity.action,
+            element_type=entity.element_type,
+            id=entity.element_id
+        )
+        if entity.element is not None and entity.element_type == BatchCommand.VERTEX:
+            result_dto.vertex = VertexMapper.to_dto(entity.element)
+        elif entity.element is not None:
+            result_dto.edge = EdgeMapper.to_dto(entity.element)
+
+        return result_dto
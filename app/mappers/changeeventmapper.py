@@ -0,0 +1,42 @@
+import json
+
+from app.core.valueobjects import ChangeEvent, GraphChange
+from app.mappers.edgemapper import EdgeMapper
+from app.mappers.graphmapper import GraphMapper
+from app.mappers.mapper import Mapper
+from app.mappers.vertexmapper import VertexMapper
+
+
+class ChangeEventMapper(Mapper):
+    @staticmethod
+    def to_entity(dto):
+        raise NotImplementedError()
+
+    @staticmethod
+    def to_dto(entity: ChangeEvent) -> dict:
+        data = {'version': entity.version}
+        if entity.kind == ChangeEvent.CHANGE:
+            data['changes'] = [ChangeEventMapper._change_to_dto(change) for change in entity.changes]
+
+        return data
+
+    @staticmethod
+    def to_sse(entity: ChangeEvent) -> str:
+        # Hint: The version is the id of the event, so a reconnecting client reports the last version it has seen
+        lines = [f'event: {entity.kind}']
+        if entity.version is not None:
+            lines.insert(0, f'id: {entity.version}')
+        lines.append(f"data: {json.dumps(ChangeEventMapper.to_dto(entity), separators=(',', ':'))}")
+
+        return '\n'.join(lines) + '\n\n'
+
+    @staticmethod
+    def _change_to_dto(change: GraphChange) -> dict:
+        change_dto = {'type': change.element_type, 'action': change.action, 'id': change.element_id}
+        # Hint: Only the fields needed to re-create the element, e.g. no embedded Edges of a Vertex
+        if change.action == GraphChange.PUT and change.element_type == GraphChange.VERTEX:
+            change_dto['element'] = VertexMapper.to_partial_dto(change.element, GraphMapper.EXPORT_VERTEX_FIELDS)
+        elif change.action == GraphChange.PUT and change.element_type == GraphChange.EDGE:
+            change_dto['element'] = EdgeMapper.to_partial_dto(change.element, GraphMapper.EXPORT_EDGE_FIELDS)
+
+        return change_dto
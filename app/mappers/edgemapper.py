@@ -1,8 +1,8 @@
 import uuid
-from typing import List
+from typing import List, Set
 
 from app.api.dto import EdgeRequestDto, EdgeResponseDto, PropertyDto
-from app.core.entities import Edge, Property
+from app.core.entities import Datatype, Edge, Property
 from app.mappers.mapper import Mapper
 
 
@@ -11,7 +11,7 @@ class EdgeMapper(Mapper):
     def to_entity(dto: EdgeRequestDto) -> Edge:
         properties: List[Property] = []
         for prop in dto.properties:
-            properties.append(Property(key=prop.key, required=prop.required, datatype=prop.datatype))
+            properties.append(Property(key=prop.key, required=prop.required, datatype=Datatype(prop.datatype)))
 
         edge_entity = Edge(
             _id=str(uuid.uuid4()),
@@ -38,3 +38,17 @@ class EdgeMapper(Mapper):
         )
 
         return edge_dto
+
+    @staticmethod
+    def to_partial_dto(entity: Edge, fields: Set[str]) -> dict:
+        getters = {
+            'name': lambda: entity.name,
+            'properties': lambda: [PropertyDto(key=prop.key, required=prop.required, datatype=prop.datatype)
+                                   .model_dump(mode='json') for prop in entity.properties],
+            'multi_edge': lambda: entity.multi_edge,
+            'source_vertex_id': lambda: entity.source_vertex.id,
+            'target_vertex_id': lambda: entity.target_vertex.id,
+            'id': lambda: entity.id
+        }
+
+        return {field: getter() for field, getter in getters.items() if field in fields}
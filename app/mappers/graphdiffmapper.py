@@ -0,0 +1,29 @@
+from app.api.dto import DifferenceResponseDto, GraphDiffResponseDto
+from app.core.valueobjects import GraphDiff
+from app.mappers.mapper import Mapper
+
+
+class GraphDiffMapper(Mapper):
+    @staticmethod
+    def to_entity(dto):
+        raise NotImplementedError()
+
+    @staticmethod
+    def to_dto(entity: GraphDiff) -> GraphDiffResponseDto:
+        graph_diff_dto = GraphDiffResponseDto(
+            base_version=entity.old_version,
+            version=entity.new_version,
+            differences=[
+                DifferenceResponseDto(
+                    element_type=difference.element_type,
+                    kind=difference.kind,
+                    element_id=difference.element_id,
+                    name=difference.name,
+                    old_value=difference.old_value,
+                    new_value=difference.new_value
+                )
+                for difference in entity.differences
+            ]
+        )
+
+        return graph_diff_dto
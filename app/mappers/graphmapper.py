@@ -1,11 +1,20 @@
-from app.api.dto import GraphResponseDto
-from app.core.entities import Graph
+import json
+from itertools import chain, islice
+from typing import Iterator, List, Tuple
+
+from app.api.dto import GraphRequestDto, GraphResponseDto
+from app.core.entities import Edge, Graph, Vertex
 from app.mappers.edgemapper import EdgeMapper
 from app.mappers.mapper import Mapper
 from app.mappers.vertexmapper import VertexMapper
 
 
 class GraphMapper(Mapper):
+    # Hint: The fields of the import DTOs, so exported elements can be imported again
+    EXPORT_VERTEX_FIELDS = {'id', 'name', 'position_x', 'position_y', 'properties'}
+    EXPORT_EDGE_FIELDS = {'id', 'name', 'properties', 'multi_edge', 'source_vertex_id', 'target_vertex_id'}
+    NDJSON_CHUNK_SIZE = 256
+
     @staticmethod
     def to_entity(dto):
         raise NotImplementedError()
@@ -18,3 +27,39 @@ class GraphMapper(Mapper):
         )
 
         return graph_dto
+
+    @staticmethod
+    def to_elements(dto: GraphRequestDto) -> Tuple[List[Vertex], List[Tuple[Edge, str, str]]]:
+        # Hint: Not a Graph yet, the elements only get validated and connected by the ImportOperation
+        vertices: List[Vertex] = []
+        for vertex_dto in dto.vertices:
+            vertex = VertexMapper.to_entity(vertex_dto)
+            vertex.id = str(vertex_dto.id)
+            vertices.append(vertex)
+
+        edges: List[Tuple[Edge, str, str]] = []
+        for edge_dto in dto.edges:
+            edge = EdgeMapper.to_entity(edge_dto)
+            edge.id = str(edge_dto.id)
+            edges.append((edge, str(edge_dto.source_vertex_id), str(edge_dto.target_vertex_id)))
+
+        return vertices, edges
+
+    @staticmethod
+    def to_ndjson(entity: Graph) -> Iterator[bytes]:
+        # Hint: Yields the Vertices and then the Edges as one JSON object per line, a chunk of lines at a time, so
+        # only a single chunk is held in memory besides the Graph itself
+        vertex_fields, edge_fields = GraphMapper.EXPORT_VERTEX_FIELDS, GraphMapper.EXPORT_EDGE_FIELDS
+        lines = chain(
+            (GraphMapper._to_ndjson_line('vertex', VertexMapper.to_partial_dto(vertex, vertex_fields))
+             for vertex in entity.vertices),
+            (GraphMapper._to_ndjson_line('edge', EdgeMapper.to_partial_dto(edge, edge_fields))
+             for edge in entity.edges)
+        )
+
+        while chunk := b''.join(islice(lines, GraphMapper.NDJSON_CHUNK_SIZE)):
+            yield chunk
+
+    @staticmethod
+    def _to_ndjson_line(element_type: str, values: dict) -> bytes:
+        return (json.dumps({'type': element_type, **values}, separators=(',', ':')) + '\n').encode()
@@ -1,4 +1,5 @@
 import uuid
+from typing import Set
 
 from app.api.dto import ProjectRequestDto, ProjectResponseDto
 from app.core.entities import Project
@@ -23,3 +24,12 @@ class ProjectMapper(Mapper):
         )
 
         return project_dto
+
+    @staticmethod
+    def to_partial_dto(entity: Project, fields: Set[str]) -> dict:
+        getters = {
+            'name': lambda: entity.name,
+            'id': lambda: entity.id
+        }
+
+        return {field: getter() for field, getter in getters.items() if field in fields}
@@ -1,8 +1,8 @@
 import uuid
-from typing import List
+from typing import List, Set
 
 from app.api.dto import VertexRequestDto, VertexResponseDto, PropertyDto
-from app.core.entities import Vertex, Property
+from app.core.entities import Datatype, Vertex, Property
 from app.mappers.edgemapper import EdgeMapper
 from app.mappers.mapper import Mapper
 
@@ -12,7 +12,7 @@ class VertexMapper(Mapper):
     def to_entity(dto: VertexRequestDto) -> Vertex:
         properties: List[Property] = []
         for prop in dto.properties:
-            properties.append(Property(key=prop.key, required=prop.required, datatype=prop.datatype))
+            properties.append(Property(key=prop.key, required=prop.required, datatype=Datatype(prop.datatype)))
 
         vertex_entity = Vertex(
             _id=str(uuid.uuid4()),
@@ -41,3 +41,19 @@ class VertexMapper(Mapper):
         )
 
         return vertex_dto
+
+    @staticmethod
+    def to_partial_dto(entity: Vertex, fields: Set[str]) -> dict:
+        # Hint: Only the selected fields get mapped, e.g. a list of names and positions builds no Edge-DTOs
+        getters = {
+            'name': lambda: entity.name,
+            'position_x': lambda: entity.position_x,
+            'position_y': lambda: entity.position_y,
+            'properties': lambda: [PropertyDto(key=prop.key, required=prop.required, datatype=prop.datatype)
+                                   .model_dump(mode='json') for prop in entity.properties],
+            'id': lambda: entity.id,
+            'out_edges': lambda: [EdgeMapper.to_dto(out_edge).model_dump(mode='json') for out_edge in entity.out_edges],
+            'in_edges': lambda: [EdgeMapper.to_dto(in_edge).model_dump(mode='json') for in_edge in entity.in_edges]
+        }
+
+        return {field: getter() for field, getter in getters.items() if field in fields}
@@ -0,0 +1,41 @@
+import os
+
+# Graph Cache
+GRAPH_CACHE_MAX_ENTRIES = int(os.getenv('GRAPH_CACHE_MAX_ENTRIES', '64'))
+GRAPH_CACHE_MAX_BYTES = int(os.getenv('GRAPH_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+
+# Response Cache (serialized Graph responses, '1' also keeps a gzip-compressed copy)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '64'))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+RESPONSE_CACHE_GZIP = os.getenv('RESPONSE_CACHE_GZIP', '1') == '1'
+
+# Project Storage ('pickle', 'journal' or 'sqlite')
+PROJECT_STORAGE = os.getenv('PROJECT_STORAGE', 'pickle')
+SQLITE_DATABASE = os.getenv('SQLITE_DATABASE', 'projects/projects.sqlite3')
+JOURNAL_MAX_ENTRIES = int(os.getenv('JOURNAL_MAX_ENTRIES', '1000'))
+JOURNAL_MAX_BYTES = int(os.getenv('JOURNAL_MAX_BYTES', str(4 * 1024 * 1024)))
+
+# Project File Durability ('always', 'group' or 'never')
+PROJECT_FILE_SYNC = os.getenv('PROJECT_FILE_SYNC', 'always')
+GROUP_COMMIT_WINDOW_MS = int(os.getenv('GROUP_COMMIT_WINDOW_MS', '5'))
+
+# Cache Invalidation Watcher ('1' enables watching the project and output folders)
+CACHE_INVALIDATION_WATCHER = os.getenv('CACHE_INVALIDATION_WATCHER', '1') == '1'
+CACHE_INVALIDATION_DEBOUNCE_MS = int(os.getenv('CACHE_INVALIDATION_DEBOUNCE_MS', '50'))
+
+# Write Mode ('through' writes every save to the Project Storage, 'behind' buffers saves in memory and writes them
+# in the background, which is only safe with a single worker process)
+PROJECT_WRITE_MODE = os.getenv('PROJECT_WRITE_MODE', 'through')
+WRITE_BEHIND_FLUSH_INTERVAL_MS = int(os.getenv('WRITE_BEHIND_FLUSH_INTERVAL_MS', '1000'))
+WRITE_BEHIND_MAX_DIRTY = int(os.getenv('WRITE_BEHIND_MAX_DIRTY', '64'))
+# Durability: Upper bound for how long a saved Graph may only exist in memory ('0' writes every save through)
+WRITE_BEHIND_MAX_UNFLUSHED_MS = int(os.getenv('WRITE_BEHIND_MAX_UNFLUSHED_MS', '5000'))
+
+# Position Updates (moves of Vertices within this interval are coalesced into a single save, '0' writes every move)
+POSITION_FLUSH_INTERVAL_MS = int(os.getenv('POSITION_FLUSH_INTERVAL_MS', '100'))
+
+# Change Events (server-sent events of saved Graph changes, a comment keeps idle connections open)
+EVENTS_MAX_PENDING = int(os.getenv('EVENTS_MAX_PENDING', '1000'))
+EVENTS_KEEPALIVE_INTERVAL_MS = int(os.getenv('EVENTS_KEEPALIVE_INTERVAL_MS', '15000'))
+# Saves of other worker processes aren't published, streams poll the version and send a reset ('0' disables polling)
+EVENTS_VERSION_POLL_INTERVAL_MS = int(os.getenv('EVENTS_VERSION_POLL_INTERVAL_MS', '1000'))
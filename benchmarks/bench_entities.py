@@ -0,0 +1,107 @@
+"""
+Measures the memory per Vertex, Edge and Property and the time of a full BuildService.build_project.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_entities --vertices 200 1000
+"""
+import argparse
+import shutil
+import tempfile
+import time
+import tracemalloc
+import uuid
+from typing import List
+
+from app.core.entities import Build, Edge, Project, Property, Vertex
+from app.core.entities.property import Datatype
+from app.core.repositories import GraphRepository, OutputRepository, ProjectRepository, TemplateRepository
+from app.core.services import BuildService
+from app.infrastructure.adapters import OutputFolderAdapter, ProjectFolderAdapter, TemplateFolderAdapter
+from app.infrastructure.storages import OutputStorage, PickleProjectStorage, TemplateStorage
+from benchmarks.bench_graph_serialization import build_graph
+
+
+def measure_memory(create, count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    elements = [create(idx) for idx in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Hint: The list holding the elements is not part of the elements
+    return (after - before) / len(elements) - 8
+
+
+EDGE_NAMES = ['out_type_name', 'in_type_name', 'logic_input_name', 'order_by_input_name', 'manipulate_input_name',
+              'property_name', 'out_field_name', 'in_field_name']
+VERTEX_NAMES = ['type_name', 'logic_input_name', 'order_by_input_name', 'manipulate_input_name', 'property_name',
+                'name_lower']
+
+
+def create_vertex(idx: int, names: List[str]) -> Vertex:
+    vertex = Vertex(str(uuid.uuid4()), f'Vertex{idx}', idx, idx, [])
+    for name in names:
+        getattr(vertex, name)
+
+    return vertex
+
+
+def create_edge(idx: int, names: List[str]) -> Edge:
+    edge = Edge(str(uuid.uuid4()), f'edge{idx}', [], True)
+    edge.source_vertex = create_vertex(idx, [])
+    edge.target_vertex = create_vertex(idx, [])
+    for name in names:
+        getattr(edge, name)
+
+    return edge
+
+
+def measure_build(vertex_count: int, repeat: int) -> float:
+    folder = tempfile.mkdtemp()
+    try:
+        storage = PickleProjectStorage(ProjectFolderAdapter(project_folder=folder))
+        project = storage.create_project(Project(str(uuid.uuid4()), 'Benchmark'))
+        storage.save_graph(project.id, build_graph(vertex_count))
+
+        build_service = BuildService(
+            GraphRepository(storage),
+            ProjectRepository(storage),
+            TemplateRepository(TemplateStorage(TemplateFolderAdapter())),
+            OutputRepository(OutputStorage(OutputFolderAdapter(output_folder=f'{folder}/outputs')))
+        )
+
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            build_service.build_project(project.id, Build(4000, None))
+            best = min(best, time.perf_counter() - start)
+
+        return best
+    finally:
+        shutil.rmtree(folder)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the memory and build time of the entities.')
+    parser.add_argument('--vertices', type=int, nargs='+', default=[200, 1000])
+    parser.add_argument('--elements', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Hint: Edges are measured together with their two Vertices, which are subtracted afterwards. The derived names
+    # are used by every build, so they are measured once without and once with names derived
+    print(f"{'element':>8} {'bytes':>7} {'bytes with names':>17}")
+    for element, create, names in [('vertex', create_vertex, VERTEX_NAMES), ('edge', create_edge, EDGE_NAMES)]:
+        vertex_bytes = 2 * measure_memory(lambda idx: create_vertex(idx, []), args.elements) if element == 'edge' else 0
+        print(f'{element:>8} {measure_memory(lambda idx: create(idx, []), args.elements) - vertex_bytes:>7.0f} '
+              f'{measure_memory(lambda idx: create(idx, names), args.elements) - vertex_bytes:>17.0f}')
+    property_bytes = measure_memory(lambda idx: Property(f'prop{idx}', True, Datatype.STRING), args.elements)
+    print(f"{'property':>8} {property_bytes:>7.0f}")
+
+    print(f"{'vertices':>8} {'build ms':>9}")
+    for vertex_count in args.vertices:
+        print(f'{vertex_count:>8} {measure_build(vertex_count, args.repeat) * 1000:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
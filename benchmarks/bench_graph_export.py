@@ -0,0 +1,51 @@
+"""
+Compares the peak memory of building the GET /graph response with streaming the NDJSON export.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_graph_export --vertices 1000 5000 10000
+"""
+import argparse
+import time
+import tracemalloc
+
+from app.mappers import GraphMapper
+from benchmarks.bench_graph_serialization import build_graph
+
+
+def measure_peak(function) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = function()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size, peak, duration
+
+
+def build_response(graph) -> int:
+    return len(GraphMapper.to_dto(graph).model_dump_json().encode())
+
+
+def stream_export(graph) -> int:
+    # Hint: Like a StreamingResponse, every chunk is dropped once it got sent
+    return sum(len(chunk) for chunk in GraphMapper.to_ndjson(graph))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the streaming NDJSON export of a Graph.')
+    parser.add_argument('--vertices', type=int, nargs='+', default=[1000, 5000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'vertices':>8} {'edges':>7} {'mode':>8} {'bytes':>10} {'peak KiB':>10} {'ms':>8}")
+    for vertex_count in args.vertices:
+        graph = build_graph(vertex_count)
+
+        for mode, function in [('response', build_response), ('ndjson', stream_export)]:
+            size, peak, duration = measure_peak(lambda: function(graph))
+            print(f'{vertex_count:>8} {len(graph.edges):>7} {mode:>8} {size:>10} {peak / 1024:>10.0f} '
+                  f'{duration * 1000:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
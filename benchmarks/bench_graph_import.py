@@ -0,0 +1,80 @@
+"""
+Compares importing a whole Graph with one request against creating every Vertex and Edge with its own request.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_graph_import --vertices 100 500
+"""
+import argparse
+import shutil
+import tempfile
+import time
+import uuid
+
+from app.core.entities import Edge, Project, Property, Vertex
+from app.core.operations import ImportOperation
+from app.core.repositories import EdgeRepository, GraphRepository, VertexRepository
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.storages import PickleProjectStorage
+from benchmarks.bench_graph_serialization import build_graph
+
+
+def copy_elements(vertex_count: int) -> tuple:
+    # Hint: Fresh entities for every run, as adding them to a Graph connects them
+    graph = build_graph(vertex_count)
+    vertices = [Vertex(vertex.id, vertex.name, vertex.position_x, vertex.position_y,
+                       [Property(prop.key, prop.required, prop.datatype) for prop in vertex.properties])
+                for vertex in graph.vertices]
+    edges = [(Edge(edge.id, edge.name, [Property(prop.key, prop.required, prop.datatype) for prop in edge.properties],
+                   edge.multi_edge), edge.source_vertex.id, edge.target_vertex.id)
+             for edge in graph.edges]
+
+    return vertices, edges
+
+
+def measure_single_requests(storage: PickleProjectStorage, project_id: str, vertices: list, edges: list) -> float:
+    vertex_repository, edge_repository = VertexRepository(storage), EdgeRepository(storage)
+
+    start = time.perf_counter()
+    for vertex in vertices:
+        vertex_repository.create_vertex(project_id, vertex)
+    for edge, source_vertex_id, target_vertex_id in edges:
+        edge_repository.create_edge(project_id, edge, source_vertex_id, target_vertex_id)
+
+    return time.perf_counter() - start
+
+
+def measure_import(storage: PickleProjectStorage, project_id: str, vertices: list, edges: list) -> float:
+    start = time.perf_counter()
+    graph = ImportOperation.build_graph(vertices, edges)
+    GraphRepository(storage).replace_graph(project_id, graph)
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the bulk import of a Graph.')
+    parser.add_argument('--vertices', type=int, nargs='+', default=[100, 500])
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+    try:
+        storage = PickleProjectStorage(ProjectFolderAdapter(project_folder=folder))
+
+        print(f"{'vertices':>8} {'edges':>7} {'requests':>9} {'single ms':>10} {'import ms':>10} {'speedup':>8}")
+        for vertex_count in args.vertices:
+            vertices, edges = copy_elements(vertex_count)
+            project = storage.create_project(Project(str(uuid.uuid4()), f'Single{vertex_count}'))
+            single_time = measure_single_requests(storage, project.id, vertices, edges)
+
+            vertices, edges = copy_elements(vertex_count)
+            project = storage.create_project(Project(str(uuid.uuid4()), f'Import{vertex_count}'))
+            import_time = measure_import(storage, project.id, vertices, edges)
+
+            print(f'{vertex_count:>8} {len(edges):>7} {len(vertices) + len(edges):>9} {single_time * 1000:>10.1f} '
+                  f'{import_time * 1000:>10.1f} {single_time / import_time:>7.0f}x')
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    main()
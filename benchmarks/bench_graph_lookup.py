@@ -0,0 +1,78 @@
+"""
+Compares the Id-indexes of the Graph with a linear scan (the previous lookup) for growing Graphs.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_graph_lookup --elements 10 100 1000 10000 50000
+"""
+import argparse
+import random
+import time
+import uuid
+
+from app.core.entities import Graph, Vertex, Edge
+
+
+def build_graph(element_count: int, seed: int = 42) -> Graph:
+    # Hint: The collections are filled directly, so building large Graphs doesn't depend on the validation cost
+    rnd = random.Random(seed)
+    graph = Graph()
+
+    vertices = [Vertex(str(uuid.UUID(int=rnd.getrandbits(128))), f'Vertex{idx}', idx, idx, [])
+                for idx in range(element_count)]
+    for vertex in vertices:
+        graph.vertices.append(vertex)
+
+    for idx in range(element_count):
+        source, target = rnd.choice(vertices), rnd.choice(vertices)
+        edge = Edge(str(uuid.UUID(int=rnd.getrandbits(128))), f'edge{idx}', [], True)
+        edge.source_vertex = source
+        edge.target_vertex = target
+        source.add_out_edge(edge)
+        target.add_in_edge(edge)
+        graph.edges.append(edge)
+
+    graph.rebuild_indexes()
+
+    return graph
+
+
+def scan(elements: list, element_id: str):
+    for element in elements:
+        if element.id == element_id:
+            return element
+
+    return None
+
+
+def measure(function, ids: list) -> float:
+    start = time.perf_counter()
+    for element_id in ids:
+        function(element_id)
+
+    return (time.perf_counter() - start) / len(ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Vertex and Edge lookups by Id.')
+    parser.add_argument('--elements', type=int, nargs='+', default=[10, 100, 1000, 10000, 50000])
+    parser.add_argument('--lookups', type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'elements':>8} {'kind':>7} {'scan us':>10} {'index us':>10} {'speedup':>9}")
+    for element_count in args.elements:
+        graph = build_graph(element_count)
+        rnd = random.Random(element_count)
+
+        for kind, elements, find in [
+            ('vertex', list(graph.vertices), graph.find_vertex_by_id),
+            ('edge', list(graph.edges), graph.find_edge_by_id),
+        ]:
+            ids = [rnd.choice(elements).id for _ in range(args.lookups)]
+            scan_time = measure(lambda element_id: scan(elements, element_id), ids)
+            index_time = measure(find, ids)
+            print(f'{element_count:>8} {kind:>7} {scan_time * 1e6:>10.2f} {index_time * 1e6:>10.2f} '
+                  f'{scan_time / index_time:>8.0f}x')
+
+
+if __name__ == '__main__':
+    main()
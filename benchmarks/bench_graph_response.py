@@ -0,0 +1,37 @@
+"""
+Compares building the JSON body of GET /graph from the Graph with serving it from the ResponseCache.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_graph_response --vertices 500 2000 5000
+"""
+import argparse
+
+from app.infrastructure.caches import ResponseCache
+from app.mappers import GraphMapper
+from benchmarks.bench_graph_serialization import build_graph, measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cached Graph responses.')
+    parser.add_argument('--vertices', type=int, nargs='+', default=[500, 2000, 5000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'vertices':>8} {'edges':>7} {'bytes':>10} {'gzip bytes':>10} {'build ms':>9} {'gzip ms':>9} "
+          f"{'cached ms':>9}")
+    for vertex_count in args.vertices:
+        graph = build_graph(vertex_count)
+        cache = ResponseCache(max_bytes=1024 * 1024 * 1024)
+
+        build_time = measure(lambda: GraphMapper.to_dto(graph).model_dump_json().encode(), args.repeat)
+        body = GraphMapper.to_dto(graph).model_dump_json().encode()
+        gzip_time = measure(lambda: cache.put('1', graph.version, body), args.repeat)
+        entry = cache.put('1', graph.version, body)
+        cached_time = measure(lambda: cache.get('1', graph.version), args.repeat)
+
+        print(f'{vertex_count:>8} {len(graph.edges):>7} {len(entry.body):>10} {len(entry.gzip_body):>10} '
+              f'{build_time * 1000:>9.1f} {gzip_time * 1000:>9.1f} {cached_time * 1000:>9.3f}')
+
+
+if __name__ == '__main__':
+    main()
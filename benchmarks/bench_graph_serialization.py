@@ -0,0 +1,80 @@
+"""
+Compares the GraphSerializer with pickle (the previous project file format) in size, save and load time.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_graph_serialization --vertices 500 2000 5000
+"""
+import argparse
+import pickle
+import random
+import sys
+import time
+import uuid
+
+from app.core.entities import Graph, Vertex, Edge, Property
+from app.core.entities.property import Datatype
+from app.infrastructure.serializers import GraphSerializer
+
+
+def build_graph(vertex_count: int, edges_per_vertex: int = 2, seed: int = 42) -> Graph:
+    rnd = random.Random(seed)
+    graph = Graph()
+
+    vertices = []
+    for idx in range(vertex_count):
+        vertex = Vertex(str(uuid.UUID(int=rnd.getrandbits(128), version=4)), f'Vertex{idx}', idx, idx,
+                        [Property(f'prop{prop_idx}', True, Datatype.STRING) for prop_idx in range(3)])
+        graph.add_vertex(vertex)
+        vertices.append(vertex)
+
+    for idx in range(vertex_count * edges_per_vertex):
+        source, target = rnd.choice(vertices), rnd.choice(vertices)
+        graph.add_edge(Edge(str(uuid.UUID(int=rnd.getrandbits(128), version=4)), f'edge{idx}',
+                            [Property('weight', False, Datatype.INT)], True), source.id, target.id)
+
+    graph.pop_changes()
+
+    return graph
+
+
+def measure(function, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Graph serialization formats.')
+    parser.add_argument('--vertices', type=int, nargs='+', default=[500, 2000, 5000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # Hint: Pickle recurses along the Vertex/Edge references and fails on larger Graphs with the default limit
+    sys.setrecursionlimit(1_000_000)
+
+    print(f"{'vertices':>8} {'edges':>7} {'format':>8} {'bytes':>10} {'save ms':>9} {'load ms':>9}")
+    for vertex_count in args.vertices:
+        graph = build_graph(vertex_count)
+
+        pickled = pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL)
+        serialized = GraphSerializer.serialize(graph)
+        results = [
+            ('pickle', len(pickled),
+             measure(lambda: pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL), args.repeat),
+             measure(lambda: pickle.loads(pickled), args.repeat)),
+            ('gsgf', len(serialized),
+             measure(lambda: GraphSerializer.serialize(graph), args.repeat),
+             measure(lambda: GraphSerializer.deserialize(serialized), args.repeat)),
+        ]
+
+        for name, size, save_time, load_time in results:
+            print(f'{vertex_count:>8} {len(graph.edges):>7} {name:>8} {size:>10} '
+                  f'{save_time * 1000:>9.1f} {load_time * 1000:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
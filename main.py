@@ -1,9 +1,34 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routes import project_router, vertex_router, edge_router, graph_router, build_router
+from app.api.dependencies import Container
+from app.api.routes import (
+    project_router,
+    vertex_router,
+    edge_router,
+    graph_router,
+    build_router,
+    batch_router,
+    event_router,
+    diagnostics_router
+)
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # Hint: The adapters, caches and storages live as long as the app, the routes get them from app.state.container
+    container = Container()
+    application.state.container = container
+    container.start()
+    try:
+        yield
+    finally:
+        container.stop()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -11,6 +36,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Hint: Cross-origin clients can only read listed headers, the designer needs them for If-Match and pagination
+    expose_headers=["ETag", "X-Total-Count"],
 )
 
 app.include_router(project_router, prefix="/api/v1")
@@ -18,3 +45,6 @@ app.include_router(vertex_router, prefix='/api/v1')
 app.include_router(edge_router, prefix="/api/v1")
 app.include_router(graph_router, prefix="/api/v1")
 app.include_router(build_router, prefix="/api/v1")
+app.include_router(batch_router, prefix="/api/v1")
+app.include_router(event_router, prefix="/api/v1")
+app.include_router(diagnostics_router, prefix="/api/v1")
@@ -0,0 +1,229 @@
+import asyncio
+import os
+import shutil
+import unittest
+import uuid
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+
+        # Create Vertex
+        vertex_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+            'name': 'Person',
+            'position_x': 10,
+            'position_y': 20,
+            'properties': []
+        })
+        self.person_vertex = vertex_res.json()
+        self.etag = vertex_res.headers.get('ETag')
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def apply_batch(self, operations: list, headers: dict | None = None):
+        return self.client.post(f"/api/v1/projects/{self.project.get('id')}/batch", json={'operations': operations},
+                                headers=headers)
+
+    def get_vertex_names(self) -> list:
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices")
+
+        return [vertex.get('name') for vertex in response.json()]
+
+    def test_with_valid_operations(self):
+        # Arrange
+        hobby_id = str(uuid.uuid4())
+        operations = [
+            {
+                'action': 'create',
+                'element_type': 'vertex',
+                'id': hobby_id,
+                'vertex': {'name': 'Hobby', 'position_x': 0, 'position_y': 0, 'properties': []}
+            },
+            {
+                'action': 'create',
+                'element_type': 'edge',
+                'edge': {
+                    'name': 'performs',
+                    'properties': [],
+                    'multi_edge': False,
+                    'source_vertex_id': self.person_vertex.get('id'),
+                    'target_vertex_id': hobby_id
+                }
+            },
+            {
+                'action': 'update',
+                'element_type': 'vertex',
+                'id': self.person_vertex.get('id'),
+                'vertex': {'name': 'Student', 'position_x': 50, 'position_y': 60, 'properties': []}
+            }
+        ]
+
+        # Act
+        response = self.apply_batch(operations, {'If-Match': self.etag})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get('ETag'), '"2"')
+        results = response.json().get('results')
+        self.assertEqual(results[0].get('id'), hobby_id)
+        self.assertEqual(results[1].get('edge').get('target_vertex_id'), hobby_id)
+        self.assertEqual(results[2].get('vertex').get('position_x'), 50)
+        self.assertEqual(self.get_vertex_names(), ['Student', 'Hobby'])
+
+    def test_with_swapped_names(self):
+        # Arrange
+        hobby_id = str(uuid.uuid4())
+        operations = [
+            {
+                'action': 'create',
+                'element_type': 'vertex',
+                'id': hobby_id,
+                'vertex': {'name': 'Hobby', 'position_x': 0, 'position_y': 0, 'properties': []}
+            },
+            *[
+                {
+                    'action': 'update',
+                    'element_type': 'vertex',
+                    'id': vertex_id,
+                    'vertex': {'name': name, 'position_x': 0, 'position_y': 0, 'properties': []}
+                }
+                for vertex_id, name in [(self.person_vertex.get('id'), 'Tmp'), (hobby_id, 'Person'),
+                                        (self.person_vertex.get('id'), 'Hobby')]
+            ]
+        ]
+
+        # Act
+        response = self.apply_batch(operations)
+        app.state.container.graph_cache.clear()
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result.get('vertex').get('name') for result in response.json().get('results')],
+            ['Hobby', 'Tmp', 'Person', 'Hobby']
+        )
+        self.assertEqual(self.get_vertex_names(), ['Hobby', 'Person'])
+
+    def test_with_delete(self):
+        # Act
+        response = self.apply_batch([
+            {'action': 'delete', 'element_type': 'vertex', 'id': self.person_vertex.get('id')}
+        ])
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get('results'), [
+            {'action': 'delete', 'element_type': 'vertex', 'id': self.person_vertex.get('id'), 'vertex': None,
+             'edge': None}
+        ])
+        self.assertEqual(self.get_vertex_names(), [])
+
+    def test_with_failing_operation(self):
+        # Act
+        response = self.apply_batch([
+            {
+                'action': 'create',
+                'element_type': 'vertex',
+                'vertex': {'name': 'Hobby', 'position_x': 0, 'position_y': 0, 'properties': []}
+            },
+            {
+                'action': 'create',
+                'element_type': 'vertex',
+                'vertex': {'name': 'person', 'position_x': 0, 'position_y': 0, 'properties': []}
+            }
+        ])
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json().get('detail')[0].get('loc'), ['body', 'operations', 1, 'vertex', 'name'])
+        self.assertEqual(self.get_vertex_names(), ['Person'])
+
+    def test_with_duplicate_edge_id(self):
+        # Arrange
+        hobby_id = str(uuid.uuid4())
+        edge_id = str(uuid.uuid4())
+        operations = [
+            {
+                'action': 'create',
+                'element_type': 'vertex',
+                'id': hobby_id,
+                'vertex': {'name': 'Hobby', 'position_x': 0, 'position_y': 0, 'properties': []}
+            },
+            {
+                'action': 'create',
+                'element_type': 'edge',
+                'id': edge_id,
+                'edge': {
+                    'name': 'performs',
+                    'properties': [],
+                    'multi_edge': False,
+                    'source_vertex_id': self.person_vertex.get('id'),
+                    'target_vertex_id': hobby_id
+                }
+            },
+            {
+                'action': 'create',
+                'element_type': 'edge',
+                'id': edge_id,
+                'edge': {
+                    'name': 'performed_by',
+                    'properties': [],
+                    'multi_edge': False,
+                    'source_vertex_id': hobby_id,
+                    'target_vertex_id': self.person_vertex.get('id')
+                }
+            }
+        ]
+
+        # Act
+        response = self.apply_batch(operations)
+
+        # Assert
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json().get('detail')[0].get('loc'), ['body', 'operations', 2, 'edge', 'id'])
+        self.assertEqual(self.get_vertex_names(), ['Person'])
+
+    def test_with_unknown_element(self):
+        # Act
+        response = self.apply_batch([
+            {'action': 'delete', 'element_type': 'edge', 'id': str(uuid.uuid4())}
+        ])
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json().get('detail')[0].get('loc'), ['body', 'operations', 0])
+
+    def test_with_missing_element(self):
+        # Act
+        response = self.apply_batch([
+            {'action': 'update', 'element_type': 'vertex', 'id': self.person_vertex.get('id')}
+        ])
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
+
+    def test_with_outdated_if_match(self):
+        # Act
+        response = self.apply_batch([
+            {'action': 'delete', 'element_type': 'vertex', 'id': self.person_vertex.get('id')}
+        ], {'If-Match': '"0"'})
+
+        # Assert
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.get_vertex_names(), ['Person'])
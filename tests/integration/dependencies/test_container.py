@@ -0,0 +1,70 @@
+import asyncio
+import os
+import shutil
+import unittest
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import Container
+from app.api.dependencies.dependencies import get_project_storage
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.storages import PickleProjectStorage
+from main import app
+
+
+class TestContainer(unittest.TestCase):
+    def setUp(self):
+        # Setup Project Folders
+        self.dir_path = os.path.join(os.getcwd(), 'projects')
+        self.override_dir_path = os.path.join(os.getcwd(), 'projects_override')
+        os.mkdir(self.dir_path)
+        os.mkdir(self.override_dir_path)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+        # Delete Folders
+        shutil.rmtree(self.dir_path)
+        shutil.rmtree(self.override_dir_path)
+
+    def test_lifespan_shares_container(self):
+        # Arrange
+        with TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop}) as client:
+            container = app.state.container
+
+            # Act
+            project_res = client.post('/api/v1/projects', json={'name': 'Test-Project'})
+            get_res = client.get(f"/api/v1/projects/{project_res.json().get('id')}")
+
+            # Assert
+            self.assertEqual(project_res.status_code, 200)
+            self.assertEqual(get_res.status_code, 200)
+            self.assertIs(app.state.container, container)
+            self.assertIsNotNone(container.position_buffer._thread)
+
+        self.assertIsNone(container.position_buffer._thread)
+
+    def test_without_lifespan_creates_container(self):
+        # Arrange
+        client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Act
+        res = client.get('/api/v1/projects')
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        self.assertIsInstance(app.state.container, Container)
+
+    def test_with_overridden_storage(self):
+        # Arrange
+        storage = PickleProjectStorage(ProjectFolderAdapter(project_folder='projects_override'))
+        app.dependency_overrides[get_project_storage] = lambda: storage
+        client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Act
+        res = client.post('/api/v1/projects', json={'name': 'Test-Project'})
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len([f for f in os.listdir(self.override_dir_path) if f.endswith('.pickle')]), 1)
+        self.assertEqual(len([f for f in os.listdir(self.dir_path) if f.endswith('.pickle')]), 0)
@@ -0,0 +1,47 @@
+import asyncio
+import os
+import shutil
+import unittest
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestGetDiagnostics(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def test_with_loaded_graph(self):
+        # Arrange
+        before = self.client.get('/api/v1/diagnostics').json()
+        self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices")
+        self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices")
+
+        # Act
+        response = self.client.get('/api/v1/diagnostics')
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.json()),
+            {'graph_cache', 'response_cache', 'write_behind_buffer', 'position_buffer', 'change_feed',
+             'group_committer'}
+        )
+        graph_cache = response.json().get('graph_cache')
+        self.assertGreater(graph_cache.get('hits') + graph_cache.get('misses'),
+                           before['graph_cache']['hits'] + before['graph_cache']['misses'])
+        self.assertIn('avg_flush_ms', response.json().get('write_behind_buffer'))
@@ -67,3 +67,26 @@ class TestEdgeCreate(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 1)
         self.assertEqual(response.json()[0].get('id'), self.performs_edge.get('id'))
+
+    def test_with_pagination_and_fields(self):
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/edges",
+                                   params={'limit': 1, 'fields': 'id,source_vertex_id,target_vertex_id'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{
+            'source_vertex_id': self.person_vertex.get('id'),
+            'target_vertex_id': self.hobby_vertex.get('id'),
+            'id': self.performs_edge.get('id')
+        }])
+        self.assertEqual(response.headers.get('X-Total-Count'), '1')
+
+    def test_with_offset_beyond_end(self):
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/edges", params={'offset': 5})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+        self.assertEqual(response.headers.get('X-Total-Count'), '1')
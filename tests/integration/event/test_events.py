@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+import time
+import unittest
+import uuid
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.entities import Vertex
+from main import app
+
+
+class TestProjectEvents(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+        self.project_url = f"/api/v1/projects/{self.project.get('id')}"
+        self.change_feed = app.state.container.change_feed
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def listen(self, headers: dict | None = None) -> tuple:
+        # Hint: The stream ends with the deletion of the Project, so the whole response can be read at once
+        result = {}
+        subscribers = self.change_feed.stats().get('subscribers')
+        thread = threading.Thread(
+            target=lambda: result.update(res=self.client.get(f'{self.project_url}/events', headers=headers))
+        )
+        thread.start()
+
+        deadline = time.monotonic() + 5
+        while self.change_feed.stats().get('subscribers') == subscribers and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        return thread, result
+
+    @staticmethod
+    def parse_events(body: str) -> list:
+        events = []
+        for block in body.strip().split('\n\n'):
+            fields = dict(line.split(': ', 1) for line in block.splitlines() if not line.startswith(':'))
+            events.append((fields.get('event'), fields.get('id'), json.loads(fields.get('data'))))
+
+        return events
+
+    def test_with_changes(self):
+        # Arrange
+        thread, result = self.listen()
+
+        # Act
+        vertex_res = self.client.post(f'{self.project_url}/vertices', json={
+            'name': 'Person',
+            'position_x': 10,
+            'position_y': 20,
+            'properties': []
+        })
+        self.client.delete(f"{self.project_url}/vertices/{vertex_res.json().get('id')}")
+        self.client.delete(self.project_url)
+        thread.join(timeout=10)
+
+        # Assert
+        res = result.get('res')
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.headers.get('Content-Type').startswith('text/event-stream'))
+        events = self.parse_events(res.text)
+        self.assertEqual([event[0] for event in events], ['change', 'change', 'delete'])
+        self.assertEqual(events[0][1], vertex_res.headers.get('ETag').strip('"'))
+        self.assertEqual(events[0][2].get('changes'), [{
+            'type': 'vertex',
+            'action': 'put',
+            'id': vertex_res.json().get('id'),
+            'element': {
+                'name': 'Person',
+                'position_x': 10,
+                'position_y': 20,
+                'properties': [],
+                'id': vertex_res.json().get('id')
+            }
+        }])
+        self.assertEqual(events[1][2].get('changes'), [{
+            'type': 'vertex',
+            'action': 'delete',
+            'id': vertex_res.json().get('id')
+        }])
+        self.assertEqual(self.change_feed.stats().get('subscribers'), 0)
+
+    def test_with_import(self):
+        # Arrange
+        thread, result = self.listen()
+
+        # Act
+        self.client.put(f'{self.project_url}/graph', json={'vertices': [], 'edges': []})
+        self.client.delete(self.project_url)
+        thread.join(timeout=10)
+
+        # Assert
+        events = self.parse_events(result.get('res').text)
+        self.assertEqual([event[0] for event in events], ['reset', 'delete'])
+
+    def test_with_outdated_last_event_id(self):
+        # Arrange
+        etag = self.client.get(f'{self.project_url}/graph').headers.get('ETag')
+        self.client.post(f'{self.project_url}/vertices', json={
+            'name': 'Person',
+            'position_x': 10,
+            'position_y': 20,
+            'properties': []
+        })
+        thread, result = self.listen(headers={'Last-Event-ID': etag.strip('"')})
+
+        # Act
+        self.client.delete(self.project_url)
+        thread.join(timeout=10)
+
+        # Assert
+        events = self.parse_events(result.get('res').text)
+        self.assertEqual([event[0] for event in events], ['reset', 'delete'])
+
+    @patch('app.settings.EVENTS_VERSION_POLL_INTERVAL_MS', 20)
+    def test_with_save_of_other_process(self):
+        # Arrange
+        thread, result = self.listen()
+        # Hint: The stream reads the current version right after subscribing
+        time.sleep(0.2)
+        # Hint: The wrapped storage saves without publishing, like another worker process would
+        storage = app.state.container.project_storage.storage
+        graph = storage.load_graph(self.project.get('id'), for_update=True)
+        graph.add_vertex(Vertex(str(uuid.uuid4()), 'Person', 0, 0, []))
+        storage.save_graph(self.project.get('id'), graph, graph.pop_changes())
+
+        # Act
+        time.sleep(0.5)
+        self.client.delete(self.project_url)
+        thread.join(timeout=10)
+
+        # Assert
+        events = self.parse_events(result.get('res').text)
+        self.assertEqual([event[0] for event in events], ['reset', 'delete'])
+        self.assertEqual(events[0][1], str(graph.version))
+
+    @patch('app.settings.EVENTS_VERSION_POLL_INTERVAL_MS', 20)
+    def test_with_published_changes_and_polling(self):
+        # Arrange
+        thread, result = self.listen()
+
+        # Act
+        for name in ['Person', 'Hobby', 'Sport']:
+            self.client.post(f'{self.project_url}/vertices', json={
+                'name': name,
+                'position_x': 10,
+                'position_y': 20,
+                'properties': []
+            })
+            time.sleep(0.05)
+        self.client.delete(self.project_url)
+        thread.join(timeout=10)
+
+        # Assert
+        events = self.parse_events(result.get('res').text)
+        self.assertEqual([event[0] for event in events], ['change', 'change', 'change', 'delete'])
+
+    def test_with_unknown_project(self):
+        # Act
+        res = self.client.get('/api/v1/projects/unknown/events')
+
+        # Assert
+        self.assertEqual(res.status_code, 404)
+        self.assertEqual(self.change_feed.stats().get('subscribers'), 0)
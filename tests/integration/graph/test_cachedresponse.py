@@ -0,0 +1,81 @@
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import unittest
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestGraphCachedResponse(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+        self.url = f"/api/v1/projects/{self.project.get('id')}/graph"
+
+        # Create Vertex
+        self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+            'name': 'Person',
+            'position_x': 10,
+            'position_y': 20,
+            'properties': [{'key': 'name', 'required': True, 'datatype': 'String'}]
+        })
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def test_with_repeated_reads(self):
+        # Arrange
+        first_res = self.client.get(self.url, headers={'Accept-Encoding': 'identity'})
+
+        # Act
+        second_res = self.client.get(self.url, headers={'Accept-Encoding': 'identity'})
+
+        # Assert
+        self.assertEqual(second_res.status_code, 200)
+        self.assertEqual(second_res.content, first_res.content)
+        self.assertEqual(second_res.headers.get('ETag'), first_res.headers.get('ETag'))
+        self.assertEqual(second_res.headers.get('Content-Type'), 'application/json')
+        self.assertIsNone(second_res.headers.get('Content-Encoding'))
+        self.assertEqual(second_res.json().get('vertices')[0].get('name'), 'Person')
+
+    def test_with_gzip(self):
+        # Act
+        res = self.client.get(self.url, headers={'Accept-Encoding': 'gzip, deflate'})
+        plain_res = self.client.get(self.url, headers={'Accept-Encoding': 'identity'})
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.headers.get('Content-Encoding'), 'gzip')
+        self.assertEqual(res.headers.get('Vary'), 'Accept-Encoding')
+        self.assertEqual(json.loads(res.content), plain_res.json())
+
+    def test_with_mutation(self):
+        # Arrange
+        first_res = self.client.get(self.url)
+
+        # Act
+        self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+            'name': 'Hobby',
+            'position_x': 40,
+            'position_y': 50,
+            'properties': []
+        })
+        second_res = self.client.get(self.url)
+
+        # Assert
+        self.assertEqual(len(first_res.json().get('vertices')), 1)
+        self.assertEqual(len(second_res.json().get('vertices')), 2)
+        self.assertNotEqual(second_res.headers.get('ETag'), first_res.headers.get('ETag'))
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import shutil
+import unittest
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestGraphOptimisticConcurrency(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+
+        # Create Vertex
+        vertex_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+            'name': 'Person',
+            'position_x': 10,
+            'position_y': 20,
+            'properties': []
+        })
+        self.vertex = vertex_res.json()
+        self.etag = vertex_res.headers.get('ETag')
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def update_vertex(self, name: str, headers: dict):
+        return self.client.put(f"/api/v1/projects/{self.project.get('id')}/vertices/{self.vertex.get('id')}", json={
+            'name': name,
+            'position_x': 10,
+            'position_y': 20,
+            'properties': []
+        }, headers=headers)
+
+    def test_with_etag_on_reads(self):
+        # Act
+        graph_response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/graph")
+        vertex_response = self.client.get(
+            f"/api/v1/projects/{self.project.get('id')}/vertices/{self.vertex.get('id')}"
+        )
+        vertices_response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices")
+
+        # Assert
+        self.assertEqual(graph_response.headers.get('ETag'), self.etag)
+        self.assertEqual(vertex_response.headers.get('ETag'), self.etag)
+        self.assertEqual(vertices_response.headers.get('ETag'), self.etag)
+
+    def test_with_matching_if_match(self):
+        # Act
+        response = self.update_vertex('Student', {'If-Match': self.etag})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers.get('ETag'), self.etag)
+
+    def test_with_outdated_if_match(self):
+        # Arrange
+        first_response = self.update_vertex('Student', {'If-Match': self.etag})
+
+        # Act
+        response = self.update_vertex('Teacher', {'If-Match': self.etag})
+
+        # Assert
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(response.headers.get('ETag'), first_response.headers.get('ETag'))
+        vertex_response = self.client.get(
+            f"/api/v1/projects/{self.project.get('id')}/vertices/{self.vertex.get('id')}"
+        )
+        self.assertEqual(vertex_response.json().get('name'), 'Student')
+
+    def test_with_invalid_if_match(self):
+        # Act
+        response = self.update_vertex('Student', {'If-Match': 'not-a-version'})
+
+        # Assert
+        self.assertEqual(response.status_code, 412)
+
+    def test_with_wildcard_if_match(self):
+        # Arrange
+        self.update_vertex('Student', {})
+
+        # Act
+        response = self.client.delete(
+            f"/api/v1/projects/{self.project.get('id')}/vertices/{self.vertex.get('id')}",
+            headers={'If-Match': '*'}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.headers.get('ETag'))
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import shutil
+import unittest
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from app.core.services import GraphService
+from main import app
+
+
+class TestGraphConditionalGet(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+
+        # Create Vertices and Edge
+        self.vertices = []
+        for name in ['Person', 'Hobby']:
+            vertex_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+                'name': name,
+                'position_x': 10,
+                'position_y': 20,
+                'properties': [{'key': 'name', 'required': True, 'datatype': 'String'}]
+            })
+            self.vertices.append(vertex_res.json())
+        edge_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/edges", json={
+            'name': 'HAS',
+            'multi_edge': False,
+            'properties': [],
+            'source_vertex_id': self.vertices[0].get('id'),
+            'target_vertex_id': self.vertices[1].get('id')
+        })
+        self.edge = edge_res.json()
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def test_graph_not_modified(self):
+        # Arrange
+        url = f"/api/v1/projects/{self.project.get('id')}/graph"
+        etag = self.client.get(url).headers.get('ETag')
+
+        # Act
+        with mock.patch.object(GraphService, 'get_graph') as get_graph:
+            res = self.client.get(url, headers={'If-None-Match': etag})
+
+        # Assert
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res.headers.get('ETag'), etag)
+        self.assertEqual(res.content, b'')
+        get_graph.assert_not_called()
+
+    def test_graph_modified(self):
+        # Arrange
+        url = f"/api/v1/projects/{self.project.get('id')}/graph"
+        etag = self.client.get(url).headers.get('ETag')
+        self.client.delete(f"/api/v1/projects/{self.project.get('id')}/edges/{self.edge.get('id')}")
+
+        # Act
+        res = self.client.get(url, headers={'If-None-Match': etag})
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res.headers.get('ETag'), etag)
+        self.assertEqual(len(res.json().get('edges')), 0)
+
+    def test_graph_with_several_etags(self):
+        # Arrange
+        url = f"/api/v1/projects/{self.project.get('id')}/graph"
+        etag = self.client.get(url).headers.get('ETag')
+
+        # Act
+        res = self.client.get(url, headers={'If-None-Match': f'"999", W/{etag}'})
+        other_res = self.client.get(url, headers={'If-None-Match': '"999", invalid'})
+
+        # Assert
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(other_res.status_code, 200)
+
+    def test_graph_with_unknown_project(self):
+        # Act
+        res = self.client.get('/api/v1/projects/unknown/graph', headers={'If-None-Match': '"1"'})
+
+        # Assert
+        self.assertEqual(res.status_code, 404)
+
+    def test_vertices_and_edges_not_modified(self):
+        # Arrange
+        project_url = f"/api/v1/projects/{self.project.get('id')}"
+        urls = [
+            f'{project_url}/vertices',
+            f"{project_url}/vertices/{self.vertices[0].get('id')}",
+            f'{project_url}/edges',
+            f"{project_url}/edges/{self.edge.get('id')}"
+        ]
+        etag = self.client.get(f'{project_url}/graph').headers.get('ETag')
+
+        for url in urls:
+            # Act
+            res = self.client.get(url, headers={'If-None-Match': etag})
+
+            # Assert
+            self.assertEqual(res.status_code, 304, url)
+            self.assertEqual(res.headers.get('ETag'), etag, url)
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import shutil
+import unittest
+
+from fastapi.testclient import TestClient
+
+from app import settings
+from main import app
+
+
+class TestGraphDiff(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Projects
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Other-Project'})
+        self.other_project = project_res.json()
+
+        # Create Vertices
+        for project in [self.project, self.other_project]:
+            self.client.post(f"/api/v1/projects/{project.get('id')}/vertices", json={
+                'name': 'Person',
+                'position_x': 10,
+                'position_y': 20,
+                'properties': [{'key': 'name', 'required': True, 'datatype': 'String'}]
+            })
+        # Write the first version, so it doesn't depend on the flush interval whether it is kept. The flush runs in
+        # this thread, whose SQLite connection may still point to the database of an earlier test
+        app.state.container.sqlite_adapter.close()
+        app.state.container.write_behind_buffer.flush()
+        self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+            'name': 'Hobby',
+            'position_x': 40,
+            'position_y': 50,
+            'properties': []
+        })
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def test_with_other_project(self):
+        # Act
+        response = self.client.get(
+            f"/api/v1/projects/{self.project.get('id')}/graph/diff",
+            params={'base_project_id': self.other_project.get('id')}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get('base_version'), 1)
+        self.assertEqual(response.json().get('version'), 2)
+        self.assertEqual(
+            [(diff.get('element_type'), diff.get('kind'), diff.get('name')) for diff in response.json()['differences']],
+            [('vertex', 'added', 'Hobby')]
+        )
+
+    def test_with_current_version(self):
+        # Act
+        response = self.client.get(
+            f"/api/v1/projects/{self.project.get('id')}/graph/diff",
+            params={'base_version': 2}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get('differences'), [])
+
+    def test_with_unknown_version(self):
+        # Act
+        response = self.client.get(
+            f"/api/v1/projects/{self.project.get('id')}/graph/diff",
+            params={'base_version': 7}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+
+    def test_with_earlier_version(self):
+        # Act
+        response = self.client.get(
+            f"/api/v1/projects/{self.project.get('id')}/graph/diff",
+            params={'base_version': 1}
+        )
+
+        # Assert
+        if settings.PROJECT_STORAGE == 'journal' or settings.PROJECT_WRITE_MODE == 'behind':
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [(diff.get('kind'), diff.get('name')) for diff in response.json()['differences']],
+                [('added', 'Hobby')]
+            )
+        else:
+            self.assertEqual(response.status_code, 422)
+            self.assertIn('are not kept', response.json().get('detail')[0].get('msg'))
+
+    def test_without_parameters(self):
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/graph/diff")
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json().get('detail')[0].get('loc'), ['query'])
+
+    def test_with_unknown_project(self):
+        # Act
+        response = self.client.get(
+            f"/api/v1/projects/{self.project.get('id')}/graph/diff",
+            params={'base_project_id': 'unknown'}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
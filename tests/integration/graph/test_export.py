@@ -0,0 +1,104 @@
+import asyncio
+import json
+import os
+import shutil
+import unittest
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestGraphExport(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+        self.url = f"/api/v1/projects/{self.project.get('id')}/graph"
+
+        # Create Vertices and Edge
+        self.vertices = []
+        for name in ['Person', 'Hobby']:
+            vertex_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+                'name': name,
+                'position_x': 10,
+                'position_y': 20,
+                'properties': [{'key': 'name', 'required': True, 'datatype': 'String'}]
+            })
+            self.vertices.append(vertex_res.json())
+        edge_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/edges", json={
+            'name': 'HAS',
+            'multi_edge': False,
+            'properties': [],
+            'source_vertex_id': self.vertices[0].get('id'),
+            'target_vertex_id': self.vertices[1].get('id')
+        })
+        self.edge = edge_res.json()
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def test_export(self):
+        # Act
+        res = self.client.get(f'{self.url}/export')
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.headers.get('Content-Type'), 'application/x-ndjson')
+        self.assertEqual(res.headers.get('ETag'), self.client.get(self.url).headers.get('ETag'))
+        lines = [json.loads(line) for line in res.text.splitlines()]
+        self.assertEqual([line.get('type') for line in lines], ['vertex', 'vertex', 'edge'])
+        self.assertEqual(lines[0], {
+            'type': 'vertex',
+            'name': 'Person',
+            'position_x': 10,
+            'position_y': 20,
+            'properties': [{'key': 'name', 'required': True, 'datatype': 'String'}],
+            'id': self.vertices[0].get('id')
+        })
+        self.assertEqual(lines[2].get('id'), self.edge.get('id'))
+        self.assertEqual(lines[2].get('source_vertex_id'), self.vertices[0].get('id'))
+        self.assertEqual(lines[2].get('target_vertex_id'), self.vertices[1].get('id'))
+
+    def test_export_can_be_imported(self):
+        # Arrange
+        lines = [json.loads(line) for line in self.client.get(f'{self.url}/export').text.splitlines()]
+        other_project = self.client.post('/api/v1/projects', json={'name': 'Other-Project'}).json()
+
+        # Act
+        res = self.client.put(f"/api/v1/projects/{other_project.get('id')}/graph", json={
+            'vertices': [{key: value for key, value in line.items() if key != 'type'}
+                         for line in lines if line.get('type') == 'vertex'],
+            'edges': [{key: value for key, value in line.items() if key != 'type'}
+                      for line in lines if line.get('type') == 'edge']
+        })
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.json().get('vertices')), 2)
+        self.assertEqual(len(res.json().get('edges')), 1)
+
+    def test_export_not_modified(self):
+        # Arrange
+        etag = self.client.get(f'{self.url}/export').headers.get('ETag')
+
+        # Act
+        res = self.client.get(f'{self.url}/export', headers={'If-None-Match': etag})
+
+        # Assert
+        self.assertEqual(res.status_code, 304)
+
+    def test_export_with_unknown_project(self):
+        # Act
+        res = self.client.get('/api/v1/projects/unknown/graph/export')
+
+        # Assert
+        self.assertEqual(res.status_code, 404)
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import shutil
+import unittest
+import uuid
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestGraphImport(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+
+        # Create Vertex, which gets replaced by the import
+        vertex_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+            'name': 'Animal',
+            'position_x': 0,
+            'position_y': 0,
+            'properties': []
+        })
+        self.etag = vertex_res.headers.get('ETag')
+
+        self.person_id = str(uuid.uuid4())
+        self.hobby_id = str(uuid.uuid4())
+        self.document = {
+            'vertices': [
+                {
+                    'id': self.person_id,
+                    'name': 'Person',
+                    'position_x': 10,
+                    'position_y': 20,
+                    'properties': [{'key': 'name', 'required': True, 'datatype': 'String'}]
+                },
+                {'id': self.hobby_id, 'name': 'Hobby', 'position_x': 40, 'position_y': 50, 'properties': []}
+            ],
+            'edges': [
+                {
+                    'id': str(uuid.uuid4()),
+                    'name': 'performs',
+                    'properties': [],
+                    'multi_edge': True,
+                    'source_vertex_id': self.person_id,
+                    'target_vertex_id': self.hobby_id
+                }
+            ]
+        }
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def test_with_valid_graph(self):
+        # Act
+        response = self.client.put(f"/api/v1/projects/{self.project.get('id')}/graph", json=self.document)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers.get('ETag'), self.etag)
+        graph_response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/graph")
+        self.assertEqual(graph_response.headers.get('ETag'), response.headers.get('ETag'))
+        self.assertEqual([vertex.get('name') for vertex in graph_response.json().get('vertices')], ['Person', 'Hobby'])
+        self.assertEqual(graph_response.json().get('edges')[0].get('target_vertex_id'), self.hobby_id)
+
+    def test_with_exported_graph(self):
+        # Arrange
+        exported = self.client.get(f"/api/v1/projects/{self.project.get('id')}/graph").json()
+
+        # Act
+        response = self.client.put(f"/api/v1/projects/{self.project.get('id')}/graph", json=exported)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), exported)
+
+    def test_with_invalid_elements(self):
+        # Arrange
+        self.document['vertices'][1]['name'] = 'person'
+        self.document['edges'].append({**self.document['edges'][0], 'target_vertex_id': str(uuid.uuid4())})
+
+        # Act
+        response = self.client.put(f"/api/v1/projects/{self.project.get('id')}/graph", json=self.document)
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual([error.get('loc') for error in response.json().get('detail')], [
+            ['body', 'vertices', 1, 'name'],
+            ['body', 'edges', 1, 'target_vertex_id']
+        ])
+        graph_response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/graph")
+        self.assertEqual([vertex.get('name') for vertex in graph_response.json().get('vertices')], ['Animal'])
+
+    def test_with_outdated_if_match(self):
+        # Act
+        response = self.client.put(f"/api/v1/projects/{self.project.get('id')}/graph", json=self.document,
+                                   headers={'If-Match': '"0"'})
+
+        # Assert
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(response.headers.get('ETag'), self.etag)
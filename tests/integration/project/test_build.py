@@ -0,0 +1,66 @@
+import asyncio
+import os
+import shutil
+import unittest
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestBuildProject(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Build-Test-Project'})
+        self.project = project_res.json()
+        self.url = f"/api/v1/projects/{self.project.get('id')}/build/"
+
+        # Create Vertex
+        self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+            'name': 'Person',
+            'position_x': 10,
+            'position_y': 20,
+            'properties': [
+                {'key': 'name', 'required': True, 'datatype': 'String'},
+                {'key': 'age', 'required': False, 'datatype': 'Int'}
+            ]
+        })
+
+    def tearDown(self):
+        # Delete Folders
+        shutil.rmtree(os.path.join(os.getcwd(), 'projects'))
+        shutil.rmtree(os.path.join(os.getcwd(), 'outputs', 'Build-Test-Project'), ignore_errors=True)
+
+    def _read_schema(self) -> str:
+        with open(os.path.join(os.getcwd(), 'outputs', 'Build-Test-Project', 'schema.py')) as schema_file:
+            return schema_file.read()
+
+    def test_build_project(self):
+        # Act
+        res = self.client.post(self.url, json={'port': 8080})
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        schema = self._read_schema()
+        self.assertIn('name: String!', schema)
+        self.assertIn('age: Int', schema)
+
+    def test_build_project_after_reload(self):
+        # Arrange
+        app.state.container.graph_cache.clear()
+
+        # Act
+        res = self.client.post(self.url, json={'port': 8080})
+
+        # Assert
+        self.assertEqual(res.status_code, 200)
+        schema = self._read_schema()
+        self.assertIn('name: String!', schema)
+        self.assertIn('age: Int', schema)
+        self.assertNotIn('name: !', schema)
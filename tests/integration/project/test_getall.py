@@ -35,3 +35,18 @@ class TestProjectGetAll(unittest.TestCase):
         self.assertEqual(len(response.json()), 1)
         self.assertEqual(response.json()[0].get('id'), self.project.get('id'))
         self.assertEqual(response.json()[0].get('name'), self.project.get('name'))
+
+    def test_with_pagination_and_fields(self):
+        # Arrange
+        for name in ['ValidOther', 'Other']:
+            self.client.post('/api/v1/projects', json={'name': name})
+
+        # Act
+        response = self.client.get('/api/v1/projects', params={'name_prefix': 'valid', 'limit': 1, 'fields': 'name'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(list(response.json()[0]), ['name'])
+        self.assertTrue(response.json()[0].get('name').startswith('Valid'))
+        self.assertEqual(response.headers.get('X-Total-Count'), '2')
@@ -56,3 +56,62 @@ class TestVertexGetAll(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 1)
         self.assertEqual(response.json()[0].get('id'), self.vertex.get('id'))
+
+    def test_with_pagination_and_name_prefix(self):
+        # Arrange
+        for name in ['TestHobby', 'Person']:
+            self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+                'name': name,
+                'position_x': 10,
+                'position_y': 20,
+                'properties': []
+            })
+
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices",
+                                   params={'name_prefix': 'test', 'offset': 1, 'limit': 5})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([vertex.get('name') for vertex in response.json()], ['TestHobby'])
+        self.assertEqual(response.headers.get('X-Total-Count'), '2')
+
+    def test_with_cross_origin_request(self):
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices",
+                                   headers={'Origin': 'http://localhost:3000'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get('Access-Control-Expose-Headers'), 'ETag, X-Total-Count')
+
+    def test_with_fields(self):
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices",
+                                   params={'fields': 'id,name,position'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{
+            'name': 'TestVertex',
+            'position_x': 10,
+            'position_y': 20,
+            'id': self.vertex.get('id')
+        }])
+        self.assertIsNotNone(response.headers.get('ETag'))
+
+    def test_with_unknown_field(self):
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices",
+                                   params={'fields': 'id,color'})
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json().get('detail')[0].get('msg'), "Unknown field 'color'")
+
+    def test_with_invalid_limit(self):
+        # Act
+        response = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices", params={'limit': 0})
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
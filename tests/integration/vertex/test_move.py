@@ -0,0 +1,73 @@
+import asyncio
+import os
+import shutil
+import unittest
+import uuid
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestVertexMove(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app, backend_options={'loop_factory': asyncio.new_event_loop})
+
+        # Setup Project Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        os.mkdir(dir_path)
+
+        # Setup Project
+        project_res = self.client.post('/api/v1/projects', json={'name': 'Test-Project'})
+        self.project = project_res.json()
+
+        # Create Vertices
+        self.vertices = []
+        for name in ['Person', 'Hobby']:
+            vertex_res = self.client.post(f"/api/v1/projects/{self.project.get('id')}/vertices", json={
+                'name': name,
+                'position_x': 10,
+                'position_y': 20,
+                'properties': [{'key': 'name', 'required': True, 'datatype': 'String'}]
+            })
+            self.vertices.append(vertex_res.json())
+
+    def tearDown(self):
+        # Delete Folder
+        dir_path = os.path.join(os.getcwd(), 'projects')
+        shutil.rmtree(dir_path)
+
+    def test_with_many_vertices(self):
+        # Act
+        response = self.client.patch(f"/api/v1/projects/{self.project.get('id')}/vertices/positions", json=[
+            {'id': self.vertices[0].get('id'), 'position_x': 100, 'position_y': 200},
+            {'id': self.vertices[1].get('id'), 'position_x': 300, 'position_y': 400}
+        ])
+
+        # Assert
+        self.assertEqual(response.status_code, 202)
+        vertices = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices").json()
+        self.assertEqual([(vertex.get('position_x'), vertex.get('position_y')) for vertex in vertices],
+                         [(100, 200), (300, 400)])
+        self.assertEqual(vertices[0].get('properties'), self.vertices[0].get('properties'))
+
+    def test_with_unknown_vertex(self):
+        # Act
+        response = self.client.patch(f"/api/v1/projects/{self.project.get('id')}/vertices/positions", json=[
+            {'id': self.vertices[0].get('id'), 'position_x': 100, 'position_y': 200},
+            {'id': str(uuid.uuid4()), 'position_x': 100, 'position_y': 200}
+        ])
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        vertices = self.client.get(f"/api/v1/projects/{self.project.get('id')}/vertices").json()
+        self.assertEqual(vertices[0].get('position_x'), 10)
+
+    def test_with_unknown_project(self):
+        # Act
+        response = self.client.patch(f"/api/v1/projects/{uuid.uuid4()}/vertices/positions", json=[
+            {'id': self.vertices[0].get('id'), 'position_x': 100, 'position_y': 200}
+        ])
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
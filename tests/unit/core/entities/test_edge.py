@@ -44,3 +44,47 @@ class TestEdgeToDict(unittest.TestCase):
             ]
         }
         self.assertEqual(edge_dict, expected)
+
+
+class TestEdgeCachedNames(unittest.TestCase):
+    def setUp(self):
+        self.person_vertex = Vertex('1', 'person', 0, 0, [])
+        self.hobby_vertex = Vertex('2', 'hobby', 0, 0, [])
+        self.edge = Edge('3', 'performs', [], False)
+        self.edge.source_vertex = self.person_vertex
+        self.edge.target_vertex = self.hobby_vertex
+        self.person_vertex.add_out_edge(self.edge)
+        self.hobby_vertex.add_in_edge(self.edge)
+
+    def test_with_renamed_edge(self):
+        # Arrange
+        self.assertEqual(self.edge.out_type_name, 'PersonToHobbyPerformsEdge')
+
+        # Act
+        self.edge.name = 'likes'
+
+        # Assert
+        self.assertEqual(self.edge.out_type_name, 'PersonToHobbyLikesEdge')
+        self.assertEqual(self.edge.out_field_name, 'likesOut')
+
+    def test_with_renamed_vertex(self):
+        # Arrange
+        self.assertEqual(self.edge.logic_input_name, 'PersonToHobbyPerformsEdgeLogicInput')
+
+        # Act
+        self.hobby_vertex.name = 'sport'
+
+        # Assert
+        self.assertEqual(self.hobby_vertex.type_name, 'SportVertex')
+        self.assertEqual(self.edge.logic_input_name, 'PersonToSportPerformsEdgeLogicInput')
+
+    def test_with_new_target_vertex(self):
+        # Arrange
+        self.assertEqual(self.edge.in_type_name, 'HobbyToPersonPerformsEdge')
+
+        # Act
+        self.edge.target_vertex = self.person_vertex
+
+        # Assert
+        self.assertEqual(self.edge.in_type_name, 'PersonToPersonPerformsEdge')
+        self.assertFalse(hasattr(self.edge, '__dict__'))
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import uuid
 
@@ -425,6 +426,28 @@ class TestGraphAddEdge(unittest.TestCase):
         self.assertEqual(len(self.hobby_vertex.in_edges), 0)
         self.assertEqual(new_edge.multi_edge, False)
 
+    def test_duplicate_id_edge(self):
+        # Arrange
+        edge_id = str(uuid.uuid4())
+        self.graph.add_edge(Edge(_id=edge_id, name='performs', properties=[], multi_edge=False),
+                            self.person_vertex_id, self.hobby_vertex_id)
+        duplicate_edge = Edge(
+            _id=edge_id,
+            name='likes',
+            properties=[],
+            multi_edge=False
+        )
+
+        # Act
+        with self.assertRaises(EdgeException) as context:
+            self.graph.add_edge(duplicate_edge, self.hobby_vertex_id, self.person_vertex_id)
+
+        # Assert
+        self.assertEqual(context.exception.message, f"Edge with Id '{edge_id}' already exists")
+        self.assertEqual(context.exception.status_code, 409)
+        self.assertEqual(len(self.graph.edges), 1)
+        self.assertEqual(self.graph.find_edge_by_id(edge_id).name, 'performs')
+
 
 class TestGraphUpdateEdge(unittest.TestCase):
     def setUp(self):
@@ -811,3 +834,81 @@ class TestGraphToDict(unittest.TestCase):
             ]
         }
         self.assertEqual(graph_dict, expected)
+
+
+class TestGraphCopy(unittest.TestCase):
+    def test_with_connected_vertices(self):
+        # Arrange
+        graph = Graph()
+        graph.add_vertex(Vertex('1', 'Person', 10, 20, [Property('name', True, Datatype.STRING)]))
+        graph.add_vertex(Vertex('2', 'Hobby', 30, 40, []))
+        graph.add_edge(Edge('3', 'performs', [], False), '1', '2')
+        graph.add_edge(Edge('4', 'knows', [], True), '1', '1')
+        graph.pop_changes()
+        graph.version = 7
+
+        # Act
+        copied_graph = graph.copy()
+        copied_graph.update_vertex('2', Vertex('', 'Sport', 0, 0, []))
+
+        # Assert
+        self.assertEqual(copied_graph.version, 7)
+        self.assertEqual(copied_graph.to_dict()['edges'], graph.to_dict()['edges'])
+        self.assertEqual(graph.find_vertex_by_id('2').name, 'Hobby')
+        self.assertEqual([edge.id for edge in copied_graph.find_vertex_by_id('1').out_edges], ['3', '4'])
+        self.assertIs(copied_graph.edges[0].target_vertex, copied_graph.find_vertex_by_id('2'))
+        self.assertEqual(len(graph.pop_changes()), 0)
+
+
+class TestGraphIndexes(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.graph.add_vertex(Vertex('1', 'Person', 0, 0, []))
+        self.graph.add_vertex(Vertex('2', 'Hobby', 0, 0, []))
+        self.graph.add_edge(Edge('3', 'performs', [], False), '1', '2')
+
+    def test_with_unpickled_graph(self):
+        # Arrange
+        state = self.graph.__getstate__()
+
+        # Act
+        graph = pickle.loads(pickle.dumps(self.graph))
+        legacy_graph = Graph.__new__(Graph)
+        legacy_graph.__setstate__({'vertices': state['vertices'], 'edges': state['edges']})
+
+        # Assert
+        self.assertNotIn('_vertex_index', state)
+        self.assertEqual(graph.find_edge_by_id('3').target_vertex, graph.find_vertex_by_id('2'))
+        self.assertEqual(legacy_graph.find_vertex_by_id('1').name, 'Person')
+        self.assertEqual(legacy_graph.find_edge_by_id('3').name, 'performs')
+
+    def test_with_deleted_vertex(self):
+        # Act
+        self.graph.delete_vertex('2')
+
+        # Assert
+        self.assertRaises(VertexNotFoundException, self.graph.find_vertex_by_id, '2')
+        self.assertRaises(EdgeNotFoundException, self.graph.find_edge_by_id, '3')
+        self.assertEqual(self.graph.find_vertex_by_id('1').name, 'Person')
+
+    def test_with_renamed_vertex(self):
+        # Act
+        self.graph.update_vertex('2', Vertex('', 'sport', 0, 0, []))
+        self.graph.add_vertex(Vertex('4', 'Hobby', 0, 0, []))
+
+        # Assert
+        with self.assertRaises(VertexException) as context:
+            self.graph.add_vertex(Vertex('5', 'Sport', 0, 0, []))
+        self.assertEqual(context.exception.message, "Vertex with Name 'sport' already exists")
+        self.assertEqual(self.graph.find_vertex_by_id('4').name, 'Hobby')
+
+    def test_with_renamed_edge(self):
+        # Act
+        self.graph.update_edge('3', '1', '2', Edge('', 'likes', [], False))
+        self.graph.add_edge(Edge('4', 'performs', [], False), '1', '2')
+
+        # Assert
+        with self.assertRaises(EdgeException) as context:
+            self.graph.add_edge(Edge('5', 'Likes', [], False), '1', '1')
+        self.assertEqual(context.exception.message, "Source-Vertex already has an outgoing edge with name 'likes'")
+        self.assertEqual([edge.id for edge in self.graph.find_vertex_by_id('2').in_edges], ['3', '4'])
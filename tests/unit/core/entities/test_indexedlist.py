@@ -0,0 +1,49 @@
+import pickle
+import unittest
+
+from app.core.entities import Vertex
+from app.core.entities.indexedlist import IndexedList
+
+
+class TestIndexedList(unittest.TestCase):
+    def setUp(self):
+        self.vertices = [Vertex(str(idx), f'Vertex{idx}', 0, 0, []) for idx in range(4)]
+        self.indexed_list = IndexedList(self.vertices)
+
+    def test_with_removed_element(self):
+        # Act
+        self.indexed_list.remove(self.vertices[1])
+        self.indexed_list.append(self.vertices[1])
+
+        # Assert
+        self.assertEqual([vertex.id for vertex in self.indexed_list], ['0', '2', '3', '1'])
+        self.assertEqual(self.indexed_list[1], self.vertices[2])
+        self.assertEqual(self.indexed_list[-1], self.vertices[1])
+        self.assertEqual(self.indexed_list.index(self.vertices[3]), 2)
+        self.assertIn(self.vertices[1], self.indexed_list)
+        self.assertEqual(len(self.indexed_list), 4)
+
+    def test_with_missing_element(self):
+        # Arrange
+        self.indexed_list.remove(self.vertices[0])
+
+        # Act & Assert
+        self.assertRaises(ValueError, self.indexed_list.remove, self.vertices[0])
+        self.assertRaises(IndexError, self.indexed_list.__getitem__, 3)
+
+    def test_with_sort_and_pickle(self):
+        # Act
+        self.indexed_list.sort(key=lambda vertex: vertex.id, reverse=True)
+        unpickled_list = pickle.loads(pickle.dumps(self.indexed_list))
+
+        # Assert
+        self.assertEqual([vertex.id for vertex in self.indexed_list], ['3', '2', '1', '0'])
+        self.assertEqual([vertex.id for vertex in unpickled_list], ['3', '2', '1', '0'])
+
+    def test_with_slices(self):
+        # Act & Assert
+        self.assertEqual(self.indexed_list[1:3], self.vertices[1:3])
+        self.assertEqual(self.indexed_list[2:], self.vertices[2:])
+        self.assertEqual(self.indexed_list[-2:], self.vertices[-2:])
+        self.assertEqual(self.indexed_list[::2], self.vertices[::2])
+        self.assertEqual(self.indexed_list[5:9], [])
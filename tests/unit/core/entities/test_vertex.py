@@ -1,6 +1,6 @@
 import unittest
 
-from app.core.entities import Vertex, Property
+from app.core.entities import Edge, Vertex, Property
 from app.core.entities.property import Datatype
 
 
@@ -32,3 +32,24 @@ class TestVertexToDict(unittest.TestCase):
             ]
         }
         self.assertEqual(vertex_dict, expected)
+
+
+class TestVertexIndexes(unittest.TestCase):
+    def test_with_connected_edges(self):
+        # Arrange
+        vertex = Vertex('1', 'Person', 0, 0, [Property(key='name', required=True, datatype=Datatype.STRING)])
+        knows_edge = Edge('2', 'Knows', [], False)
+        likes_edge = Edge('3', 'likes', [], False)
+
+        # Act
+        vertex.add_out_edge(knows_edge)
+        vertex.add_out_edge(likes_edge)
+        vertex.add_in_edge(knows_edge)
+        vertex.remove_out_edge(likes_edge)
+        vertex.properties = [Property(key='age', required=False, datatype=Datatype.INT)]
+
+        # Assert
+        self.assertIs(vertex.find_out_edge_by_name('knows'), knows_edge)
+        self.assertIs(vertex.find_in_edge_by_name('knows'), knows_edge)
+        self.assertIsNone(vertex.find_out_edge_by_name('likes'))
+        self.assertEqual(vertex.property_keys, {'age'})
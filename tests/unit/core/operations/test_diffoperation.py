@@ -0,0 +1,143 @@
+import unittest
+import uuid
+
+from app.core.entities import Edge, Graph, Property, Vertex
+from app.core.entities.property import Datatype
+from app.core.operations import DiffOperation
+from app.core.valueobjects import Difference
+
+
+def kinds(graph_diff) -> list:
+    return [(difference.element_type, difference.kind, difference.name) for difference in graph_diff.differences]
+
+
+class TestDiffOperation(unittest.TestCase):
+    def setUp(self):
+        self.person_id = str(uuid.uuid4())
+        self.hobby_id = str(uuid.uuid4())
+        self.edge_id = str(uuid.uuid4())
+
+        self.old_graph = Graph()
+        self.old_graph.add_vertex(Vertex(self.person_id, 'Person', 0, 0, [Property('name', True, Datatype.STRING)]))
+        self.old_graph.add_vertex(Vertex(self.hobby_id, 'Hobby', 0, 0, []))
+        self.old_graph.add_edge(
+            Edge(self.edge_id, 'performs', [Property('since', False, Datatype.INT)], False),
+            self.person_id,
+            self.hobby_id
+        )
+        self.new_graph = self.old_graph.copy()
+
+    def test_with_equal_graphs(self):
+        # Act
+        graph_diff = DiffOperation.diff(self.old_graph, self.new_graph)
+
+        # Assert
+        self.assertTrue(graph_diff.is_empty())
+
+    def test_with_moved_vertex(self):
+        # Arrange
+        self.new_graph.update_vertex(self.hobby_id, Vertex('', 'Hobby', 50, 50, []))
+
+        # Act
+        graph_diff = DiffOperation.diff(self.old_graph, self.new_graph)
+
+        # Assert
+        self.assertTrue(graph_diff.is_empty())
+
+    def test_with_added_and_removed_elements(self):
+        # Arrange
+        sport_id = str(uuid.uuid4())
+        self.new_graph.delete_vertex(self.hobby_id)
+        self.new_graph.add_vertex(Vertex(sport_id, 'Sport', 0, 0, []))
+        self.new_graph.add_edge(Edge(str(uuid.uuid4()), 'likes', [], True), self.person_id, sport_id)
+
+        # Act
+        graph_diff = DiffOperation.diff(self.old_graph, self.new_graph)
+
+        # Assert
+        self.assertEqual(kinds(graph_diff), [
+            (Difference.VERTEX, Difference.ADDED, 'Sport'),
+            (Difference.VERTEX, Difference.REMOVED, 'Hobby'),
+            (Difference.EDGE, Difference.ADDED, 'likes'),
+            (Difference.EDGE, Difference.REMOVED, 'performs')
+        ])
+
+    def test_with_renamed_elements(self):
+        # Arrange
+        self.new_graph.update_vertex(self.hobby_id, Vertex('', 'Sport', 0, 0, []))
+        self.new_graph.update_edge(self.edge_id, self.person_id, self.hobby_id, Edge('', 'likes', [], False))
+
+        # Act
+        graph_diff = DiffOperation.diff(self.old_graph, self.new_graph)
+
+        # Assert
+        self.assertEqual(kinds(graph_diff), [
+            (Difference.VERTEX, Difference.RENAMED, 'Sport'),
+            (Difference.EDGE, Difference.RENAMED, 'likes'),
+            (Difference.PROPERTY, Difference.REMOVED, 'since')
+        ])
+        self.assertEqual(graph_diff.differences[0].old_value, 'Hobby')
+        self.assertEqual(graph_diff.differences[2].element_id, self.edge_id)
+
+    def test_with_changed_properties(self):
+        # Arrange
+        self.new_graph.update_vertex(self.person_id, Vertex('', 'Person', 0, 0, [
+            Property('title', True, Datatype.STRING),
+            Property('age', False, Datatype.INT)
+        ]))
+        self.new_graph.update_edge(
+            self.edge_id,
+            self.person_id,
+            self.hobby_id,
+            Edge('', 'performs', [Property('since', True, Datatype.FLOAT)], True)
+        )
+
+        # Act
+        graph_diff = DiffOperation.diff(self.old_graph, self.new_graph)
+
+        # Assert
+        self.assertEqual(kinds(graph_diff), [
+            (Difference.PROPERTY, Difference.RENAMED, 'title'),
+            (Difference.PROPERTY, Difference.ADDED, 'age'),
+            (Difference.EDGE, Difference.MULTI_EDGE_CHANGED, 'performs'),
+            (Difference.PROPERTY, Difference.DATATYPE_CHANGED, 'since'),
+            (Difference.PROPERTY, Difference.REQUIRED_CHANGED, 'since')
+        ])
+        self.assertEqual(graph_diff.differences[0].old_value, 'name')
+        self.assertEqual(graph_diff.differences[3].old_value, Datatype.INT)
+        self.assertEqual(graph_diff.differences[3].new_value, Datatype.FLOAT)
+
+    def test_with_reconnected_edge(self):
+        # Arrange
+        self.new_graph.update_edge(
+            self.edge_id,
+            self.hobby_id,
+            self.person_id,
+            Edge('', 'performs', [Property('since', False, Datatype.INT)], False)
+        )
+
+        # Act
+        graph_diff = DiffOperation.diff(self.old_graph, self.new_graph)
+
+        # Assert
+        self.assertEqual(kinds(graph_diff), [(Difference.EDGE, Difference.RECONNECTED, 'performs')])
+        self.assertEqual(graph_diff.differences[0].new_value, 'Hobby -> Person')
+
+    def test_with_elements_matched_by_name(self):
+        # Arrange
+        other_graph = Graph()
+        person_id, hobby_id = str(uuid.uuid4()), str(uuid.uuid4())
+        other_graph.add_vertex(Vertex(person_id, 'Person', 0, 0, [Property('name', False, Datatype.STRING)]))
+        other_graph.add_vertex(Vertex(hobby_id, 'Hobby', 0, 0, []))
+        other_graph.add_edge(
+            Edge(str(uuid.uuid4()), 'performs', [Property('since', False, Datatype.INT)], False),
+            person_id,
+            hobby_id
+        )
+
+        # Act
+        graph_diff = DiffOperation.diff(self.old_graph, other_graph)
+
+        # Assert
+        self.assertEqual(kinds(graph_diff), [(Difference.PROPERTY, Difference.REQUIRED_CHANGED, 'name')])
+        self.assertEqual(graph_diff.differences[0].element_id, person_id)
@@ -0,0 +1,50 @@
+import unittest
+import uuid
+
+from app.core.entities import Edge, Property, Vertex
+from app.core.entities.property import Datatype
+from app.core.exceptions import GraphImportException
+from app.core.operations import ImportOperation
+
+
+class TestImportOperation(unittest.TestCase):
+    def setUp(self):
+        self.person = Vertex(str(uuid.uuid4()), 'Person', 0, 0, [Property('name', True, Datatype.STRING)])
+        self.hobby = Vertex(str(uuid.uuid4()), 'Hobby', 10, 10, [])
+
+    def test_with_valid_graph(self):
+        # Arrange
+        edge = Edge(str(uuid.uuid4()), 'performs', [], False)
+
+        # Act
+        graph = ImportOperation.build_graph([self.person, self.hobby], [(edge, self.person.id, self.hobby.id)])
+
+        # Assert
+        self.assertEqual([vertex.name for vertex in graph.vertices], ['Person', 'Hobby'])
+        self.assertIs(graph.find_edge_by_id(edge.id).target_vertex, self.hobby)
+        self.assertIs(self.person.find_out_edge_by_name('performs'), edge)
+        self.assertEqual(graph.pop_changes(), [])
+
+    def test_with_all_errors(self):
+        # Arrange
+        duplicate = Vertex(str(uuid.uuid4()), 'person', 0, 0, [])
+        edge = Edge(str(uuid.uuid4()), 'performs', [], False)
+        edges = [
+            (edge, self.person.id, self.hobby.id),
+            (Edge(edge.id, 'likes', [], False), self.person.id, self.hobby.id),
+            (Edge(str(uuid.uuid4()), 'performs', [], False), self.person.id, self.hobby.id),
+            (Edge(str(uuid.uuid4()), 'knows', [], False), self.person.id, str(uuid.uuid4())),
+            (Edge(str(uuid.uuid4()), 'knows', [], False), duplicate.id, self.hobby.id)
+        ]
+
+        # Act
+        with self.assertRaises(GraphImportException) as context:
+            ImportOperation.build_graph([self.person, self.hobby, duplicate], edges)
+
+        # Assert
+        self.assertEqual([loc for _, loc in context.exception.errors], [
+            ['body', 'vertices', 2, 'name'],
+            ['body', 'edges', 1, 'id'],
+            ['body', 'edges', 2, 'name'],
+            ['body', 'edges', 3, 'target_vertex_id']
+        ])
@@ -0,0 +1,112 @@
+import unittest
+import uuid
+from unittest.mock import Mock
+
+from app.core.entities import Edge, Graph, Vertex
+from app.core.exceptions import BatchException, VersionConflictException, VertexNotFoundException
+from app.core.repositories import BatchRepository
+from app.core.valueobjects import BatchCommand
+
+
+class TestBatchRepository(unittest.TestCase):
+    def setUp(self):
+        self.storage_mock = Mock()
+        self.person_id = str(uuid.uuid4())
+
+        def load_graph(project_id, for_update=False):
+            graph = Graph()
+            graph.add_vertex(Vertex(self.person_id, 'Person', 0, 0, []))
+            graph.pop_changes()
+            return graph
+
+        def save_graph(project_id, graph, changes=None):
+            self.saved_changes = changes
+            graph.version += 1
+
+        self.storage_mock.load_graph.side_effect = load_graph
+        self.storage_mock.save_graph.side_effect = save_graph
+        self.repository = BatchRepository(self.storage_mock)
+
+    def test_with_valid_commands(self):
+        # Arrange
+        hobby_id, edge_id = str(uuid.uuid4()), str(uuid.uuid4())
+        commands = [
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.CREATE, hobby_id, Vertex('', 'Hobby', 0, 0, [])),
+            BatchCommand(BatchCommand.EDGE, BatchCommand.CREATE, edge_id, Edge('', 'performs', [], False),
+                         self.person_id, hobby_id),
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.UPDATE, self.person_id, Vertex('', 'Student', 5, 5, []))
+        ]
+
+        # Act
+        results = self.repository.apply_commands('1', commands)
+
+        # Assert
+        self.assertEqual(results.version, 1)
+        self.assertEqual([result.element.name for result in results.value], ['Hobby', 'performs', 'Student'])
+        self.assertEqual(results.value[1].element.source_vertex.id, self.person_id)
+        self.assertEqual(self.storage_mock.save_graph.call_count, 1)
+        self.assertEqual(len(self.saved_changes), 3)
+
+    def test_with_failing_command(self):
+        # Arrange
+        commands = [
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.CREATE, str(uuid.uuid4()), Vertex('', 'Hobby', 0, 0, [])),
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.DELETE, str(uuid.uuid4()))
+        ]
+
+        # Act
+        with self.assertRaises(BatchException) as context:
+            self.repository.apply_commands('1', commands)
+
+        # Assert
+        self.assertEqual(context.exception.index, 1)
+        self.assertIsInstance(context.exception.cause, VertexNotFoundException)
+        self.assertEqual(self.storage_mock.save_graph.call_count, 0)
+
+    def test_with_concurrent_write(self):
+        # Arrange
+        conflicts = [VersionConflictException('Conflict', 1)]
+        hobby_id = str(uuid.uuid4())
+        commands = [
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.CREATE, hobby_id, Vertex('', 'Hobby', 0, 0, [])),
+            BatchCommand(BatchCommand.EDGE, BatchCommand.CREATE, str(uuid.uuid4()), Edge('', 'performs', [], False),
+                         self.person_id, hobby_id)
+        ]
+
+        def save_graph(project_id, graph, changes=None):
+            if conflicts:
+                raise conflicts.pop()
+            graph.version += 1
+
+        self.storage_mock.save_graph.side_effect = save_graph
+
+        # Act
+        results = self.repository.apply_commands('1', commands)
+
+        # Assert
+        self.assertEqual(self.storage_mock.save_graph.call_count, 2)
+        self.assertEqual(len(results.value[0].element.in_edges), 0)
+        self.assertEqual(results.value[1].element.target_vertex.id, hobby_id)
+
+    def test_with_swapped_names(self):
+        # Arrange
+        hobby_id = str(uuid.uuid4())
+        commands = [
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.CREATE, hobby_id, Vertex('', 'Hobby', 0, 0, [])),
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.UPDATE, self.person_id, Vertex('', 'Tmp', 0, 0, [])),
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.UPDATE, hobby_id, Vertex('', 'Person', 0, 0, [])),
+            BatchCommand(BatchCommand.VERTEX, BatchCommand.UPDATE, self.person_id, Vertex('', 'Hobby', 0, 0, [])),
+            BatchCommand(BatchCommand.EDGE, BatchCommand.CREATE, str(uuid.uuid4()), Edge('', 'performs', [], False),
+                         self.person_id, hobby_id)
+        ]
+
+        # Act
+        results = self.repository.apply_commands('1', commands)
+
+        # Assert
+        self.assertEqual(
+            [result.element.name for result in results.value],
+            ['Hobby', 'Tmp', 'Person', 'Hobby', 'performs']
+        )
+        self.assertEqual(len(results.value[0].element.in_edges), 0)
+        self.assertEqual(len(results.value[3].element.out_edges), 0)
@@ -0,0 +1,133 @@
+import shutil
+import tempfile
+import unittest
+import uuid
+from unittest.mock import Mock
+
+from app.core.entities import Graph, Project, Vertex
+from app.core.exceptions import VersionConflictException, VertexException, VertexNotFoundException
+from app.core.repositories import VertexRepository
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.caches import PositionBuffer
+from app.infrastructure.storages import PickleProjectStorage
+
+
+class TestVertexRepositoryOptimisticConcurrency(unittest.TestCase):
+    def setUp(self):
+        self.storage_mock = Mock()
+        self.graph_version = 3
+
+        def load_graph(project_id, for_update=False):
+            graph = Graph()
+            graph.version = self.graph_version
+            return graph
+
+        def save_graph(project_id, graph, changes=None):
+            graph.version += 1
+
+        self.storage_mock.load_graph.side_effect = load_graph
+        self.storage_mock.save_graph.side_effect = save_graph
+        self.repository = VertexRepository(self.storage_mock)
+
+    def test_with_matching_expected_version(self):
+        # Act
+        result = self.repository.create_vertex('1', Vertex('1', 'Person', 0, 0, []), expected_version=3)
+
+        # Assert
+        self.assertEqual(result.value.name, 'Person')
+        self.assertEqual(result.version, 4)
+        self.assertEqual(self.storage_mock.save_graph.call_count, 1)
+
+    def test_with_outdated_expected_version(self):
+        # Act
+        with self.assertRaises(VersionConflictException) as context:
+            self.repository.create_vertex('1', Vertex('1', 'Person', 0, 0, []), expected_version=2)
+
+        # Assert
+        self.assertEqual(context.exception.current_version, 3)
+        self.assertEqual(self.storage_mock.save_graph.call_count, 0)
+
+    def test_with_concurrent_write_without_expected_version(self):
+        # Arrange
+        conflicts = [VersionConflictException('Conflict', 4)]
+
+        def save_graph(project_id, graph, changes=None):
+            if conflicts:
+                raise conflicts.pop()
+            graph.version += 1
+
+        self.storage_mock.save_graph.side_effect = save_graph
+
+        # Act
+        result = self.repository.create_vertex('1', Vertex('1', 'Person', 0, 0, []))
+
+        # Assert
+        self.assertEqual(result.version, 4)
+        self.assertEqual(self.storage_mock.load_graph.call_count, 2)
+        self.assertEqual(self.storage_mock.save_graph.call_count, 2)
+
+    def test_with_concurrent_write_with_expected_version(self):
+        # Arrange
+        self.storage_mock.save_graph.side_effect = VersionConflictException('Conflict', 4)
+
+        # Act & Assert
+        with self.assertRaises(VersionConflictException):
+            self.repository.create_vertex('1', Vertex('1', 'Person', 0, 0, []), expected_version=3)
+        self.assertEqual(self.storage_mock.save_graph.call_count, 1)
+
+
+class TestVertexRepositoryPositions(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.storage = PickleProjectStorage(ProjectFolderAdapter(project_folder=self.folder))
+        self.project = self.storage.create_project(Project(str(uuid.uuid4()), 'Project-1'))
+
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        self.person = Vertex(str(uuid.uuid4()), 'Person', 0, 0, [])
+        graph.add_vertex(self.person)
+        graph.add_vertex(Vertex(str(uuid.uuid4()), 'Hobby', 0, 0, []))
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+        self.position_buffer = PositionBuffer(flush_interval=60)
+        self.position_buffer.start()
+        self.repository = VertexRepository(self.storage, self.position_buffer)
+
+    def tearDown(self):
+        self.position_buffer.stop()
+        shutil.rmtree(self.folder)
+
+    def load_position(self) -> tuple:
+        vertex = self.storage.load_graph(self.project.id).find_vertex_by_id(self.person.id)
+
+        return vertex.position_x, vertex.position_y
+
+    def test_with_rejected_update(self):
+        # Arrange
+        self.repository.move_vertices(self.project.id, {self.person.id: (5, 6)})
+
+        # Act
+        with self.assertRaises(VertexException):
+            self.repository.update_vertex(self.project.id, self.person.id, Vertex('', 'Hobby', 50, 60, []))
+        self.position_buffer.stop()
+
+        # Assert
+        self.assertEqual(self.load_position(), (5, 6))
+
+    def test_with_accepted_update(self):
+        # Arrange
+        self.repository.move_vertices(self.project.id, {self.person.id: (5, 6)})
+
+        # Act
+        self.repository.update_vertex(self.project.id, self.person.id, Vertex('', 'Student', 50, 60, []))
+        self.position_buffer.stop()
+
+        # Assert
+        self.assertEqual(self.load_position(), (50, 60))
+
+    def test_with_unknown_vertex(self):
+        # Act
+        with self.assertRaises(VertexNotFoundException):
+            self.repository.move_vertices(self.project.id, {self.person.id: (5, 6), str(uuid.uuid4()): (7, 8)})
+
+        # Assert
+        self.assertEqual(self.position_buffer.stats().get('updates'), 0)
@@ -636,3 +636,50 @@ class TestEdgeValidatorValidateEdgeProperties(unittest.TestCase):
 
         # Assert
         self.assertEqual(context.exception.message, f"Edge property 'person' has conflict with Source-Vertex name")
+
+
+class TestEdgeValidatorIndexed(unittest.TestCase):
+    def setUp(self):
+        self.person_vertex = Vertex(str(uuid.uuid4()), 'Person', 0, 0,
+                                    [Property(key='knowsOut', required=True, datatype=Datatype.STRING)])
+        self.hobby_vertex = Vertex(str(uuid.uuid4()), 'Hobby', 0, 0, [])
+        self.performs_edge = Edge(str(uuid.uuid4()), 'performs', [], False)
+
+        self.graph = Graph()
+        self.graph.add_vertex(self.person_vertex)
+        self.graph.add_vertex(self.hobby_vertex)
+        self.graph.add_edge(self.performs_edge, self.person_vertex.id, self.hobby_vertex.id)
+
+    def test_connections_with_same_name(self):
+        # Arrange
+        new_edge = Edge(str(uuid.uuid4()), 'Performs', [], False)
+
+        # Act
+        with self.assertRaises(EdgeException) as context:
+            EdgeValidator.validate_indexed_connections(new_edge, self.person_vertex, self.person_vertex)
+
+        # Assert
+        self.assertEqual(context.exception.message, "Source-Vertex already has an outgoing edge with name 'performs'")
+
+    def test_connections_with_existing_edge(self):
+        # Arrange
+        new_edge = Edge(self.performs_edge.id, 'performs', [], True)
+
+        try:
+            # Act
+            EdgeValidator.validate_indexed_connections(new_edge, self.person_vertex, self.hobby_vertex,
+                                                       self.performs_edge)
+        except EdgeException:
+            # Assert
+            self.fail('Operation should not raise an Exception')
+
+    def test_properties_with_conflicting_property(self):
+        # Arrange
+        new_edge = Edge(str(uuid.uuid4()), 'knows', [], False)
+
+        # Act
+        with self.assertRaises(EdgeException) as context:
+            EdgeValidator.validate_indexed_properties(new_edge, self.person_vertex, self.hobby_vertex)
+
+        # Assert
+        self.assertEqual(context.exception.message, "Edge name has conflict with property 'knowsOut' of Source-Vertex")
@@ -71,3 +71,41 @@ class TestVertexValidator(unittest.TestCase):
 
         # Assert
         self.assertEqual(context.exception.message, f"Vertex with Name '{self.second_vertex.name}' already exists")
+
+    def test_indexed_vertex_with_duplicate_name(self):
+        # Arrange
+        duplicate_name_vertex = Vertex(
+            _id=str(uuid.uuid4()),
+            name='secondVertex',
+            position_x=20,
+            position_y=43,
+            properties=[]
+        )
+        vertices_by_id = {self.first_vertex_id: self.first_vertex, self.second_vertex_id: self.second_vertex}
+        vertices_by_name = {'FirstVertex': self.first_vertex, 'SecondVertex': self.second_vertex}
+
+        # Act
+        with self.assertRaises(VertexException) as context:
+            VertexValidator.validate_indexed_vertex(vertices_by_id, vertices_by_name, duplicate_name_vertex)
+
+        # Assert
+        self.assertEqual(context.exception.message, f"Vertex with Name '{self.second_vertex.name}' already exists")
+
+    def test_indexed_vertex_with_existing_vertex(self):
+        # Arrange
+        updated_vertex = Vertex(
+            _id=self.second_vertex_id,
+            name='SecondVertex',
+            position_x=20,
+            position_y=43,
+            properties=[]
+        )
+        vertices_by_id = {self.first_vertex_id: self.first_vertex, self.second_vertex_id: self.second_vertex}
+        vertices_by_name = {'FirstVertex': self.first_vertex, 'SecondVertex': self.second_vertex}
+
+        try:
+            # Act
+            VertexValidator.validate_indexed_vertex(vertices_by_id, vertices_by_name, updated_vertex, self.second_vertex)
+        except VertexException:
+            # Assert
+            self.fail('Operation should not raise an Exception')
@@ -0,0 +1,44 @@
+import unittest
+
+from app.core.entities import Vertex
+from app.core.entities.indexedlist import IndexedList
+from app.core.valueobjects import ListQuery
+
+
+class TestListQuery(unittest.TestCase):
+    def setUp(self):
+        self.vertices = IndexedList(
+            [Vertex(str(idx), name, 0, 0, []) for idx, name in enumerate(['Person', 'Hobby', 'person_detail', 'Pet'])]
+        )
+
+    def test_without_restrictions(self):
+        # Act
+        page = ListQuery().apply(self.vertices)
+
+        # Assert
+        self.assertEqual([vertex.id for vertex in page.items], ['0', '1', '2', '3'])
+        self.assertEqual(page.total, 4)
+
+    def test_with_offset_and_limit(self):
+        # Act
+        page = ListQuery(offset=1, limit=2).apply(self.vertices)
+
+        # Assert
+        self.assertEqual([vertex.id for vertex in page.items], ['1', '2'])
+        self.assertEqual(page.total, 4)
+
+    def test_with_name_prefix(self):
+        # Act
+        page = ListQuery(offset=1, name_prefix='PERS').apply(self.vertices)
+
+        # Assert
+        self.assertEqual([vertex.id for vertex in page.items], ['2'])
+        self.assertEqual(page.total, 2)
+
+    def test_with_offset_beyond_end(self):
+        # Act
+        page = ListQuery(offset=10, limit=2).apply(self.vertices)
+
+        # Assert
+        self.assertEqual(page.items, [])
+        self.assertEqual(page.total, 4)
@@ -0,0 +1,207 @@
+import sys
+import unittest
+from unittest.mock import Mock
+
+from app.core.entities import Edge, Graph, Vertex
+from app.infrastructure.caches import GraphCache
+from app.infrastructure.caches.graphcache import estimate_graph_size
+from app.infrastructure.storages import CachedProjectStorage
+
+
+class TestCachedProjectStorageLoadGraph(unittest.TestCase):
+    def setUp(self):
+        self.storage_mock = Mock()
+        self.storage_mock.get_graph_signature.return_value = (1, 100)
+        self.storage_mock.load_graph.side_effect = lambda project_id, for_update=False: Graph()
+        self.cache = GraphCache()
+
+    def test_with_unchanged_file(self):
+        # Arrange
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+
+        # Act
+        first_graph = storage.load_graph('1')
+        second_graph = storage.load_graph('1')
+
+        # Assert
+        self.assertIs(first_graph, second_graph)
+        self.assertEqual(self.storage_mock.load_graph.call_count, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_with_changed_file(self):
+        # Arrange
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+
+        # Act
+        first_graph = storage.load_graph('1')
+        self.storage_mock.get_graph_signature.return_value = (2, 120)
+        second_graph = storage.load_graph('1')
+
+        # Assert
+        self.assertIsNot(first_graph, second_graph)
+        self.assertEqual(self.storage_mock.load_graph.call_count, 2)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_with_watched_cache(self):
+        # Arrange
+        self.cache.watched = True
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+
+        # Act
+        first_graph = storage.load_graph('1')
+        second_graph = storage.load_graph('1')
+        self.cache.invalidate('1')
+        third_graph = storage.load_graph('1')
+
+        # Assert
+        self.assertIs(first_graph, second_graph)
+        self.assertIsNot(second_graph, third_graph)
+        self.assertEqual(self.storage_mock.get_graph_signature.call_count, 0)
+
+    def test_with_invalidation_while_loading(self):
+        # Arrange
+        self.cache.watched = True
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+
+        def load_graph(project_id, for_update=False):
+            # The File changes after it got read, but before the Graph gets cached
+            self.cache.invalidate(project_id)
+            return Graph()
+
+        self.storage_mock.load_graph.side_effect = load_graph
+
+        # Act
+        first_graph = storage.load_graph('1')
+        second_graph = storage.load_graph('1')
+
+        # Assert
+        self.assertIsNot(first_graph, second_graph)
+
+    def test_with_for_update(self):
+        # Arrange
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+
+        # Act
+        first_graph = storage.load_graph('1')
+        second_graph = storage.load_graph('1', for_update=True)
+
+        # Assert
+        self.assertIsNot(first_graph, second_graph)
+        self.assertEqual(self.storage_mock.load_graph.call_count, 2)
+
+    def test_with_save_graph(self):
+        # Arrange
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+        graph = storage.load_graph('1')
+
+        # Act
+        storage.save_graph('1', graph)
+        storage.load_graph('1')
+
+        # Assert
+        self.assertEqual(self.storage_mock.save_graph.call_count, 1)
+        self.assertEqual(self.storage_mock.load_graph.call_count, 2)
+
+
+class TestGraphCacheEviction(unittest.TestCase):
+    def test_with_max_entries(self):
+        # Arrange
+        cache = GraphCache(max_entries=2)
+        cache.put('1', 'a', Graph())
+        cache.put('2', 'a', Graph())
+
+        # Act
+        cache.get('1', 'a')
+        cache.put('3', 'a', Graph())
+
+        # Assert
+        self.assertIsNotNone(cache.get('1', 'a'))
+        self.assertIsNone(cache.get('2', 'a'))
+        self.assertIsNotNone(cache.get('3', 'a'))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_with_max_bytes(self):
+        # Arrange
+        cache = GraphCache(max_bytes=1)
+
+        # Act
+        cache.put('1', 'a', Graph())
+
+        # Assert
+        self.assertIsNone(cache.get('1', 'a'))
+        self.assertEqual(cache.size_bytes, 0)
+
+
+class TestEstimateGraphSize(unittest.TestCase):
+    def test_with_cached_names(self):
+        # Arrange
+        graph = Graph()
+        person = Vertex('1', 'Person', 0, 0, [])
+        hobby = Vertex('2', 'Hobby', 0, 0, [])
+        graph.add_vertex(person)
+        graph.add_vertex(hobby)
+        edge = Edge('3', 'performs', [], False)
+        graph.add_edge(edge, '1', '2')
+
+        # Act
+        size = estimate_graph_size(graph)
+        names_size = sum(sys.getsizeof(getattr(element, slot[1:]))
+                         for element in (person, hobby, edge) for slot in element.CACHED_NAMES)
+
+        # Assert
+        self.assertEqual(estimate_graph_size(graph), size)
+        self.assertGreater(size, names_size)
+
+
+class TestCachedProjectStorageLoadVertex(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.vertex = Vertex('1', 'Person', 0, 0, [])
+        self.graph.add_vertex(self.vertex)
+
+        self.storage_mock = Mock()
+        self.storage_mock.get_graph_signature.return_value = (1, 100)
+        self.storage_mock.load_graph.return_value = self.graph
+        self.storage_mock.load_vertex.return_value = Vertex('1', 'Person', 0, 0, [])
+        self.cache = GraphCache()
+
+    def test_with_element_reads_on_miss(self):
+        # Arrange
+        self.storage_mock.element_reads = True
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+
+        # Act
+        vertex = storage.load_vertex('1', '1')
+
+        # Assert
+        self.assertIs(vertex, self.storage_mock.load_vertex.return_value)
+        self.assertEqual(self.storage_mock.load_graph.call_count, 0)
+
+    def test_with_element_reads_on_hit(self):
+        # Arrange
+        self.storage_mock.element_reads = True
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+        storage.load_graph('1')
+
+        # Act
+        vertex = storage.load_vertex('1', '1')
+
+        # Assert
+        self.assertIs(vertex, self.vertex)
+        self.assertEqual(self.storage_mock.load_vertex.call_count, 0)
+
+    def test_without_element_reads(self):
+        # Arrange
+        self.storage_mock.element_reads = False
+        storage = CachedProjectStorage(self.storage_mock, self.cache)
+
+        # Act
+        vertex = storage.load_vertex('1', '1')
+        storage.load_vertex('1', '1')
+
+        # Assert
+        self.assertIs(vertex, self.vertex)
+        self.assertEqual(self.storage_mock.load_graph.call_count, 1)
+        self.assertEqual(self.storage_mock.load_vertex.call_count, 0)
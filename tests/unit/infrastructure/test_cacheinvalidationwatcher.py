@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+from app.core.entities import Graph
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.caches import GraphCache
+from app.infrastructure.watchers import CacheInvalidationWatcher
+
+
+def wait_until(condition, timeout: float = 10) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+
+    return condition()
+
+
+class TestCacheInvalidationWatcher(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.project_folder = os.path.join(self.folder, 'projects')
+
+        self.graph_cache = GraphCache()
+        self.manifest_mock = Mock()
+        self.watcher = CacheInvalidationWatcher(
+            ProjectFolderAdapter(project_folder=self.project_folder),
+            self.graph_cache,
+            self.manifest_mock,
+            debounce_ms=10
+        )
+        self.project_listener = Mock()
+        self.watcher.add_project_listener(self.project_listener)
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.folder)
+
+    def test_with_changed_project_file(self):
+        # Arrange
+        self.graph_cache.put('1', 'a', Graph())
+        self.graph_cache.put('2', 'a', Graph())
+
+        # Act
+        self.watcher.handle_changes({os.path.join(self.project_folder, 'Project-1_1.journal')})
+
+        # Assert
+        self.assertIsNone(self.graph_cache.get('1', 'a'))
+        self.assertIsNotNone(self.graph_cache.get('2', 'a'))
+        self.project_listener.assert_called_once_with('1')
+        self.assertEqual(self.manifest_mock.invalidate.call_count, 0)
+
+    def test_with_changed_manifest(self):
+        # Act
+        self.watcher.handle_changes({os.path.join(self.project_folder, '.manifest.json')})
+
+        # Assert
+        self.assertEqual(self.manifest_mock.invalidate.call_count, 1)
+        self.assertEqual(self.project_listener.call_count, 0)
+
+    def test_with_changed_database(self):
+        # Arrange
+        self.graph_cache.put('1', 'a', Graph())
+
+        # Act
+        self.watcher.handle_changes({os.path.join(self.project_folder, 'projects.sqlite3-wal')})
+
+        # Assert
+        self.assertIsNone(self.graph_cache.get('1', 'a'))
+
+    def test_with_file_written_by_other_process(self):
+        # Arrange
+        self.watcher.start()
+        self.assertTrue(wait_until(lambda: self.watcher.watching))
+        self.graph_cache.put('1', self.graph_cache.get_generation('1'), Graph())
+
+        # Act
+        ProjectFolderAdapter(project_folder=self.project_folder).write_graph(
+            os.path.join(self.project_folder, 'Project-1_1.pickle'), Graph()
+        )
+
+        # Assert
+        self.assertTrue(wait_until(lambda: self.project_listener.call_count > 0))
+        self.assertIsNone(self.graph_cache.get('1', self.graph_cache.get_generation('1')))
+        self.assertTrue(self.manifest_mock.watched)
+
+    def test_with_stopped_watcher(self):
+        # Arrange
+        self.watcher.start()
+        self.assertTrue(wait_until(lambda: self.watcher.watching))
+
+        # Act
+        self.watcher.stop()
+
+        # Assert
+        self.assertFalse(self.graph_cache.watched)
+        self.assertFalse(self.manifest_mock.watched)
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock
+
+from app.core.entities import Graph
+from app.core.valueobjects import ChangeEvent, GraphChange
+from app.infrastructure.events import ChangeFeed
+from app.infrastructure.storages import PublishingProjectStorage
+
+
+class TestChangeFeed(unittest.TestCase):
+    def test_with_publishing_thread(self):
+        # Arrange
+        feed = ChangeFeed()
+
+        async def receive():
+            subscription = feed.subscribe('1')
+            other_subscription = feed.subscribe('2')
+            thread = threading.Thread(target=feed.publish, args=(ChangeEvent(ChangeEvent.CHANGE, '1', 2),))
+            thread.start()
+
+            # Act
+            event = await subscription.get(timeout=1)
+            other_event = await other_subscription.get(timeout=0.05)
+            thread.join()
+
+            return event, other_event
+
+        event, other_event = asyncio.run(receive())
+
+        # Assert
+        self.assertEqual(event.kind, ChangeEvent.CHANGE)
+        self.assertEqual(event.version, 2)
+        self.assertIsNone(other_event)
+        self.assertEqual(feed.published, 1)
+
+    def test_with_slow_subscriber(self):
+        # Arrange
+        feed = ChangeFeed(max_pending=2)
+
+        async def receive():
+            subscription = feed.subscribe('1')
+
+            # Act
+            for version in range(1, 5):
+                feed.publish(ChangeEvent(ChangeEvent.CHANGE, '1', version))
+            await asyncio.sleep(0)
+
+            return [await subscription.get(timeout=0.05) for _ in range(3)]
+
+        events = asyncio.run(receive())
+
+        # Assert
+        self.assertEqual([(event.kind, event.version) for event in events[:2]],
+                         [(ChangeEvent.RESET, 3), (ChangeEvent.CHANGE, 4)])
+        self.assertIsNone(events[2])
+
+    def test_unsubscribe(self):
+        # Arrange
+        feed = ChangeFeed()
+
+        async def subscribe():
+            return feed.subscribe('1')
+
+        subscription = asyncio.run(subscribe())
+
+        # Act
+        feed.unsubscribe(subscription)
+
+        # Assert
+        self.assertEqual(feed.stats(), {'projects': 0, 'subscribers': 0, 'published': 0})
+
+
+class TestPublishingProjectStorage(unittest.TestCase):
+    def setUp(self):
+        self.storage_mock = Mock()
+        self.feed_mock = Mock()
+        self.storage = PublishingProjectStorage(self.storage_mock, self.feed_mock)
+
+    def test_save_with_changes(self):
+        # Arrange
+        graph = Graph()
+        graph.version = 3
+        changes = [GraphChange(GraphChange.VERTEX, GraphChange.DELETE, '1')]
+
+        # Act
+        self.storage.save_graph('1', graph, changes)
+
+        # Assert
+        self.storage_mock.save_graph.assert_called_once_with('1', graph, changes, None)
+        event = self.feed_mock.publish.call_args.args[0]
+        self.assertEqual((event.kind, event.project_id, event.version), (ChangeEvent.CHANGE, '1', 3))
+        self.assertEqual(event.changes, changes)
+
+    def test_save_without_changes(self):
+        # Act
+        self.storage.save_graph('1', Graph())
+
+        # Assert
+        self.assertEqual(self.feed_mock.publish.call_args.args[0].kind, ChangeEvent.RESET)
+
+    def test_failed_save(self):
+        # Arrange
+        self.storage_mock.save_graph.side_effect = ValueError('Project not found')
+
+        # Act
+        with self.assertRaises(ValueError):
+            self.storage.save_graph('1', Graph(), [])
+
+        # Assert
+        self.feed_mock.publish.assert_not_called()
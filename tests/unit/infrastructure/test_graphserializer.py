@@ -0,0 +1,113 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from app.core.entities import Graph, Vertex, Edge, Property
+from app.core.entities.property import Datatype
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.serializers import GraphSerializer, GraphSerializationException
+
+
+class TestGraphSerializer(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.person = Vertex(str(uuid.uuid4()), 'Person', 10, 20, [Property('name', True, Datatype.STRING)])
+        self.hobby = Vertex(str(uuid.uuid4()), 'Hobby', 30, 40, [Property('level', False, Datatype.INT)])
+        self.graph.add_vertex(self.person)
+        self.graph.add_vertex(self.hobby)
+        self.graph.add_edge(Edge(str(uuid.uuid4()), 'performs', [Property('since', False, Datatype.FLOAT)], False),
+                            self.person.id, self.hobby.id)
+        self.graph.add_edge(Edge(str(uuid.uuid4()), 'knows', [Property('close', True, Datatype.BOOLEAN)], True),
+                            self.person.id, self.person.id)
+        self.graph.pop_changes()
+        self.graph.version = 7
+
+    def test_with_round_trip(self):
+        # Act
+        graph = GraphSerializer.deserialize(GraphSerializer.serialize(self.graph))
+
+        # Assert
+        self.assertEqual([vertex.name for vertex in graph.vertices], ['Person', 'Hobby'])
+        self.assertEqual([edge.name for edge in graph.edges], ['performs', 'knows'])
+        person = graph.find_vertex_by_id(self.person.id)
+        self.assertEqual((person.position_x, person.position_y), (10, 20))
+        self.assertEqual([edge.name for edge in person.out_edges], ['performs', 'knows'])
+        self.assertEqual([edge.name for edge in person.in_edges], ['knows'])
+        self.assertIs(graph.edges[0].target_vertex, graph.find_vertex_by_id(self.hobby.id))
+        self.assertIs(graph.edges[1].source_vertex, person)
+        self.assertIs(graph.edges[1].target_vertex, person)
+        self.assertTrue(graph.edges[1].multi_edge)
+        self.assertEqual(graph.edges[1].properties[0].required, True)
+        self.assertEqual(graph.edges[1].properties[0].datatype, Datatype.BOOLEAN)
+        self.assertEqual(graph.find_vertex_by_id(self.hobby.id).properties[0].datatype, Datatype.INT)
+        self.assertEqual(graph.pop_changes(), [])
+        self.assertEqual(graph.version, 7)
+
+    def test_with_version_from_header(self):
+        # Arrange
+        content = GraphSerializer.serialize(self.graph)
+
+        # Act
+        version = GraphSerializer.read_version(content[:GraphSerializer.HEADER_SIZE])
+
+        # Assert
+        self.assertEqual(version, 7)
+
+    def test_with_empty_graph(self):
+        # Act
+        graph = GraphSerializer.deserialize(GraphSerializer.serialize(Graph()))
+
+        # Assert
+        self.assertEqual(graph.vertices, [])
+        self.assertEqual(graph.edges, [])
+
+    def test_with_invalid_content(self):
+        # Act & Assert
+        with self.assertRaises(GraphSerializationException) as context:
+            GraphSerializer.deserialize(b'not a graph')
+        self.assertEqual(context.exception.message, 'Content is not a serialized Graph')
+
+    def test_with_newer_format_version(self):
+        # Arrange
+        content = GraphSerializer.HEADER.pack(GraphSerializer.MAGIC, GraphSerializer.FORMAT_VERSION + 1) + b'[]'
+
+        # Act & Assert
+        with self.assertRaises(GraphSerializationException):
+            GraphSerializer.deserialize(content)
+
+
+class TestProjectFolderAdapterGraphFiles(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.adapter = ProjectFolderAdapter(project_folder=self.folder)
+        self.path = os.path.join(self.folder, 'Project-1.pickle')
+
+        self.graph = Graph()
+        self.graph.add_vertex(Vertex(str(uuid.uuid4()), 'Person', 0, 0, []))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_with_written_graph(self):
+        # Act
+        self.adapter.write_graph(self.path, self.graph)
+        graph = self.adapter.read_graph(self.path)
+
+        # Assert
+        with open(self.path, 'rb') as file:
+            self.assertTrue(GraphSerializer.is_serialized_graph(file.read()))
+        self.assertEqual(graph.vertices[0].name, 'Person')
+
+    def test_with_legacy_pickle(self):
+        # Arrange
+        with open(self.path, 'wb') as file:
+            pickle.dump(self.graph, file)
+
+        # Act
+        graph = self.adapter.read_graph(self.path)
+
+        # Assert
+        self.assertEqual(graph.vertices[0].name, 'Person')
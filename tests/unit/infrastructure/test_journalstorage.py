@@ -0,0 +1,195 @@
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from app.core.entities import Project, Vertex, Edge, Property
+from app.core.entities.property import Datatype
+from app.core.exceptions import GraphVersionNotFoundException, VersionConflictException
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.storages import JournalProjectStorage
+
+
+class TestJournalStorage(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.adapter = ProjectFolderAdapter(project_folder=self.folder)
+        self.storage = JournalProjectStorage(self.adapter, max_journal_entries=5)
+
+        self.project = Project(str(uuid.uuid4()), 'Project-1')
+        self.storage.create_project(self.project)
+        self.journal_path = self.adapter.generate_journal_path(self.project)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def create_vertex(self, name: str) -> Vertex:
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        vertex = Vertex(str(uuid.uuid4()), name, 0, 0, [Property('name', True, Datatype.STRING)])
+        graph.add_vertex(vertex)
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+        return vertex
+
+    def test_with_appended_changes(self):
+        # Arrange
+        person = self.create_vertex('Person')
+        hobby = self.create_vertex('Hobby')
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        graph.add_edge(Edge(str(uuid.uuid4()), 'performs', [], False), person.id, hobby.id)
+        graph.update_vertex(hobby.id, Vertex('', 'Sport', 10, 20, []))
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+        # Act
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertTrue(os.path.exists(self.journal_path))
+        self.assertEqual([vertex.name for vertex in loaded_graph.vertices], ['Person', 'Sport'])
+        self.assertEqual(loaded_graph.find_vertex_by_id(hobby.id).position_x, 10)
+        self.assertEqual(len(loaded_graph.edges), 1)
+        self.assertEqual(loaded_graph.edges[0].target_vertex.name, 'Sport')
+        self.assertIs(loaded_graph.find_vertex_by_id(person.id).properties[0].datatype, Datatype.STRING)
+
+    def test_with_deleted_vertex(self):
+        # Arrange
+        person = self.create_vertex('Person')
+        hobby = self.create_vertex('Hobby')
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        graph.add_edge(Edge(str(uuid.uuid4()), 'performs', [], False), person.id, hobby.id)
+        graph.delete_vertex(hobby.id)
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+        # Act
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertEqual([vertex.name for vertex in loaded_graph.vertices], ['Person'])
+        self.assertEqual(len(loaded_graph.edges), 0)
+
+    def test_with_compaction(self):
+        # Arrange
+        for idx in range(5):
+            self.create_vertex(f'Vertex{idx}')
+
+        # Act
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(len(loaded_graph.vertices), 5)
+
+    def test_with_journal_replayed_on_compacted_snapshot(self):
+        # Arrange
+        first_vertex = self.create_vertex('First')
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        graph.update_vertex(first_vertex.id, Vertex('', 'Renamed', 0, 0, []))
+        graph.add_vertex(Vertex(str(uuid.uuid4()), 'First', 0, 0, []))
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+        # Simulate a crash between writing the snapshot and deleting the journal
+        with open(self.journal_path, 'rb') as file:
+            journal = file.read()
+        self.storage.compact(self.project.id, graph)
+        with open(self.journal_path, 'wb') as file:
+            file.write(journal)
+
+        # Act
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertEqual([vertex.name for vertex in loaded_graph.vertices], ['Renamed', 'First'])
+
+    def test_with_save_after_journal_replayed_on_compacted_snapshot(self):
+        # Arrange
+        self.create_vertex('Person')
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        with open(self.journal_path, 'rb') as file:
+            journal = file.read()
+        self.storage.compact(self.project.id, graph)
+        with open(self.journal_path, 'wb') as file:
+            file.write(journal)
+        self.create_vertex('Hobby')
+
+        # Act
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertEqual(loaded_graph.version, 2)
+        self.assertEqual([vertex.name for vertex in loaded_graph.vertices], ['Person', 'Hobby'])
+
+    def test_with_swapped_names(self):
+        # Arrange
+        self.storage.max_journal_entries = 1000
+        first_vertex = self.create_vertex('Alpha')
+        second_vertex = self.create_vertex('Beta')
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        graph.update_vertex(first_vertex.id, Vertex('', 'Tmp', 0, 0, []))
+        graph.update_vertex(second_vertex.id, Vertex('', 'Alpha', 0, 0, []))
+        graph.update_vertex(first_vertex.id, Vertex('', 'Beta', 0, 0, []))
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+        # Act
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertTrue(os.path.exists(self.journal_path))
+        self.assertEqual(loaded_graph.version, 3)
+        self.assertEqual([vertex.name for vertex in loaded_graph.vertices], ['Beta', 'Alpha'])
+
+    def test_with_outdated_graph_version(self):
+        # Arrange
+        first_graph = self.storage.load_graph(self.project.id, for_update=True)
+        second_graph = self.storage.load_graph(self.project.id, for_update=True)
+        first_graph.add_vertex(Vertex(str(uuid.uuid4()), 'Person', 0, 0, []))
+        second_graph.add_vertex(Vertex(str(uuid.uuid4()), 'Hobby', 0, 0, []))
+        self.storage.save_graph(self.project.id, first_graph, first_graph.pop_changes())
+
+        # Act
+        with self.assertRaises(VersionConflictException) as context:
+            self.storage.save_graph(self.project.id, second_graph, second_graph.pop_changes())
+
+        # Assert
+        self.assertEqual(context.exception.current_version, 1)
+        self.assertEqual(self.storage.get_graph_version(self.project.id), 1)
+        self.assertEqual([vertex.name for vertex in self.storage.load_graph(self.project.id).vertices], ['Person'])
+
+    def test_with_graph_version_after_compaction(self):
+        # Arrange
+        for idx in range(6):
+            self.create_vertex(f'Vertex{idx}')
+
+        # Act
+        version = self.storage.get_graph_version(self.project.id)
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertEqual(version, 6)
+        self.assertEqual(loaded_graph.version, 6)
+
+    def test_with_graph_at_journaled_version(self):
+        # Arrange
+        self.create_vertex('Person')
+        self.create_vertex('Hobby')
+        self.create_vertex('Sport')
+
+        # Act
+        graph = self.storage.load_graph_at_version(self.project.id, 2)
+
+        # Assert
+        self.assertEqual(graph.version, 2)
+        self.assertEqual([vertex.name for vertex in graph.vertices], ['Person', 'Hobby'])
+        self.assertEqual(graph.pop_changes(), [])
+
+    def test_with_graph_at_compacted_version(self):
+        # Arrange
+        for idx in range(6):
+            self.create_vertex(f'Vertex{idx}')
+
+        # Act
+        with self.assertRaises(GraphVersionNotFoundException):
+            self.storage.load_graph_at_version(self.project.id, 3)
+        graph = self.storage.load_graph_at_version(self.project.id, 5)
+
+        # Assert
+        self.assertEqual(len(graph.vertices), 5)
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import MagicMock
 
 from app.core.entities import Project
 from app.infrastructure.storages import PickleProjectStorage
@@ -7,7 +7,8 @@ from app.infrastructure.storages import PickleProjectStorage
 
 class TestPickleStorageGetProjects(unittest.TestCase):
     def setUp(self):
-        self.filemanager_mock = Mock()
+        self.filemanager_mock = MagicMock()
+        self.filemanager_mock.get_manifest_signature.return_value = None
 
     def test_with_no_project_files(self):
         # Arrange
@@ -43,7 +44,8 @@ class TestPickleStorageGetProjects(unittest.TestCase):
 
 class TestPickleStorageGetProject(unittest.TestCase):
     def setUp(self):
-        self.filemanager_mock = Mock()
+        self.filemanager_mock = MagicMock()
+        self.filemanager_mock.get_manifest_signature.return_value = None
 
     def test_with_non_existing_project_id(self):
         # Arrange
@@ -69,3 +71,62 @@ class TestPickleStorageGetProject(unittest.TestCase):
         self.assertIsInstance(project, Project)
         self.assertEqual(project.id, 'f573eb01-ba2e-4eb4-8530-5412d827b429')
         self.assertEqual(project.name, 'Project-1')
+
+
+class TestPickleStorageManifest(unittest.TestCase):
+    def setUp(self):
+        self.filemanager_mock = MagicMock()
+        self.filemanager_mock.get_manifest_signature.return_value = (1, 100)
+        self.filemanager_mock.read_manifest.return_value = {
+            'version': 1,
+            'projects': [
+                {
+                    'id': 'f573eb01-ba2e-4eb4-8530-5412d827b429',
+                    'name': 'Project-1',
+                    'file': 'Project-1_f573eb01-ba2e-4eb4-8530-5412d827b429.pickle'
+                }
+            ]
+        }
+        self.filemanager_mock.write_manifest.return_value = (2, 200)
+
+    def test_with_existing_manifest(self):
+        # Arrange
+        storage = PickleProjectStorage(self.filemanager_mock)
+
+        # Act
+        storage.get_project('f573eb01-ba2e-4eb4-8530-5412d827b429')
+        project = storage.get_project('f573eb01-ba2e-4eb4-8530-5412d827b429')
+
+        # Assert
+        self.assertEqual(project.name, 'Project-1')
+        self.assertEqual(self.filemanager_mock.read_manifest.call_count, 1)
+        self.assertEqual(self.filemanager_mock.get_project_files.call_count, 0)
+
+    def test_with_missing_manifest(self):
+        # Arrange
+        self.filemanager_mock.get_manifest_signature.return_value = None
+        self.filemanager_mock.get_project_files.return_value = ['Project-2_e657629e-41de-408c-972a-600dac615dbc.pickle']
+        storage = PickleProjectStorage(self.filemanager_mock)
+
+        # Act
+        projects = storage.get_projects()
+
+        # Assert
+        self.assertEqual(len(projects), 1)
+        self.assertEqual(projects[0].id, 'e657629e-41de-408c-972a-600dac615dbc')
+        self.assertEqual(self.filemanager_mock.write_manifest.call_count, 1)
+
+    def test_with_create_and_delete_project(self):
+        # Arrange
+        self.filemanager_mock.generate_project_file_name.return_value = 'Project-2_2.pickle'
+        storage = PickleProjectStorage(self.filemanager_mock)
+
+        # Act
+        storage.create_project(Project('2', 'Project-2'))
+        self.filemanager_mock.get_manifest_signature.return_value = (2, 200)
+        storage.delete_project('f573eb01-ba2e-4eb4-8530-5412d827b429')
+        projects = storage.get_projects()
+
+        # Assert
+        self.assertEqual([project.id for project in projects], ['2'])
+        self.assertEqual(self.filemanager_mock.write_manifest.call_count, 2)
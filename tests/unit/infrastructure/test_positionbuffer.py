@@ -0,0 +1,83 @@
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from app.core.entities import Project, Vertex
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.caches import PositionBuffer
+from app.infrastructure.storages import PickleProjectStorage
+
+
+class TestPositionBuffer(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.storage = PickleProjectStorage(ProjectFolderAdapter(project_folder=self.folder))
+        self.project = self.storage.create_project(Project(str(uuid.uuid4()), 'Project-1'))
+
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        self.vertex = Vertex(str(uuid.uuid4()), 'Person', 0, 0, [])
+        graph.add_vertex(self.vertex)
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def load_position(self) -> tuple:
+        vertex = self.storage.load_graph(self.project.id).find_vertex_by_id(self.vertex.id)
+
+        return vertex.position_x, vertex.position_y
+
+    def test_with_coalesced_updates(self):
+        # Arrange
+        buffer = PositionBuffer(flush_interval=60)
+        buffer.start()
+
+        # Act
+        for idx in range(1, 11):
+            buffer.update(self.project.id, self.storage, {self.vertex.id: (idx, idx * 2)})
+        pending_position = self.load_position()
+        buffer.stop()
+
+        # Assert
+        self.assertEqual(pending_position, (0, 0))
+        self.assertEqual(self.load_position(), (10, 20))
+        self.assertEqual(self.storage.get_graph_version(self.project.id), 2)
+        self.assertEqual(buffer.stats()['updates'], 10)
+        self.assertEqual(buffer.stats()['flushes'], 1)
+
+    def test_without_running_thread(self):
+        # Arrange
+        buffer = PositionBuffer()
+
+        # Act
+        buffer.update(self.project.id, self.storage, {self.vertex.id: (5, 6)})
+
+        # Assert
+        self.assertEqual(self.load_position(), (5, 6))
+        self.assertEqual(buffer.stats()['pending_projects'], 0)
+
+    def test_with_unknown_vertex(self):
+        # Arrange
+        buffer = PositionBuffer()
+
+        # Act
+        buffer.update(self.project.id, self.storage, {str(uuid.uuid4()): (5, 6)})
+
+        # Assert
+        self.assertEqual(self.storage.get_graph_version(self.project.id), 1)
+        self.assertEqual(buffer.stats()['flush_errors'], 0)
+
+    def test_with_discarded_position(self):
+        # Arrange
+        buffer = PositionBuffer(flush_interval=60)
+        buffer.start()
+        buffer.update(self.project.id, self.storage, {self.vertex.id: (5, 6)})
+
+        # Act
+        buffer.discard(self.project.id, self.vertex.id)
+        buffer.stop()
+
+        # Assert
+        self.assertEqual(self.load_position(), (0, 0))
+        self.assertEqual(self.storage.get_graph_version(self.project.id), 1)
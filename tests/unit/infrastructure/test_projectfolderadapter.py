@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from app.core.entities import Graph
+from app.infrastructure.adapters import GroupCommitter, ProjectFolderAdapter
+
+
+class TestProjectFolderAdapterAtomicWrites(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.adapter = ProjectFolderAdapter(project_folder=self.folder)
+        self.path = os.path.join(self.folder, 'Project-1.pickle')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_with_failing_replace(self):
+        # Arrange
+        self.adapter.write_graph(self.path, Graph())
+        with open(self.path, 'rb') as file:
+            content = file.read()
+
+        # Act
+        with patch('app.infrastructure.adapters.projectfolderadapter.os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.adapter.write_graph(self.path, Graph())
+
+        # Assert
+        with open(self.path, 'rb') as file:
+            self.assertEqual(file.read(), content)
+        self.assertEqual(os.listdir(self.folder), ['Project-1.pickle'])
+
+    def test_with_invalid_file_sync(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            ProjectFolderAdapter(project_folder=self.folder, file_sync='sometimes')
+
+    def test_with_group_file_sync(self):
+        # Arrange
+        group_committer = GroupCommitter(window=0.001)
+        adapter = ProjectFolderAdapter(project_folder=self.folder, file_sync='group', group_committer=group_committer)
+
+        # Act
+        adapter.write_graph(self.path, Graph())
+        adapter.append_journal(os.path.join(self.folder, 'Project-1.journal'), [{'op': 'put_vertex'}])
+
+        # Assert
+        self.assertEqual(group_committer.flushes, 3)
+        self.assertEqual(group_committer.synced_files, 2)
+        self.assertEqual(group_committer.synced_folders, 2)
+        self.assertEqual(sorted(os.listdir(self.folder)), ['Project-1.journal', 'Project-1.pickle'])
+
+    def test_with_group_file_sync_before_replace(self):
+        # Arrange
+        group_committer = GroupCommitter(window=0.001)
+        adapter = ProjectFolderAdapter(project_folder=self.folder, file_sync='group', group_committer=group_committer)
+        synced = []
+        group_committer.sync = lambda files=(), folders=(): synced.append((list(files), list(folders)))
+
+        # Act
+        with patch('app.infrastructure.adapters.projectfolderadapter.os.replace',
+                   side_effect=lambda *args: synced.append('replace') or os.rename(*args)):
+            adapter.write_graph(self.path, Graph())
+
+        # Assert
+        self.assertEqual(len(synced), 3)
+        self.assertTrue(synced[0][0][0].endswith('.tmp'))
+        self.assertEqual(synced[1:], ['replace', ([], [self.folder])])
+
+
+class TestProjectFolderAdapterJournal(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.adapter = ProjectFolderAdapter(project_folder=self.folder, file_sync='never')
+        self.path = os.path.join(self.folder, 'Project-1.journal')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_read_last_journal_record(self):
+        # Arrange
+        for version in range(1, 51):
+            self.adapter.append_journal(self.path, [{'op': 'put_vertex', 'id': str(version)},
+                                                    {'op': 'version', 'version': version}])
+        self.adapter.append_journal(self.path, [{'op': 'put_vertex', 'id': '51'}])
+
+        # Act
+        record = self.adapter.read_last_journal_record(self.path, 'version', block_size=16)
+
+        # Assert
+        self.assertEqual(record, {'op': 'version', 'version': 50})
+
+    def test_read_last_journal_record_with_torn_record(self):
+        # Arrange
+        self.adapter.append_journal(self.path, [{'op': 'version', 'version': 1}])
+        with open(self.path, 'ab') as file:
+            file.write(b'{"op": "version", "vers')
+
+        # Act
+        record = self.adapter.read_last_journal_record(self.path, 'version')
+
+        # Assert
+        self.assertEqual(record, {'op': 'version', 'version': 1})
+
+    def test_read_last_journal_record_without_journal(self):
+        # Act
+        record = self.adapter.read_last_journal_record(self.path, 'version')
+
+        # Assert
+        self.assertIsNone(record)
+
+
+class TestGroupCommitter(unittest.TestCase):
+    def run_concurrently(self, group_committer: GroupCommitter, paths: list) -> list:
+        barrier = threading.Barrier(len(paths))
+        errors = []
+
+        def sync(path: str):
+            barrier.wait()
+            try:
+                group_committer.sync(files=[path], folders=[os.path.dirname(path)])
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=sync, args=(path,)) for path in paths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return errors
+
+    @patch('app.infrastructure.adapters.groupcommitter.fsync_folder')
+    @patch('app.infrastructure.adapters.groupcommitter.fsync_file')
+    def test_with_concurrent_writers(self, fsync_file_mock, fsync_folder_mock):
+        # Arrange
+        group_committer = GroupCommitter(window=0.2)
+
+        # Act
+        errors = self.run_concurrently(group_committer, ['/projects/a.pickle'] * 6 + ['/projects/b.pickle'] * 2)
+
+        # Assert
+        self.assertEqual(errors, [])
+        self.assertEqual(group_committer.flushes, 1)
+        self.assertEqual(sorted(call.args[0] for call in fsync_file_mock.call_args_list),
+                         ['/projects/a.pickle', '/projects/b.pickle'])
+        fsync_folder_mock.assert_called_once_with('/projects')
+
+    @patch('app.infrastructure.adapters.groupcommitter.fsync_folder')
+    @patch('app.infrastructure.adapters.groupcommitter.fsync_file', side_effect=OSError('I/O error'))
+    def test_with_failing_sync(self, fsync_file_mock, fsync_folder_mock):
+        # Arrange
+        group_committer = GroupCommitter(window=0.2)
+
+        # Act
+        errors = self.run_concurrently(group_committer, ['/projects/a.pickle'] * 4)
+
+        # Assert
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(group_committer.flushes, 1)
@@ -0,0 +1,121 @@
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import unittest
+import uuid
+
+from app.core.entities import Project, Vertex
+from app.core.exceptions import VersionConflictException
+from app.core.repositories import VertexRepository
+from app.infrastructure.adapters import GroupCommitter, ProjectFolderAdapter
+from app.infrastructure.adapters.projectfolderadapter import fcntl
+from app.infrastructure.storages import JournalProjectStorage, PickleProjectStorage
+
+WORKERS = 4
+VERTICES_PER_WORKER = 20
+
+
+def create_storage(folder: str, storage_type: str, file_sync: str = 'never', group_committer=None):
+    adapter = ProjectFolderAdapter(project_folder=folder, file_sync=file_sync, group_committer=group_committer)
+    if storage_type == 'journal':
+        return JournalProjectStorage(adapter, max_journal_entries=7)
+
+    return PickleProjectStorage(adapter)
+
+
+def create_vertices(folder: str, storage_type: str, project_id: str, worker: int):
+    create_worker_vertices(VertexRepository(create_storage(folder, storage_type)), project_id, worker)
+
+
+def create_worker_vertices(repository: VertexRepository, project_id: str, worker: int):
+    for idx in range(VERTICES_PER_WORKER):
+        # Hint: Like an API client, a worker retries mutations which kept losing against the other workers
+        while True:
+            try:
+                repository.create_vertex(project_id, Vertex(str(uuid.uuid4()), f'Worker{worker}_{idx}', 0, 0, []))
+                break
+            except VersionConflictException:
+                continue
+
+
+@unittest.skipIf(fcntl is None, 'fcntl is required for locking across processes')
+class TestProjectLockingAcrossProcesses(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def run_workers(self, storage_type: str):
+        # Arrange
+        storage = create_storage(self.folder, storage_type)
+        project = storage.create_project(Project(str(uuid.uuid4()), 'Project-1'))
+
+        # Act
+        processes = [
+            multiprocessing.Process(target=create_vertices, args=(self.folder, storage_type, project.id, worker))
+            for worker in range(WORKERS)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        # Assert
+        self.assertEqual([process.exitcode for process in processes], [0] * WORKERS)
+        graph = create_storage(self.folder, storage_type).load_graph(project.id)
+        self.assertEqual(len(graph.vertices), WORKERS * VERTICES_PER_WORKER)
+        self.assertEqual(
+            sorted(vertex.name for vertex in graph.vertices),
+            sorted(f'Worker{worker}_{idx}' for worker in range(WORKERS) for idx in range(VERTICES_PER_WORKER))
+        )
+        self.assertEqual(graph.version, WORKERS * VERTICES_PER_WORKER)
+
+    def test_with_pickle_storage(self):
+        self.run_workers('pickle')
+
+    def test_with_journal_storage(self):
+        self.run_workers('journal')
+
+
+class TestGroupCommitOfConcurrentSaves(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def run_workers(self, storage_type: str) -> int:
+        group_committer = GroupCommitter(window=0.01)
+        storage = create_storage(self.folder, storage_type, 'group', group_committer)
+        project = storage.create_project(Project(str(uuid.uuid4()), 'Project-1'))
+        repository = VertexRepository(storage)
+        flushes = group_committer.flushes
+        threads = [
+            threading.Thread(target=create_worker_vertices, args=(repository, project.id, worker))
+            for worker in range(WORKERS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(storage.load_graph(project.id).vertices), WORKERS * VERTICES_PER_WORKER)
+
+        return group_committer.flushes - flushes
+
+    def test_with_pickle_storage(self):
+        # Act
+        flushes = self.run_workers('pickle')
+
+        # Assert
+        # Hint: Every snapshot is based on the previous one, so its file is synced while the next save gets prepared
+        self.assertLess(flushes, 2 * WORKERS * VERTICES_PER_WORKER)
+
+    def test_with_journal_storage(self):
+        # Act
+        flushes = self.run_workers('journal')
+
+        # Assert
+        self.assertLess(flushes, WORKERS * VERTICES_PER_WORKER)
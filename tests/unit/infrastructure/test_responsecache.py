@@ -0,0 +1,82 @@
+import gzip
+import unittest
+
+from app.infrastructure.caches import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_with_same_version(self):
+        # Arrange
+        cache = ResponseCache()
+        cache.put('1', 3, b'{"vertices":[]}')
+
+        # Act
+        entry = cache.get('1', 3)
+
+        # Assert
+        self.assertEqual(entry.body, b'{"vertices":[]}')
+        self.assertEqual(gzip.decompress(entry.gzip_body), b'{"vertices":[]}')
+        self.assertEqual(cache.hits, 1)
+
+    def test_with_other_version(self):
+        # Arrange
+        cache = ResponseCache()
+        cache.put('1', 3, b'{}')
+
+        # Act
+        entry = cache.get('1', 4)
+
+        # Assert
+        self.assertIsNone(entry)
+        self.assertEqual(cache.misses, 1)
+
+    def test_with_older_version_put_later(self):
+        # Arrange
+        cache = ResponseCache()
+        cache.put('1', 4, b'{"new":1}')
+
+        # Act
+        entry = cache.put('1', 3, b'{"old":1}')
+
+        # Assert
+        self.assertEqual(entry.body, b'{"old":1}')
+        self.assertEqual(cache.get('1', 4).body, b'{"new":1}')
+
+    def test_without_compression(self):
+        # Arrange
+        cache = ResponseCache(compress=False)
+
+        # Act
+        entry = cache.put('1', 1, b'{}')
+
+        # Assert
+        self.assertIsNone(entry.gzip_body)
+        self.assertEqual(cache.size_bytes, 2)
+
+    def test_with_exceeded_budget(self):
+        # Arrange
+        cache = ResponseCache(max_entries=2, compress=False)
+
+        # Act
+        cache.put('1', 1, b'{}')
+        cache.put('2', 1, b'{}')
+        cache.get('1', 1)
+        cache.put('3', 1, b'{}')
+
+        # Assert
+        self.assertIsNotNone(cache.get('1', 1))
+        self.assertIsNone(cache.get('2', 1))
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.size_bytes, 4)
+
+    def test_invalidate(self):
+        # Arrange
+        cache = ResponseCache()
+        cache.put('1', 1, b'{}')
+
+        # Act
+        cache.invalidate('1')
+
+        # Assert
+        self.assertIsNone(cache.get('1', 1))
+        self.assertEqual(cache.size_bytes, 0)
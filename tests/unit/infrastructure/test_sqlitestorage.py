@@ -0,0 +1,159 @@
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from app.core.entities import Project, Vertex, Edge, Property, Graph
+from app.core.entities.property import Datatype
+from app.core.exceptions import VersionConflictException, VertexNotFoundException
+from app.infrastructure.adapters import ProjectFolderAdapter, SQLiteAdapter
+from app.infrastructure.migrations import migrate_pickle_projects
+from app.infrastructure.storages import SQLiteProjectStorage, PickleProjectStorage
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.adapter = SQLiteAdapter(database=os.path.join(self.folder, 'projects.sqlite3'))
+        self.storage = SQLiteProjectStorage(self.adapter)
+
+        self.project = Project(str(uuid.uuid4()), 'Project-1')
+        self.storage.create_project(self.project)
+
+        # Build Graph
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        self.person_vertex = Vertex(str(uuid.uuid4()), 'Person', 0, 0, [Property('name', True, Datatype.STRING)])
+        self.hobby_vertex = Vertex(str(uuid.uuid4()), 'Hobby', 10, 10, [])
+        self.performs_edge = Edge(str(uuid.uuid4()), 'performs', [Property('since', False, Datatype.INT)], True)
+        graph.add_vertex(self.person_vertex)
+        graph.add_vertex(self.hobby_vertex)
+        graph.add_edge(self.performs_edge, self.person_vertex.id, self.hobby_vertex.id)
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+    def tearDown(self):
+        self.adapter.close()
+        shutil.rmtree(self.folder)
+
+    def test_get_projects(self):
+        # Act
+        projects = self.storage.get_projects()
+
+        # Assert
+        self.assertEqual([(project.id, project.name) for project in projects], [(self.project.id, 'Project-1')])
+
+    def test_load_graph(self):
+        # Act
+        graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertEqual([vertex.name for vertex in graph.vertices], ['Person', 'Hobby'])
+        self.assertEqual(graph.vertices[0].properties[0].key, 'name')
+        self.assertEqual(len(graph.edges), 1)
+        self.assertIs(graph.edges[0].source_vertex, graph.vertices[0])
+        self.assertIs(graph.edges[0].target_vertex, graph.vertices[1])
+        self.assertIs(graph.edges[0].properties[0].datatype, Datatype.INT)
+        self.assertTrue(graph.edges[0].multi_edge)
+
+    def test_load_vertex(self):
+        # Act
+        vertex = self.storage.load_vertex(self.project.id, self.hobby_vertex.id)
+
+        # Assert
+        self.assertEqual(vertex.name, 'Hobby')
+        self.assertEqual(len(vertex.out_edges), 0)
+        self.assertEqual(len(vertex.in_edges), 1)
+        self.assertEqual(vertex.in_edges[0].source_vertex.id, self.person_vertex.id)
+
+    def test_load_vertex_with_invalid_id(self):
+        # Act
+        with self.assertRaises(VertexNotFoundException) as context:
+            self.storage.load_vertex(self.project.id, 'invalid-id')
+
+        # Assert
+        self.assertEqual(context.exception.message, "Vertex with Id 'invalid-id' not found")
+
+    def test_load_edge(self):
+        # Act
+        edge = self.storage.load_edge(self.project.id, self.performs_edge.id)
+
+        # Assert
+        self.assertEqual(edge.name, 'performs')
+        self.assertEqual(edge.source_vertex.name, 'Person')
+        self.assertEqual(edge.target_vertex.name, 'Hobby')
+
+    def test_update_and_delete_vertex(self):
+        # Arrange
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        graph.update_vertex(self.person_vertex.id, Vertex('', 'Human', 5, 5, []))
+        graph.delete_vertex(self.hobby_vertex.id)
+        signature = self.storage.get_graph_signature(self.project.id)
+
+        # Act
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+        loaded_graph = self.storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertNotEqual(self.storage.get_graph_signature(self.project.id), signature)
+        self.assertEqual([vertex.name for vertex in loaded_graph.vertices], ['Human'])
+        self.assertEqual(loaded_graph.vertices[0].properties, [])
+        self.assertEqual(len(loaded_graph.edges), 0)
+
+    def test_delete_project(self):
+        # Act
+        self.storage.delete_project(self.project.id)
+
+        # Assert
+        self.assertEqual(self.storage.get_projects(), [])
+        with self.assertRaises(ValueError):
+            self.storage.load_graph(self.project.id)
+
+    def test_save_graph_with_outdated_version(self):
+        # Arrange
+        first_graph = self.storage.load_graph(self.project.id, for_update=True)
+        second_graph = self.storage.load_graph(self.project.id, for_update=True)
+        first_graph.delete_edge(self.performs_edge.id)
+        second_graph.delete_vertex(self.hobby_vertex.id)
+        self.storage.save_graph(self.project.id, first_graph, first_graph.pop_changes())
+
+        # Act
+        with self.assertRaises(VersionConflictException) as context:
+            self.storage.save_graph(self.project.id, second_graph, second_graph.pop_changes())
+
+        # Assert
+        self.assertEqual(context.exception.current_version, 2)
+        self.assertEqual(first_graph.version, 2)
+        self.assertEqual(len(self.storage.load_graph(self.project.id).vertices), 2)
+
+
+class TestPickleToSQLiteMigration(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.folder_adapter = ProjectFolderAdapter(project_folder=self.folder)
+        self.sqlite_adapter = SQLiteAdapter(database=os.path.join(self.folder, 'projects.sqlite3'))
+
+    def tearDown(self):
+        self.sqlite_adapter.close()
+        shutil.rmtree(self.folder)
+
+    def test_migration(self):
+        # Arrange
+        pickle_storage = PickleProjectStorage(self.folder_adapter)
+        project = pickle_storage.create_project(Project(str(uuid.uuid4()), 'Project-1'))
+        graph = Graph()
+        vertex = Vertex(str(uuid.uuid4()), 'Person', 0, 0, [])
+        graph.add_vertex(vertex)
+        graph.add_edge(Edge(str(uuid.uuid4()), 'knows', [], False), vertex.id, vertex.id)
+        pickle_storage.save_graph(project.id, graph)
+        sqlite_storage = SQLiteProjectStorage(self.sqlite_adapter)
+
+        # Act
+        migrate_pickle_projects(self.folder_adapter, sqlite_storage)
+        migrate_pickle_projects(self.folder_adapter, sqlite_storage)
+
+        # Assert
+        migrated_graph = sqlite_storage.load_graph(project.id)
+        self.assertEqual(len(sqlite_storage.get_projects()), 1)
+        self.assertEqual([vertex.name for vertex in migrated_graph.vertices], ['Person'])
+        self.assertEqual(len(migrated_graph.edges), 1)
+        self.assertTrue(migrated_graph.edges[0].is_recursive())
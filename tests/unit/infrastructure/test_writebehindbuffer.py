@@ -0,0 +1,199 @@
+import shutil
+import tempfile
+import unittest
+import uuid
+from unittest.mock import Mock
+
+from app.core.entities import Graph, Project, Property, Vertex
+from app.core.entities.property import Datatype
+from app.core.exceptions import GraphHistoryUnavailableException, VersionConflictException
+from app.infrastructure.adapters import ProjectFolderAdapter
+from app.infrastructure.caches import WriteBehindBuffer
+from app.infrastructure.storages import JournalProjectStorage, WriteBehindProjectStorage
+
+
+class TestWriteBehindBuffer(unittest.TestCase):
+    def setUp(self):
+        self.storage_mock = Mock()
+        self.storage_mock.get_graph_version.return_value = 0
+
+    def save_vertex(self, buffer: WriteBehindBuffer, graph: Graph, name: str) -> Graph:
+        graph = graph.copy()
+        graph.add_vertex(Vertex(str(uuid.uuid4()), name, 0, 0, []))
+        buffer.save('1', self.storage_mock, graph, graph.pop_changes())
+
+        return graph
+
+    def test_with_buffered_saves(self):
+        # Arrange
+        buffer = WriteBehindBuffer()
+
+        # Act
+        graph = self.save_vertex(buffer, Graph(), 'Person')
+        graph = self.save_vertex(buffer, graph, 'Hobby')
+
+        # Assert
+        self.assertIs(buffer.get('1'), graph)
+        self.assertEqual(graph.version, 2)
+        self.assertEqual(self.storage_mock.save_graph.call_count, 0)
+        self.assertEqual(buffer.stats()['dirty_graphs'], 1)
+        self.assertEqual(buffer.stats()['unflushed_saves'], 2)
+
+    def test_with_flush(self):
+        # Arrange
+        buffer = WriteBehindBuffer()
+        graph = self.save_vertex(buffer, Graph(), 'Person')
+        graph = self.save_vertex(buffer, graph, 'Hobby')
+
+        # Act
+        buffer.flush()
+
+        # Assert
+        self.storage_mock.save_graph.assert_called_once()
+        project_id, flushed_graph, changes, base_version = self.storage_mock.save_graph.call_args.args
+        self.assertIs(flushed_graph, graph)
+        self.assertEqual(len(changes), 2)
+        self.assertEqual(base_version, 0)
+        self.assertIsNone(buffer.get('1'))
+        self.assertEqual(buffer.stats()['flushes'], 1)
+
+    def test_with_outdated_version(self):
+        # Arrange
+        buffer = WriteBehindBuffer()
+        self.save_vertex(buffer, Graph(), 'Person')
+
+        # Act & Assert
+        with self.assertRaises(VersionConflictException) as context:
+            self.save_vertex(buffer, Graph(), 'Hobby')
+        self.assertEqual(context.exception.current_version, 1)
+
+    def test_with_max_unflushed_of_zero(self):
+        # Arrange
+        buffer = WriteBehindBuffer(max_unflushed=0)
+
+        # Act
+        self.save_vertex(buffer, Graph(), 'Person')
+
+        # Assert
+        self.assertEqual(self.storage_mock.save_graph.call_count, 1)
+        self.assertIsNone(buffer.get('1'))
+
+    def test_with_max_dirty(self):
+        # Arrange
+        buffer = WriteBehindBuffer(max_dirty=1)
+        buffer.save('1', self.storage_mock, Graph())
+
+        # Act
+        buffer.save('2', self.storage_mock, Graph())
+
+        # Assert
+        self.assertEqual(self.storage_mock.save_graph.call_count, 2)
+        self.assertEqual(buffer.stats()['dirty_graphs'], 0)
+
+    def test_with_failed_flush(self):
+        # Arrange
+        buffer = WriteBehindBuffer()
+        graph = self.save_vertex(buffer, Graph(), 'Person')
+        self.storage_mock.save_graph.side_effect = OSError('Disk full')
+
+        # Act
+        buffer.flush()
+        self.storage_mock.save_graph.side_effect = None
+        buffer.flush()
+
+        # Assert
+        self.assertEqual(self.storage_mock.save_graph.call_count, 2)
+        self.assertEqual(len(self.storage_mock.save_graph.call_args.args[2]), 1)
+        self.assertEqual(self.storage_mock.save_graph.call_args.args[3], 0)
+        self.assertIsNone(buffer.get('1'))
+        self.assertEqual(buffer.stats()['flush_errors'], 1)
+        self.assertEqual(graph.version, 1)
+
+    def test_with_stop(self):
+        # Arrange
+        buffer = WriteBehindBuffer(flush_interval=60)
+        buffer.start()
+        self.save_vertex(buffer, Graph(), 'Person')
+
+        # Act
+        buffer.stop()
+
+        # Assert
+        self.assertEqual(self.storage_mock.save_graph.call_count, 1)
+        self.assertIsNone(buffer.get('1'))
+
+
+class TestWriteBehindProjectStorage(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.journal_storage = JournalProjectStorage(ProjectFolderAdapter(project_folder=self.folder))
+        self.buffer = WriteBehindBuffer()
+        self.storage = WriteBehindProjectStorage(self.journal_storage, self.buffer)
+
+        self.project = Project(str(uuid.uuid4()), 'Project-1')
+        self.storage.create_project(self.project)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def create_vertex(self, name: str) -> Vertex:
+        graph = self.storage.load_graph(self.project.id, for_update=True)
+        vertex = Vertex(str(uuid.uuid4()), name, 0, 0, [Property('name', True, Datatype.STRING)])
+        graph.add_vertex(vertex)
+        self.storage.save_graph(self.project.id, graph, graph.pop_changes())
+
+        return vertex
+
+    def test_with_unflushed_saves(self):
+        # Arrange
+        vertex = self.create_vertex('Person')
+        self.create_vertex('Hobby')
+
+        # Act
+        graph = self.storage.load_graph(self.project.id)
+        graph_for_update = self.storage.load_graph(self.project.id, for_update=True)
+
+        # Assert
+        self.assertEqual(self.storage.get_graph_version(self.project.id), 2)
+        self.assertEqual(self.journal_storage.get_graph_version(self.project.id), 0)
+        self.assertEqual(self.storage.load_vertex(self.project.id, vertex.id).name, 'Person')
+        self.assertIsNot(graph, graph_for_update)
+        self.assertEqual(graph_for_update.version, 2)
+
+    def test_with_flushed_saves(self):
+        # Arrange
+        self.create_vertex('Person')
+        self.create_vertex('Hobby')
+
+        # Act
+        self.buffer.flush()
+        graph = self.journal_storage.load_graph(self.project.id)
+
+        # Assert
+        self.assertEqual(graph.version, 2)
+        self.assertEqual([vertex.name for vertex in graph.vertices], ['Person', 'Hobby'])
+        self.assertEqual(self.storage.get_graph_version(self.project.id), 2)
+
+    def test_with_coalesced_version(self):
+        # Arrange
+        self.create_vertex('Person')
+        self.create_vertex('Hobby')
+
+        # Act
+        graph = self.storage.load_graph_at_version(self.project.id, 2)
+
+        # Assert
+        self.assertEqual(graph.version, 2)
+        with self.assertRaises(GraphHistoryUnavailableException):
+            self.storage.load_graph_at_version(self.project.id, 1)
+
+    def test_with_deleted_project(self):
+        # Arrange
+        self.create_vertex('Person')
+
+        # Act
+        self.storage.delete_project(self.project.id)
+
+        # Assert
+        self.assertIsNone(self.buffer.get(self.project.id))
+        self.assertEqual(self.storage.get_projects(), [])
@@ -0,0 +1,44 @@
+import json
+import unittest
+import uuid
+
+from app.core.entities import Edge, Graph, Property, Vertex
+from app.mappers import GraphMapper
+
+
+class TestGraphMapperToNdjson(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        for idx in range(5):
+            properties = [Property('name', True, 'String')]
+            self.graph.add_vertex(Vertex(str(uuid.uuid4()), f'Vertex{idx}', idx, idx, properties))
+        vertices = list(self.graph.vertices)
+        for idx in range(4):
+            edge = Edge(str(uuid.uuid4()), f'edge{idx}', [], False)
+            self.graph.add_edge(edge, vertices[idx].id, vertices[idx + 1].id)
+
+    def test_with_chunks(self):
+        # Arrange
+        chunk_size = GraphMapper.NDJSON_CHUNK_SIZE
+        GraphMapper.NDJSON_CHUNK_SIZE = 4
+
+        # Act
+        try:
+            chunks = list(GraphMapper.to_ndjson(self.graph))
+        finally:
+            GraphMapper.NDJSON_CHUNK_SIZE = chunk_size
+
+        # Assert
+        self.assertEqual(len(chunks), 3)
+        lines = [json.loads(line) for line in b''.join(chunks).splitlines()]
+        self.assertEqual([line.get('type') for line in lines], ['vertex'] * 5 + ['edge'] * 4)
+        self.assertEqual([line.get('id') for line in lines[:5]], [vertex.id for vertex in self.graph.vertices])
+        self.assertEqual(lines[0].get('properties'), [{'key': 'name', 'required': True, 'datatype': 'String'}])
+        self.assertEqual(lines[5].get('source_vertex_id'), lines[0].get('id'))
+
+    def test_with_empty_graph(self):
+        # Act
+        chunks = list(GraphMapper.to_ndjson(Graph()))
+
+        # Assert
+        self.assertEqual(chunks, [])